@@ -2,6 +2,8 @@
 Configuration constants for SheepIt Project Submitter addon.
 """
 
+import os
+
 # Addon metadata
 ADDON_NAME = "SheepIt Project Submitter"
 ADDON_ID = "sheepit_project_submitter"
@@ -10,8 +12,8 @@ ADDON_ID = "sheepit_project_submitter"
 SHEEPIT_API_BASE = "https://www.sheepit-renderfarm.com"
 SHEEPIT_CLIENT_BASE = "https://client.sheepit-renderfarm.com"
 
-# Debug mode
-DEBUG = False
+# Debug mode (also enabled by setting the SHEEPIT_DEBUG environment variable)
+DEBUG = bool(os.environ.get("SHEEPIT_DEBUG"))
 
 
 def debug_print(message: str) -> None:
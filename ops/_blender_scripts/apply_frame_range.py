@@ -0,0 +1,31 @@
+"""
+Blender-side script: set the frame range on every scene of the open blend and save it.
+
+Not imported by the addon. Run inside a Blender subprocess by
+submit_ops.apply_frame_range_to_blend via:
+
+    blender --factory-startup -b <blend> --python apply_frame_range.py -- <start> <end> <step>
+"""
+
+import argparse
+import sys
+
+import bpy
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="apply_frame_range")
+    parser.add_argument("frame_start", type=int)
+    parser.add_argument("frame_end", type=int)
+    parser.add_argument("frame_step", type=int)
+    return parser.parse_args(argv)
+
+
+args = _parse_args()
+for scene in bpy.data.scenes:
+    scene.frame_start = args.frame_start
+    scene.frame_end = args.frame_end
+    scene.frame_step = args.frame_step
+bpy.ops.wm.save_mainfile(compress=True)
+print(f'Applied frame range {args.frame_start}-{args.frame_end} (step {args.frame_step}) to all scenes')
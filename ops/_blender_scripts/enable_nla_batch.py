@@ -0,0 +1,92 @@
+"""
+Blender-side script: enable and unmute NLA tracks/strips in one or more blends, saving each.
+
+Not imported by the addon. Run inside a Blender subprocess by
+pack_ops.IncrementalPacker (ENABLE_NLA) via:
+
+    blender --factory-startup -b <first blend> --python enable_nla_batch.py -- [--autopack] [--blends-stdin]
+
+With --blends-stdin, a JSON list of blend paths is read from stdin (no command
+line length limits). Each listed blend is opened in turn (the one Blender
+started with is not reopened), fixed and saved, and an NLA_DONE:<path> line is
+printed. With no blends listed, the blend Blender started with is processed.
+
+remap_libs.py loads this file as a module for enable_nla() (--enable-nla) and
+enable_autopack(), as pack_linked.py does for enable_autopack(); the batch loop
+only runs when this is the main script.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import bpy
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="enable_nla_batch")
+    parser.add_argument("--autopack", action="store_true")
+    parser.add_argument("--blends-stdin", action="store_true")
+    return parser.parse_args(argv)
+
+
+def enable_nla():
+    for obj in bpy.data.objects:
+        ad = getattr(obj, 'animation_data', None)
+        if not ad:
+            continue
+        if hasattr(ad, 'use_nla') and not getattr(ad, 'use_nla', True):
+            try:
+                ad.use_nla = True
+            except Exception:
+                pass
+        tracks = getattr(ad, 'nla_tracks', None)
+        if not tracks:
+            continue
+        for tr in tracks:
+            try:
+                if hasattr(tr, 'lock') and tr.lock:
+                    tr.lock = False
+                tr.mute = False
+                if hasattr(tr, 'is_solo') and tr.is_solo:
+                    tr.is_solo = False
+                for st in getattr(tr, 'strips', []):
+                    try:
+                        if hasattr(st, 'mute') and st.mute:
+                            st.mute = False
+                        if hasattr(st, 'use_animated_influence') and hasattr(st, 'influence'):
+                            if (not getattr(st, 'use_animated_influence')) and float(getattr(st, 'influence', 1.0)) == 0.0:
+                                st.influence = 1.0
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+
+
+def enable_autopack():
+    # The preference name differs between Blender versions: set only the one that exists
+    fp = bpy.context.preferences.filepaths
+    autopack_attr = next((k for k in ('use_autopack', 'use_autopack_files', 'use_auto_pack') if hasattr(fp, k)), None)
+    if autopack_attr:
+        try:
+            setattr(fp, autopack_attr, True)
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    blends = json.load(sys.stdin) if args.blends_stdin else []
+    for blend in blends or [bpy.data.filepath]:
+        try:
+            if os.path.normcase(os.path.abspath(blend)) != os.path.normcase(os.path.abspath(bpy.data.filepath)):
+                bpy.ops.wm.open_mainfile(filepath=blend)
+            enable_nla()
+            if args.autopack:
+                enable_autopack()
+            bpy.ops.wm.save_mainfile(compress=True)
+        except Exception as e:
+            print(f'Enable NLA failed for {blend}: {e}')
+        print(f'NLA_DONE:{blend}', flush=True)
@@ -0,0 +1,88 @@
+"""
+Blender-side script: pack linked libraries into the open blend, then save with autopack on.
+
+Not imported by the addon. Run inside a Blender subprocess by
+pack_ops.pack_linked_in_blend via:
+
+    blender --factory-startup -b <blend> --python pack_linked.py -- --max-size-bytes <n>
+
+Libraries over --max-size-bytes cannot be packed by Blender. Results are
+reported on stdout as MISSING_FILE:, OVERSIZED_FILE: and PACK_ERROR: lines.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+import bpy
+
+GB = 1024 * 1024 * 1024
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="pack_linked")
+    parser.add_argument("--max-size-bytes", type=int, default=2 * GB)
+    return parser.parse_args(argv)
+
+
+def _load_enable_nla_batch():
+    # Shares enable_autopack() with the NLA and remap scripts; importing it does not run its batch loop
+    spec = importlib.util.spec_from_file_location(
+        "sheepit_enable_nla_batch", os.path.join(os.path.dirname(os.path.abspath(__file__)), "enable_nla_batch.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+args = _parse_args()
+print('=== Pack Linked Operation ===')
+print(f'Processing: {bpy.path.basename(bpy.data.filepath)}')
+print(f'Libraries found: {len(bpy.data.libraries)}')
+missing_files = []
+oversized_files = []
+for lib in bpy.data.libraries:
+    lib_path = bpy.path.abspath(lib.filepath)
+    # One stat per library: existence and size together
+    try:
+        file_size = os.stat(lib_path).st_size
+    except OSError:
+        missing_files.append(lib_path)
+        print(f'  Library (MISSING): {lib.name}, path: {lib.filepath}')
+        continue
+    if file_size > args.max_size_bytes:
+        oversized_files.append((lib_path, file_size))
+        print(f'  Library (OVER limit, cannot pack): {lib.name}, path: {lib.filepath}, size: {file_size / GB:.2f} GB')
+    else:
+        print(f'  Library (found, {file_size / GB:.2f} GB): {lib.name}, path: {lib.filepath}')
+if missing_files:
+    print(f'WARNING: {len(missing_files)} linked libraries not found and cannot be packed')
+if oversized_files:
+    print(f'WARNING: {len(oversized_files)} linked libraries are over size limit and cannot be packed by Blender')
+try:
+    bpy.ops.file.make_paths_relative()
+    print('Made paths relative')
+except Exception as e:
+    print(f'Warning: make_paths_relative failed: {e}')
+packed_count = 0
+pack_errors = []
+try:
+    print('Starting pack_libraries()...')
+    bpy.ops.file.pack_libraries()
+    packed_count = 1
+    print('pack_libraries() completed successfully')
+except Exception as e:
+    error_msg = f'{type(e).__name__}: {str(e)}'
+    pack_errors.append(error_msg)
+    print(f'Warning: pack_libraries() failed: {error_msg}')
+_load_enable_nla_batch().enable_autopack()
+print('Saving file...')
+bpy.ops.wm.save_mainfile(compress=True)
+print(f'=== Pack Linked Complete (packed: {packed_count}, missing: {len(missing_files)}, oversized: {len(oversized_files)}) ===')
+for mf in missing_files:
+    print(f'MISSING_FILE: {mf}')
+for of, size in oversized_files:
+    print(f'OVERSIZED_FILE: {size}:{of}')
+for err in pack_errors:
+    print(f'PACK_ERROR: {err}')
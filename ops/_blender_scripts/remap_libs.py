@@ -0,0 +1,278 @@
+"""
+Blender-side script: remap library, image and cache paths to the packed tree,
+optionally packing all external files into the blend in the same pass.
+
+Not imported by the addon. Run inside a Blender subprocess by
+pack_ops.remap_library_paths via:
+
+    blender --factory-startup -b <blend> --python remap_libs.py -- \
+        --copy-map-stdin --common-root <dir> --target-path <dir> [--ensure-autopack] [--pack-all] \
+        [--frame-range <start> <end> <step>] [--enable-nla]
+
+The copy_map (source abspath -> packed abspath) is read as JSON from stdin.
+--pack-all packs all external files into the blend before the final save, so the
+blend is loaded and written once for both steps. --frame-range sets the range on every
+scene before that save, as apply_frame_range.py does. --enable-nla first runs
+enable_nla() from enable_nla_batch.py on the open blend, so NLA needs no separate
+load/save either.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import bpy
+
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="remap_libs")
+    parser.add_argument("--copy-map-stdin", action="store_true")
+    parser.add_argument("--common-root", required=True)
+    parser.add_argument("--target-path", required=True)
+    parser.add_argument("--ensure-autopack", action="store_true")
+    parser.add_argument("--pack-all", action="store_true")
+    parser.add_argument("--frame-range", nargs=3, type=int, metavar=("START", "END", "STEP"))
+    parser.add_argument("--enable-nla", action="store_true")
+    return parser.parse_args(argv)
+
+
+def _load_enable_nla_batch():
+    # Shared with the standalone NLA pass; importing it does not run its batch loop
+    spec = importlib.util.spec_from_file_location(
+        "sheepit_enable_nla_batch", os.path.join(os.path.dirname(os.path.abspath(__file__)), "enable_nla_batch.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+args = _parse_args()
+enable_nla_batch = _load_enable_nla_batch()
+copy_map = json.load(sys.stdin) if args.copy_map_stdin else {}
+# Keys are resolved source paths; on Windows also match them case-insensitively
+copy_map_norm = {os.path.normcase(k): v for k, v in copy_map.items()}
+
+
+def lookup_copy_map(key):
+    new = copy_map.get(key)
+    if new is None:
+        new = copy_map_norm.get(os.path.normcase(key))
+    return Path(new) if new is not None else None
+
+common_root = Path(args.common_root)
+target_path = Path(args.target_path)
+blend_dir = Path(bpy.data.filepath).parent
+bpy.context.preferences.filepaths.use_relative_paths = True
+if args.enable_nla:
+    try:
+        enable_nla_batch.enable_nla()
+        print('Enabled NLA tracks')
+    except Exception as e:
+        print(f'Enable NLA failed: {e}')
+remapped = 0
+unresolved = []
+print(f'Remapping library paths in: {bpy.path.basename(bpy.data.filepath)}')
+print(f'Found {len(bpy.data.libraries)} libraries')
+for lib in bpy.data.libraries:
+    src = lib.filepath
+    print(f'  Processing library: {lib.name}, current path: {src}')
+    # Convert to absolute path
+    if src.startswith('//'):
+        abs_src = (blend_dir / src[2:]).resolve()
+    else:
+        abs_src = Path(src).resolve()
+    key = str(abs_src)
+    new_abs = None
+    # Check if already in target path
+    try:
+        if abs_src.relative_to(target_path):
+            new_abs = abs_src
+            print(f'    Already in target path: {new_abs}')
+    except Exception:
+        pass
+    # Look up in copy_map first (most reliable)
+    if new_abs is None:
+        new_abs = lookup_copy_map(key)
+        if new_abs is not None:
+            print(f'    Found in copy_map: {new_abs}')
+    # Try relative to common_root
+    if new_abs is None:
+        try:
+            rel_to_root = abs_src.relative_to(common_root)
+            new_abs = (target_path / rel_to_root).resolve()
+            print(f'    Computed from common_root: {new_abs}')
+        except Exception:
+            pass
+    # If we found a new path, verify it exists and remap
+    if new_abs is not None:
+        if new_abs.exists():
+            # Set absolute path first
+            lib.filepath = str(new_abs)
+            # Then convert to relative
+            try:
+                rel_path = bpy.path.relpath(str(new_abs))
+                lib.filepath = rel_path
+                print(f'    Remapped to relative: {rel_path}')
+                remapped += 1
+            except Exception as e:
+                print(f'    WARNING: Could not make relative: {e}, keeping absolute')
+                remapped += 1
+        else:
+            print(f'    WARNING: Target file does not exist: {new_abs}')
+            unresolved.append(str(new_abs))
+    else:
+        print(f'    WARNING: Could not determine new path for: {abs_src}')
+        unresolved.append(str(abs_src))
+print(f'Remapped {remapped} libraries, {len(unresolved)} unresolved')
+if unresolved:
+    print(f'Unresolved paths: {unresolved}')
+
+# Remap image/texture paths
+images_remapped = 0
+for img in bpy.data.images:
+    if img.filepath and img.filepath not in ('', '<builtin>', '<memory>'):
+        src = img.filepath
+        # Convert to absolute path
+        if src.startswith('//'):
+            abs_src = (blend_dir / src[2:]).resolve()
+        else:
+            abs_src = Path(src).resolve()
+        key = str(abs_src)
+        new_abs = None
+        # Check if already in target path
+        try:
+            if abs_src.relative_to(target_path):
+                new_abs = abs_src
+        except Exception:
+            pass
+        # Look up in copy_map
+        if new_abs is None:
+            new_abs = lookup_copy_map(key)
+        # Try relative to common_root
+        if new_abs is None:
+            try:
+                rel_to_root = abs_src.relative_to(common_root)
+                new_abs = (target_path / rel_to_root).resolve()
+            except Exception:
+                pass
+        # If we found a new path and it exists, remap
+        if new_abs is not None and new_abs.exists():
+            # Set absolute path first
+            img.filepath = str(new_abs)
+            # Then convert to relative
+            try:
+                rel_path = bpy.path.relpath(str(new_abs))
+                img.filepath = rel_path
+                images_remapped += 1
+            except Exception:
+                images_remapped += 1
+print(f'Remapped {images_remapped} image/texture paths')
+
+# Remap physics/point cache paths (particle systems, cloth, soft body, etc.)
+caches_remapped = 0
+
+
+def remap_abs_to_rel(abs_src):
+    key = str(abs_src)
+    new_abs = None
+    try:
+        if abs_src.relative_to(target_path):
+            new_abs = abs_src
+    except Exception:
+        pass
+    if new_abs is None:
+        new_abs = lookup_copy_map(key)
+    if new_abs is None:
+        for src_prefix in sorted(copy_map.keys(), key=lambda x: -len(x)):
+            try:
+                rel = abs_src.relative_to(Path(src_prefix))
+                candidate = (Path(copy_map[src_prefix]) / rel).resolve()
+                if candidate.exists():
+                    new_abs = candidate
+                    break
+            except (ValueError, KeyError):
+                pass
+    if new_abs is None:
+        try:
+            rel_to_root = abs_src.relative_to(common_root)
+            new_abs = (target_path / rel_to_root).resolve()
+        except Exception:
+            pass
+    if new_abs is not None and new_abs.exists():
+        try:
+            rel_path = bpy.path.relpath(str(new_abs))
+            return rel_path
+        except Exception:
+            return str(new_abs)
+    return None
+
+
+def do_remap_path(src):
+    if not src or src in ('', '<builtin>', '<memory>'):
+        return None
+    if src.startswith('//'):
+        abs_src = (blend_dir / src[2:]).resolve()
+    else:
+        abs_src = Path(src).resolve()
+    new_path = remap_abs_to_rel(abs_src)
+    if new_path is not None:
+        return new_path
+    return None
+
+
+for obj in bpy.data.objects:
+    for mod in getattr(obj, 'modifiers', []):
+        ps = getattr(mod, 'particle_system', None)
+        if ps and getattr(ps, 'point_cache', None):
+            pc = ps.point_cache
+            if getattr(pc, 'filepath', None):
+                new_path = do_remap_path(pc.filepath)
+                if new_path is not None:
+                    pc.filepath = new_path
+                    caches_remapped += 1
+        pc = getattr(mod, 'point_cache', None)
+        if pc and getattr(pc, 'filepath', None):
+            new_path = do_remap_path(pc.filepath)
+            if new_path is not None:
+                pc.filepath = new_path
+                caches_remapped += 1
+print(f'Remapped {caches_remapped} physics/point cache paths')
+
+# Remap cache file paths (USD, etc.)
+cache_files_remapped = 0
+for cf in getattr(bpy.data, 'cache_files', []):
+    if getattr(cf, 'filepath', None):
+        new_path = do_remap_path(cf.filepath)
+        if new_path is not None:
+            cf.filepath = new_path
+            cache_files_remapped += 1
+print(f'Remapped {cache_files_remapped} cache file (USD) paths')
+
+# Save after remapping
+bpy.ops.wm.save_as_mainfile(filepath=str(Path(bpy.data.filepath)), compress=True)
+# Make all paths relative
+try:
+    bpy.ops.file.make_paths_relative(basedir=str(blend_dir))
+    print('Made all paths relative')
+except Exception as e:
+    print(f'Warning: make_paths_relative failed: {e}')
+if args.ensure_autopack or args.pack_all:
+    enable_nla_batch.enable_autopack()
+if args.pack_all:
+    try:
+        bpy.ops.file.pack_all()
+    except Exception as e:
+        print('Pack all failed:', e)
+if args.frame_range:
+    frame_start, frame_end, frame_step = args.frame_range
+    for scene in bpy.data.scenes:
+        scene.frame_start = frame_start
+        scene.frame_end = frame_end
+        scene.frame_step = frame_step
+    print(f'Applied frame range {frame_start}-{frame_end} (step {frame_step}) to all scenes')
+# Final save
+bpy.ops.wm.save_as_mainfile(filepath=str(Path(bpy.data.filepath)), compress=True)
+print('Remapping complete')
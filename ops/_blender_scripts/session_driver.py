@@ -0,0 +1,74 @@
+"""
+Blender-side script: run successive scripts sent over stdin in one Blender process.
+
+Not imported by the addon. Started by pack_ops.BlenderSession via:
+
+    blender --factory-startup -b <blend> --python session_driver.py
+
+Each request is one JSON line on stdin:
+
+    {"script": "<python source>"}                 run source text, or
+    {"file": "<path>", "argv": [...], "stdin": ""}  run a script file
+
+An optional "open": "<blend>" key first opens that blend (unless it is already
+the current file), so one process can work through several blends in turn.
+
+While a request runs, sys.argv holds ["blender", "--", *argv] and sys.stdin
+reads the "stdin" text, so file scripts see the same inputs as under a plain
+--python run. After each request a "===END=== <code>" line is printed (code 0
+on success). The driver returns, and Blender exits, when stdin is closed.
+"""
+
+import io
+import json
+import os
+import sys
+import traceback
+
+import bpy
+
+SENTINEL = "===END==="
+
+
+def _open_blend(path):
+    current = bpy.data.filepath
+    if current and os.path.normcase(os.path.abspath(current)) == os.path.normcase(os.path.abspath(path)):
+        return
+    bpy.ops.wm.open_mainfile(filepath=path)
+
+
+def _run_request(request):
+    saved_argv, saved_stdin = sys.argv, sys.stdin
+    sys.argv = [saved_argv[0], "--", *request.get("argv", [])]
+    sys.stdin = io.StringIO(request.get("stdin") or "")
+    try:
+        if request.get("open"):
+            _open_blend(request["open"])
+        if request.get("file"):
+            filename = request["file"]
+            with open(filename, encoding="utf-8") as f:
+                source = f.read()
+        else:
+            filename = "<session>"
+            source = request.get("script", "")
+        exec(compile(source, filename, "exec"), {"__name__": "__main__", "__file__": filename})
+        return 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc(file=sys.stdout)
+        return 1
+    finally:
+        sys.argv, sys.stdin = saved_argv, saved_stdin
+
+
+for raw in sys.stdin:
+    raw = raw.strip()
+    if not raw:
+        continue
+    try:
+        code = _run_request(json.loads(raw))
+    except ValueError as e:
+        print(f"Invalid session request: {e}")
+        code = 1
+    print(f"{SENTINEL} {code}", flush=True)
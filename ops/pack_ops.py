@@ -2,9 +2,21 @@
 Packing operations for SheepIt Project Submitter.
 """
 
+import errno
+import json
+import logging
 import os
+import queue
+import re
 import shutil
+import stat
+import subprocess
 import tempfile
+import threading
+import time
+import traceback
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple
@@ -13,6 +25,15 @@ import bpy
 from bpy.types import Operator
 from bpy.props import EnumProperty
 
+from .. import config
+
+# submit_ops only imports pack_ops inside functions, so this import is not circular
+from .submit_ops import (
+    apply_frame_range_to_blend,
+    create_zip_from_directory,
+    save_current_blend_with_frame_range,
+)
+
 # Import batter asset usage module
 # Use importlib to avoid sys.path manipulation and top-level module policy violations
 import importlib.util
@@ -56,23 +77,24 @@ def _get_asset_usage_module():
             _my_dir / "batter" / "asset_usage.py"
         )
         if spec and spec.loader:
-            _asset_usage_module = importlib.util.module_from_spec(spec)
+            module = importlib.util.module_from_spec(spec)
             # Set module metadata before execution so dataclasses can resolve __module__ correctly
-            _asset_usage_module.__name__ = module_name
-            _asset_usage_module.__file__ = str(_my_dir / "batter" / "asset_usage.py")
+            module.__name__ = module_name
+            module.__file__ = str(_my_dir / "batter" / "asset_usage.py")
             # Set package to parent package (ops)
             if __package__:
-                _asset_usage_module.__package__ = __package__
+                module.__package__ = __package__
             else:
-                _asset_usage_module.__package__ = "sheepit_project_submitter.ops"
+                module.__package__ = "sheepit_project_submitter.ops"
             
             # Register in sys.modules BEFORE execution so classes can resolve their __module__ attribute
             # Registering as a submodule (with dots) avoids "top level module" policy violations
-            sys.modules[module_name] = _asset_usage_module
+            sys.modules[module_name] = module
             
-            # Now execute the module
-            spec.loader.exec_module(_asset_usage_module)
-            return _asset_usage_module
+            # Now execute the module; cache it only once it loaded completely
+            spec.loader.exec_module(module)
+            _asset_usage_module = module
+            return module
     except Exception as e:
         # Clean up on error
         if module_name in sys.modules:
@@ -89,6 +111,37 @@ except ImportError as e:
     raise ImportError(f"Could not import batter.asset_usage module: {e}")
 
 
+class _PackLogFormatter(logging.Formatter):
+    """Format records like the addon's prints, tagging debug tracing with DEBUG:."""
+    
+    def format(self, record):
+        prefix = "[SheepIt Pack] DEBUG: " if record.levelno <= logging.DEBUG else "[SheepIt Pack] "
+        return prefix + record.getMessage()
+
+
+# Operator debug tracing: hidden by default, shown (to stdout, as before) with config.DEBUG
+# (SHEEPIT_DEBUG set in the environment) or after
+# logging.getLogger("sheepit.pack").setLevel(logging.DEBUG); warnings are always shown.
+# Arguments are %-formatted only when a record is actually emitted.
+log = logging.getLogger("sheepit.pack")
+if not log.handlers:  # Addon reload imports this module again
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(_PackLogFormatter())
+    log.addHandler(_log_handler)
+    log.propagate = False
+if config.DEBUG:
+    log.setLevel(logging.DEBUG)
+
+
+# Extensions of copied files whose paths are remapped (blend files and image/texture/video/USD files)
+_REMAP_EXTS = frozenset({
+    ".blend", ".png", ".jpg", ".jpeg", ".tga", ".tiff", ".exr", ".hdr", ".bmp", ".dds",
+    ".mp4", ".avi", ".mov", ".usd", ".usdc", ".usda",
+})
+# Cache directory name prefixes (copied next to their blend by copy_blend_caches)
+_CACHE_PREFIXES = ("blendcache_", "cache_")
+
+
 class WorkflowMode:
     """Workflow mode constants."""
     COPY_ONLY = "copy-only"
@@ -97,22 +150,398 @@ class WorkflowMode:
 
 def compute_target_relpath(abs_path: Path, base_root: Path) -> Path:
     """Return a stable relative path under the target, even if outside root."""
+    parts = abs_path.parts
+    root_parts = base_root.parts
+    head = parts[:len(root_parts)]
+    if head == root_parts or (os.name == "nt" and [p.lower() for p in head] == [p.lower() for p in root_parts]):
+        return Path(*parts[len(root_parts):])
+    # Outside root: label by drive (C: -> DRIVE_C, \\host\share -> UNC_host_share), POSIX -> ROOT
+    drive = abs_path.drive
+    if not drive:
+        label = "ROOT"
+    elif drive[1:2] == ":":
+        label = f"DRIVE_{drive[0].upper()}"
+    else:
+        unc = [p for p in drive.split("\\") if p]
+        label = "UNC_" + "_".join(unc[:2]) if len(unc) >= 2 else "UNC"
+    return Path(label, *parts[1:])
+
+
+def _target_relstr(src: str, root_prefix: str) -> str:
+    """String form of compute_target_relpath for the per-asset loops.
+    
+    ``root_prefix`` is the common root with a trailing separator. Paths under it are sliced
+    without building any Path; only paths outside the root go through compute_target_relpath.
+    """
+    if os.path.normcase(src[:len(root_prefix)]) == os.path.normcase(root_prefix):
+        return src[len(root_prefix):]
+    return os.fspath(compute_target_relpath(Path(src), Path(root_prefix)))
+
+
+def _kernel_copy(in_fd: int, out_fd: int, size: int) -> int:
+    """Copy up to size bytes between fds without a userspace buffer; returns bytes copied.
+    
+    Tries os.copy_file_range (reflink/CoW on btrfs/xfs), then os.sendfile. Both advance
+    the file positions, so a caller can finish a short copy from where this stopped.
+    """
+    copied = 0
+    for name in ("copy_file_range", "sendfile"):
+        if not hasattr(os, name):
+            continue
+        try:
+            while copied < size:
+                if name == "copy_file_range":
+                    n = os.copy_file_range(in_fd, out_fd, size - copied)
+                else:
+                    n = os.sendfile(out_fd, in_fd, None, size - copied)
+                if n == 0:
+                    break
+                copied += n
+            break
+        except OSError:
+            continue  # Unsupported for these files (EXDEV, EINVAL, ...): try the next method
+    return copied
+
+
+def _load_copy_file_w():
+    """kernel32.CopyFileW on Windows (None elsewhere, or if ctypes can't load it)."""
+    if os.name != "nt":
+        return None
     try:
-        return abs_path.relative_to(base_root)
-    except Exception:
-        anchor = abs_path.anchor
-        if os.name == "nt":
-            if anchor.startswith("\\\\"):
-                parts = anchor.strip("\\").split("\\")
-                label = "UNC_" + "_".join(parts[:2]) if len(parts) >= 2 else "UNC"
-            elif len(anchor) >= 2 and anchor[1] == ":":
-                label = f"DRIVE_{anchor[0].upper()}"
-            else:
-                label = "ROOT"
-        else:
-            label = "ROOT"
-        rel_after_anchor = str(abs_path)[len(anchor):].lstrip("\\/")
-        return Path(label) / Path(rel_after_anchor)
+        import ctypes
+        from ctypes import wintypes
+        copy_file_w = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    except (ImportError, OSError, AttributeError):
+        return None
+    copy_file_w.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    copy_file_w.restype = wintypes.BOOL
+    return copy_file_w
+
+
+# Native copy on Windows: keeps times and attributes in one call and can use block cloning (ReFS)
+_copy_file_w = _load_copy_file_w()
+
+
+def _fast_copy(src: Path, dst: Path, st: Optional[os.stat_result] = None) -> None:
+    """Copy a file with its mode and times like shutil.copy2, in kernel space on Linux.
+    
+    st is the source stat result when the caller already has one. Windows uses CopyFileW,
+    other platforms shutil.copy2, which picks the native fast path there.
+    """
+    if _copy_file_w is not None:
+        if not _copy_file_w(os.fspath(src), os.fspath(dst), False):
+            import ctypes
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    if not sys.platform.startswith("linux"):
+        shutil.copy2(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        if st is None:
+            st = os.fstat(in_fd)
+        copied = _kernel_copy(in_fd, out_fd, st.st_size)
+        if copied < st.st_size:
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+            fdst.flush()
+        os.chmod(out_fd, stat.S_IMODE(st.st_mode))
+        os.utime(out_fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _rename_no_clobber(src: Path, dst: Path) -> None:
+    """Rename src to dst, raising FileExistsError instead of replacing an existing dst.
+    
+    Windows os.rename already refuses to overwrite. Elsewhere a hard link claims dst
+    atomically; on filesystems without hard links the rename is guarded by a lexists check.
+    """
+    if os.name == 'nt':
+        os.rename(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        raise
+    except OSError:
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, "File exists", str(dst))
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
+class _LibraryAbspathMemo(dict):
+    """Library -> absolute path memo; misses are resolved by the original library_abspath."""
+    
+    def __init__(self, original, temp_file_path: Path):
+        super().__init__({None: temp_file_path})
+        self._original = original
+    
+    def __missing__(self, lib):
+        path = self[lib] = self._original(lib)
+        return path
+
+
+def _library_abspath_override(original, temp_file_path: Path):
+    """Return a replacement for au.library_abspath that resolves lib=None to temp_file_path.
+    
+    Other libraries go through original. The override is the memo's own __getitem__, so a
+    hit (every call after the first per library) runs no Python code at all; the memo
+    lives only as long as the override is installed.
+    """
+    return _LibraryAbspathMemo(original, temp_file_path).__getitem__
+
+
+def _remove_temp_blend(temp_blend_path: Path, temp_dir: Optional[Path]) -> None:
+    """Delete the temp blend saved for packing and its temp directory, if now empty."""
+    try:
+        temp_blend_path.unlink()
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        print(f"[SheepIt Pack] WARNING: Could not clean up temp file: {e}")
+        return
+    if temp_dir:
+        try:
+            temp_dir.rmdir()
+        except Exception:
+            pass  # Directory may not be empty
+    print(f"[SheepIt Pack] Cleaned up temp file: {temp_blend_path}")
+
+
+def _oversized_warning(oversized_files) -> str:
+    """Build the console warning for (path, size) linked files too large to pack."""
+    oversized_list = "\n".join(f"  - {f.name or f} ({size / (1024**3):.2f} GB)"
+                              for f, size in oversized_files[:10])
+    if len(oversized_files) > 10:
+        oversized_list += f"\n  ... and {len(oversized_files) - 10} more"
+    return (
+        f"Warning: {len(oversized_files)} linked file(s) over size limit could not be packed:\n"
+        f"{oversized_list}\n\n"
+        "Blender cannot pack linked files over the project size limit. These files will remain as external references.\n"
+        "To fix: Reduce the size of these files or split them into smaller files."
+    )
+
+
+def _move_or_copy(src: Path, dst: Path) -> bool:
+    """Put src at dst, replacing dst: a rename on the same filesystem, else a _fast_copy.
+    
+    Returns True if src was moved, False if it was copied and still exists.
+    """
+    src_st = os.stat(src)
+    if src_st.st_dev == os.stat(dst.parent).st_dev:
+        try:
+            os.replace(src, dst)
+            return True
+        except OSError:
+            pass  # e.g. a share that reports one device but refuses the rename
+    _fast_copy(src, dst, src_st)
+    return False
+
+
+# Worker threads for concurrent asset copies; copies are I/O bound, so more threads than cores
+_COPY_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+# Assets handed to the copy pool per round between progress/cancel checks
+_COPY_CHUNK = 64
+
+
+def _copy_one(item: tuple) -> tuple:
+    """Copy one (src, dst, st) item; returns (src, dst, error) with error None on success."""
+    src, dst, st = item
+    try:
+        _fast_copy(src, dst, st)
+        return (src, dst, None)
+    except Exception as e:
+        return (src, dst, e)
+
+
+class _DirStatCache:
+    """Source file stats taken from one os.scandir listing per directory.
+    
+    On Windows a directory listing already carries size, mode and times, so the assets
+    of a texture folder cost one listing instead of one stat round trip each (slow on
+    network drives). On other platforms DirEntry.stat() is a stat call anyway, so
+    plain os.stat is used.
+    """
+    
+    def __init__(self):
+        self._dirs = {}  # parent dir -> {lowercased name: DirEntry}
+    
+    def stat(self, path: str) -> os.stat_result:
+        """Like os.stat(path), and raises the same errors."""
+        if os.name != "nt":
+            return os.stat(path)
+        parent, name = os.path.split(path)
+        entries = self._dirs.get(parent)
+        if entries is None:
+            try:
+                with os.scandir(parent) as it:
+                    entries = {e.name.lower(): e for e in it}
+            except OSError:
+                entries = {}
+            self._dirs[parent] = entries
+        entry = entries.get(name.lower())
+        if entry is None or entry.is_symlink() or not entry.is_file():
+            return os.stat(path)  # Missing, link or not a file: let os.stat resolve it or raise
+        return entry.stat()
+
+
+def _make_dirs(dirs) -> list:
+    """Create the given directories with one os.makedirs per leaf; returns (dir, error) failures.
+    
+    Directories that are ancestors of another one in the set are skipped, since
+    makedirs on the deeper directory creates them anyway.
+    """
+    dirs = set(dirs)
+    ancestors = set()
+    for d in dirs:
+        parent = os.path.dirname(d)
+        while parent and parent != d and parent not in ancestors:
+            ancestors.add(parent)
+            d, parent = parent, os.path.dirname(parent)
+    failures = []
+    for d in dirs - ancestors:
+        try:
+            os.makedirs(d, exist_ok=True)
+        except OSError as e:
+            failures.append((d, e))
+    return failures
+
+
+def _batch_copy(items: list, make_dirs: bool = True,
+                executor: Optional[ThreadPoolExecutor] = None) -> list:
+    """Copy (src, dst, st) file items, creating each destination directory once up front.
+    
+    src/dst are Paths or path strings; st is the source stat result (or None) and is handed to _fast_copy. Pass
+    make_dirs=False when the caller has already created the destination directories.
+    With an executor the copies run concurrently (the GIL is released during file I/O).
+    Returns a list of (src, dst, error) in input order; error is None on success.
+    """
+    if make_dirs:
+        _make_dirs(os.path.dirname(dst) for _, dst, _ in items)  # Failures are reported by the copies into them
+    if executor is not None:
+        return list(executor.map(_copy_one, items))
+    return [_copy_one(item) for item in items]
+
+
+def _fast_common_root(paths: list) -> Tuple[Optional[str], list]:
+    """Longest common directory of paths, computed on their string forms in one pass.
+    
+    Paths are grouped by drive (one group on POSIX) and the root is taken from the largest
+    group, so a temp file on C: does not defeat assets on Z:. Returns (root or None,
+    paths from the other drives); those fall back to compute_target_relpath's DRIVE_/UNC_ labels.
+    """
+    groups = defaultdict(list)
+    for p in paths:
+        path_str = os.fspath(p)
+        groups[os.path.splitdrive(path_str)[0].lower()].append(path_str)
+    if not groups:
+        return None, []
+    key = max(groups, key=lambda k: len(groups[k]))
+    group = groups.pop(key)
+    off_root = [Path(p) for other in groups.values() for p in other]
+    seps = tuple(sep for sep in (os.sep, os.altsep) if sep)
+    prefix = os.path.commonprefix(group)
+    # Keep the prefix only if it ends on a path component boundary in every path
+    if not all(len(p) == len(prefix) or p[len(prefix)] in seps for p in group):
+        prefix = prefix[:max(prefix.rfind(sep) for sep in seps) + 1]
+    root = prefix.rstrip("".join(seps))
+    drive = os.path.splitdrive(prefix)[0]
+    if len(root) <= len(drive):
+        root = prefix[:len(drive) + 1]  # Filesystem root: "/" or "C:\\"
+    return (root or None), off_root
+
+
+def _first_blend(root: Path) -> Optional[Path]:
+    """Return a .blend file under root, searching breadth-first and stopping at the first one.
+    
+    Shallow files are found first, so the top-level blend wins over library blends in
+    subfolders; unlike list(root.rglob("*.blend")) the rest of the tree is never walked.
+    """
+    pending = deque([os.fspath(root)])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".blend") and entry.is_file():
+                        return Path(entry.path)
+        except OSError:
+            continue
+    return None
+
+
+def _file_size(path: Path) -> Optional[int]:
+    """Size of the file at path in bytes, or None if it does not exist (or cannot be stat'ed)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def _dir_size(root: Path) -> Tuple[int, int]:
+    """Return (total bytes, file count) of the regular files under root.
+    
+    Sizes come from the scandir entries (cached from the directory read on Windows), so there
+    is no exists() probe or Path per file as with os.walk; unreadable entries are skipped.
+    """
+    total = 0
+    count = 0
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                            count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total, count
+
+
+# Frame number patterns for cache filenames, tried in order (see truncate_caches_to_frame_range)
+_FRAME_STEM_PATTERNS = (
+    re.compile(r'_(\d+)_\d+$'),  # Blender bphys: name_frame_index (frame is middle number, index is last)
+    re.compile(r'(?:frame_|cache[^_]*_)(\d+)', re.IGNORECASE),
+    re.compile(r'(?:fluid_|cloth_|softbody_|particles_|pointcache_|sim_)(\d+)', re.IGNORECASE),
+    re.compile(r'(\d+)$'),
+)
+
+
+def _frame_from_stem(stem: str) -> Optional[int]:
+    """Extract frame number from cache filename stem, or None if the naming is not recognized."""
+    for pattern in _FRAME_STEM_PATTERNS:
+        match = pattern.search(stem)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def _robocopy(src_dir: Path, dst_dir: Path, robocopy_exe: str = "robocopy") -> int:
+    """Mirror src_dir into dst_dir with multi-threaded robocopy (Windows); returns its exit code (< 8 is success).
+    
+    A run that has not finished after 10 minutes (e.g. a stalled share) is killed and
+    reported as failed (16, robocopy's fatal error code).
+    """
+    try:
+        rc = subprocess.run(
+            [robocopy_exe, str(src_dir), str(dst_dir), "/E", f"/MT:{_COPY_WORKERS}", "/R:2", "/W:1",
+             "/NFL", "/NDL", "/NJH", "/NJS"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=600,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"[SheepIt Pack]   WARNING: robocopy timed out copying {src_dir}")
+        return 16
+    return rc.returncode
 
 
 def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list, 
@@ -123,11 +552,10 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
 
     If frame range parameters are provided, only copies cache files within that range.
     Otherwise, copies all cache files.
-    On Windows we use robocopy when frame filtering; source path is kept as given (e.g. P:\)
+    On Windows we use robocopy (multi-threaded) for unfiltered copies and as the fallback when
+    frame filtering; source path is kept as given (e.g. P:\)
     so mapped drives work instead of resolving to UNC.
     """
-    import re
-    import subprocess as _sub
     copied = []
     # Keep source path as-is on Windows so P:\ stays P:\ (resolve can turn it into UNC and break robocopy)
     if os.name != "nt":
@@ -138,22 +566,6 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
     if filter_by_frame:
         valid_frames = set(range(frame_start, frame_end + 1, frame_step))
 
-    def _frame_from_stem(stem: str) -> Optional[int]:
-        """Extract frame number from cache filename (matches truncate patterns)."""
-        match = re.search(r'_(\d+)_\d+$', stem)  # Blender bphys: name_frame_index
-        if match:
-            return int(match.group(1))
-        match = re.search(r'(?:frame_|cache[^_]*_)(\d+)', stem, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-        match = re.search(r'(?:fluid_|cloth_|softbody_|particles_|pointcache_|sim_)(\d+)', stem, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-        match = re.search(r'(\d+)$', stem)
-        if match:
-            return int(match.group(1))
-        return None
-
     def should_copy_file(file_path: Path) -> bool:
         if not filter_by_frame:
             return True
@@ -172,19 +584,34 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
             if src_item.is_dir():
                 copy_tree_filtered(src_item, dst_item)
             elif src_item.is_file() and should_copy_file(src_item):
-                shutil.copy2(src_item, dst_item)
+                _fast_copy(src_item, dst_item)
 
     def _dst_has_files(p: Path) -> bool:
-        """True if directory exists and contains at least one file (quick check)."""
+        """True if directory exists and contains at least one entry (quick check)."""
         try:
-            if not p.exists() or not p.is_dir():
-                return False
-            for _ in p.rglob("*"):
-                return True  # at least one entry
+            with os.scandir(p) as it:
+                for _ in it:
+                    return True  # at least one entry
             return False
-        except Exception:
+        except OSError:
             return False
 
+    def _reset_dst(p: Path):
+        """Ensure p exists and is empty; only rmtree when something is actually there."""
+        if _dst_has_files(p):
+            try:
+                shutil.rmtree(p)
+            except Exception:
+                pass
+        p.mkdir(parents=True, exist_ok=True)
+
+    def _remove_if_empty(p: Path):
+        """Drop an empty destination directory left behind by a failed copy."""
+        try:
+            p.rmdir()
+        except OSError:
+            pass
+
     try:
         src_parent = src_blend.parent
         dst_parent = dst_blend.parent
@@ -222,20 +649,11 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
                         robocopy_exe = (getattr(shutil, "which", lambda x: None)("robocopy")
                             or os.path.join(os.environ.get("SystemRoot", "C:\\Windows"), "System32", "robocopy.exe")
                             or "robocopy")
-                        src_str = str(src_dir)
-                        dst_str = str(dst_dir)
-                        print(f"[SheepIt Pack]   robocopy: {src_str} -> {dst_str}")
-                        cmd = f'"{robocopy_exe}" "{src_str}" "{dst_str}" /E /R:2 /W:1 /NFL /NDL /NJH /NJS'
-                        rc = _sub.run(cmd, shell=True, capture_output=True, text=True, timeout=600)
-                        print(f"[SheepIt Pack]   robocopy exit code: {rc.returncode}")
-                        return rc.returncode
-                    dst_dir.parent.mkdir(parents=True, exist_ok=True)
-                    if dst_dir.exists():
-                        try:
-                            shutil.rmtree(dst_dir)
-                        except Exception:
-                            pass
-                    dst_dir.mkdir(parents=True, exist_ok=True)
+                        print(f"[SheepIt Pack]   robocopy: {src_dir} -> {dst_dir}")
+                        rc = _robocopy(src_dir, dst_dir, robocopy_exe)
+                        print(f"[SheepIt Pack]   robocopy exit code: {rc}")
+                        return rc
+                    _reset_dst(dst_dir)
                     used_robocopy = False
                     try:
                         src_exists = src_dir.exists()
@@ -252,11 +670,7 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
                         rc = _try_robocopy()
                         if rc >= 8:
                             missing_on_copy.append(src_dir)
-                            if dst_dir.exists() and not _dst_has_files(dst_dir):
-                                try:
-                                    shutil.rmtree(dst_dir)
-                                except Exception:
-                                    pass
+                            _remove_if_empty(dst_dir)
                             continue
                     except Exception as e:
                         print(f"[SheepIt Pack]   WARNING: cache copy failed for {src_dir.name}: {e}")
@@ -264,22 +678,14 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
                         rc = _try_robocopy()
                         if rc >= 8 or not _dst_has_files(dst_dir):
                             missing_on_copy.append(src_dir)
-                            if dst_dir.exists() and not _dst_has_files(dst_dir):
-                                try:
-                                    shutil.rmtree(dst_dir)
-                                except Exception:
-                                    pass
+                            _remove_if_empty(dst_dir)
                             continue
                     if not _dst_has_files(dst_dir) and not used_robocopy:
                         print(f"[SheepIt Pack]   {src_dir.name}: Python copy produced 0 files, trying robocopy")
                         used_robocopy = True
                         rc = _try_robocopy()
                         if rc >= 8 or not _dst_has_files(dst_dir):
-                            if dst_dir.exists() and not _dst_has_files(dst_dir):
-                                try:
-                                    shutil.rmtree(dst_dir)
-                                except Exception:
-                                    pass
+                            _remove_if_empty(dst_dir)
                             continue
                     if _dst_has_files(dst_dir):
                         n_before = sum(1 for _ in dst_dir.rglob("*") if _.is_file())
@@ -291,21 +697,11 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
                             copied.append(dst_dir)
                         else:
                             print(f"[SheepIt Pack]   {dst_dir.name}: empty after truncate, skipping")
-                            try:
-                                shutil.rmtree(dst_dir)
-                            except Exception:
-                                pass
+                            _remove_if_empty(dst_dir)
                     continue
                 if not src_dir.exists() or not src_dir.is_dir():
                     continue
-                # Don't pre-create dst_dir for non-Windows path; copy_tree/copytree will create it
-                dst_dir.parent.mkdir(parents=True, exist_ok=True)
-                if dst_dir.exists():
-                    try:
-                        shutil.rmtree(dst_dir)
-                    except Exception:
-                        pass
-                dst_dir.mkdir(parents=True, exist_ok=True)
+                _reset_dst(dst_dir)
                 if filter_by_frame:
                     try:
                         copy_tree_filtered(src_dir, dst_dir)
@@ -314,11 +710,7 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
                             copied.append(dst_dir)
                     except PermissionError:
                         if os.name == "nt":
-                            rc = _sub.run(
-                                ["robocopy", str(src_dir), str(dst_dir), "/E", "/R:2", "/W:1", "/NFL", "/NDL", "/NJH", "/NJS"],
-                                capture_output=True, text=True,
-                            )
-                            if rc.returncode < 8 and _dst_has_files(dst_dir):
+                            if _robocopy(src_dir, dst_dir) < 8 and _dst_has_files(dst_dir):
                                 truncate_caches_to_frame_range(dst_dir, frame_start, frame_end, frame_step)
                                 _add_cache_dir_to_map(src_dir, dst_dir)
                                 copied.append(dst_dir)
@@ -328,17 +720,24 @@ def copy_blend_caches(src_blend: Path, dst_blend: Path, missing_on_copy: list,
                         print(f"[SheepIt Pack] WARNING: Error copying filtered cache {src_dir.name}: {e}")
                         missing_on_copy.append(src_dir)
                 else:
+                    # On Windows, robocopy's multi-threaded copy is much faster than copytree on
+                    # cache folders with thousands of small frame files
+                    robocopy_exe = shutil.which("robocopy") if os.name == "nt" else None
+                    if robocopy_exe:
+                        if _robocopy(src_dir, dst_dir, robocopy_exe) < 8:
+                            _add_cache_dir_to_map(src_dir, dst_dir)
+                            copied.append(dst_dir)
+                        else:
+                            missing_on_copy.append(src_dir)
+                            _remove_if_empty(dst_dir)
+                        continue
                     try:
-                        shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
+                        shutil.copytree(src_dir, dst_dir, copy_function=_fast_copy, dirs_exist_ok=True)
                         _add_cache_dir_to_map(src_dir, dst_dir)
                         copied.append(dst_dir)
                     except PermissionError:
                         if os.name == "nt":
-                            rc = _sub.run(
-                                ["robocopy", str(src_dir), str(dst_dir), "/E", "/R:2", "/W:1", "/NFL", "/NDL", "/NJH", "/NJS"],
-                                capture_output=True, text=True,
-                            )
-                            if rc.returncode < 8:
+                            if _robocopy(src_dir, dst_dir) < 8:
                                 _add_cache_dir_to_map(src_dir, dst_dir)
                                 copied.append(dst_dir)
                         else:
@@ -366,7 +765,25 @@ def truncate_caches_to_frame_range(cache_dir: Path, frame_start: int, frame_end:
     
     Returns number of files removed.
     """
-    import re
+    # Fast path: step 1 and a flat cache dir whose frames all fall inside the range keeps
+    # everything, so a single scandir replaces the recursive walk.
+    if frame_step == 1:
+        try:
+            all_kept = True
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        all_kept = False  # Nested directories: use the full walk below
+                        break
+                    frame_num = _frame_from_stem(os.path.splitext(entry.name)[0])
+                    if frame_num is not None and not (frame_start <= frame_num <= frame_end):
+                        all_kept = False
+                        break
+            if all_kept:
+                return 0
+        except OSError:
+            pass
+    
     valid_frames = set(range(frame_start, frame_end + 1, frame_step))
     to_remove = []
     would_keep_count = 0
@@ -375,25 +792,7 @@ def truncate_caches_to_frame_range(cache_dir: Path, frame_start: int, frame_end:
         if not cache_file.is_file():
             continue
 
-        frame_num = None
-        stem = cache_file.stem
-        # Blender bphys: name_frame_index (frame is middle number, index is last)
-        match = re.search(r'_(\d+)_\d+$', stem)
-        if match:
-            frame_num = int(match.group(1))
-        if frame_num is None:
-            match = re.search(r'(?:frame_|cache[^_]*_)(\d+)', stem, re.IGNORECASE)
-            if match:
-                frame_num = int(match.group(1))
-        if frame_num is None:
-            match = re.search(r'(?:fluid_|cloth_|softbody_|particles_|pointcache_|sim_)(\d+)', stem, re.IGNORECASE)
-            if match:
-                frame_num = int(match.group(1))
-        if frame_num is None:
-            match = re.search(r'(\d+)$', stem)
-            if match:
-                frame_num = int(match.group(1))
-
+        frame_num = _frame_from_stem(cache_file.stem)
         if frame_num is None or frame_num in valid_frames:
             would_keep_count += 1
         else:
@@ -412,44 +811,130 @@ def truncate_caches_to_frame_range(cache_dir: Path, frame_start: int, frame_end:
     return files_removed
 
 
-def _run_blender_script(script: str, blend_path: Path, timeout: int = 300) -> tuple[str, str, int]:
+# Blender-side scripts shipped with this module (run with --python, never imported)
+_SCRIPTS_DIR = Path(__file__).resolve().parent / "_blender_scripts"
+_REMAP_LIBS_SCRIPT = _SCRIPTS_DIR / "remap_libs.py"
+_PACK_LINKED_SCRIPT = _SCRIPTS_DIR / "pack_linked.py"
+_ENABLE_NLA_SCRIPT = _SCRIPTS_DIR / "enable_nla_batch.py"
+_SESSION_DRIVER_SCRIPT = _SCRIPTS_DIR / "session_driver.py"
+_SESSION_SENTINEL = "===END==="
+
+
+class _ScriptOutput:
+    """Collects a Blender script's output lines, optionally forwarding each to on_line.
+    
+    With on_line set only the first lines are kept (for the console summary), so memory
+    stays bounded however much Blender prints.
+    """
+    
+    _HEAD_LINES = 10
+    
+    def __init__(self, on_line=None):
+        self.on_line = on_line
+        self.lines = {"stdout": [], "stderr": []}
+        self.counts = {"stdout": 0, "stderr": 0}
+    
+    def add(self, stream_name: str, line: str) -> None:
+        self.counts[stream_name] += 1
+        if self.on_line is None or self.counts[stream_name] <= self._HEAD_LINES:
+            self.lines[stream_name].append(line)
+        if self.on_line is not None:
+            self.on_line(stream_name, line)
+    
+    def text(self, stream_name: str) -> str:
+        """Full text of a stream; empty when lines were streamed to on_line."""
+        return "" if self.on_line is not None else "".join(self.lines[stream_name])
+    
+    def print_summary(self) -> None:
+        """Print the first lines of stdout/stderr to the console."""
+        for stream_name in ("stdout", "stderr"):
+            count = self.counts[stream_name]
+            if not count:
+                continue
+            print(f"[SheepIt Pack]   {stream_name} ({count} lines):")
+            for line in self.lines[stream_name][:self._HEAD_LINES]:
+                print(f"[SheepIt Pack]     {line.rstrip()}")
+            if count > self._HEAD_LINES:
+                print(f"[SheepIt Pack]     ... ({count - self._HEAD_LINES} more lines)")
+
+
+def _pump_lines(stream, stream_name: str, lines) -> None:
+    """Reader thread: put (stream_name, line) on the queue, then (stream_name, None) at EOF.
+    
+    The EOF marker is queued even if reading fails, so waiters never sit out their timeout.
+    """
+    try:
+        for line in stream:
+            lines.put((stream_name, line))
+    finally:
+        lines.put((stream_name, None))
+
+
+def _feed_stdin(proc, data: str) -> None:
+    """Write data to proc's stdin and close it, on a thread (Blender reads it only once started)."""
+    def _feed():
+        try:
+            proc.stdin.write(data)
+            proc.stdin.close()
+        except OSError:
+            pass  # Blender exited without reading stdin
+    threading.Thread(target=_feed, daemon=True).start()
+
+
+def _run_blender_script(script: Path, blend_path: Path, timeout: int = 300,
+                        script_args: Optional[list] = None, stdin_data: Optional[str] = None,
+                        on_line=None) -> tuple[str, str, int]:
     """Run a Python script in a Blender subprocess.
     
     Args:
-        script: Python script to execute
+        script: Path to the script file, run via --python
         blend_path: Path to blend file to process
         timeout: Timeout in seconds (default 300 = 5 minutes)
+        script_args: Arguments passed to the script after "--" (read from sys.argv)
+        stdin_data: Text written to the subprocess stdin
+        on_line: Optional callback(stream_name, line) called for each output line as Blender
+            prints it ("stdout" or "stderr"); the returned stdout/stderr are then empty
     
     Returns:
         Tuple of (stdout, stderr, returncode)
     """
-    import subprocess
-    import time
     print(f"[SheepIt Pack] Running Blender script on: {blend_path.name}")
     print(f"[SheepIt Pack]   Full path: {blend_path}")
     print(f"[SheepIt Pack]   Timeout: {timeout}s")
+    cmd = ["blender", "--factory-startup", "-b", str(blend_path), "--python", str(script)]
+    if script_args:
+        cmd += ["--", *script_args]
     start_time = time.time()
+    deadline = start_time + timeout
+    output = _ScriptOutput(on_line)
     try:
-        result = subprocess.run([
-            "blender", "--factory-startup", "-b", str(blend_path), "--python-expr", script
-        ], capture_output=True, text=True, check=False, timeout=timeout)
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", errors="replace", bufsize=1,
+        )
+        lines = queue.Queue()
+        for stream, stream_name in ((proc.stdout, "stdout"), (proc.stderr, "stderr")):
+            threading.Thread(target=_pump_lines, args=(stream, stream_name, lines), daemon=True).start()
+        if stdin_data is not None:
+            _feed_stdin(proc, stdin_data)
+        open_streams = 2
+        while open_streams:
+            try:
+                stream_name, line = lines.get(timeout=max(0.0, deadline - time.time()))
+            except queue.Empty:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if line is None:
+                open_streams -= 1
+            else:
+                output.add(stream_name, line)
+        returncode = proc.wait(timeout=max(0.0, deadline - time.time()))
         elapsed = time.time() - start_time
-        print(f"[SheepIt Pack]   Script completed in {elapsed:.2f}s, return code: {result.returncode}")
-        if result.stdout:
-            stdout_lines = result.stdout.strip().split('\n')
-            print(f"[SheepIt Pack]   stdout ({len(stdout_lines)} lines):")
-            for line in stdout_lines[:10]:  # First 10 lines
-                print(f"[SheepIt Pack]     {line}")
-            if len(stdout_lines) > 10:
-                print(f"[SheepIt Pack]     ... ({len(stdout_lines) - 10} more lines)")
-        if result.stderr:
-            stderr_lines = result.stderr.strip().split('\n')
-            print(f"[SheepIt Pack]   stderr ({len(stderr_lines)} lines):")
-            for line in stderr_lines[:10]:  # First 10 lines
-                print(f"[SheepIt Pack]     {line}")
-            if len(stderr_lines) > 10:
-                print(f"[SheepIt Pack]     ... ({len(stderr_lines) - 10} more lines)")
-        return result.stdout, result.stderr, result.returncode
+        print(f"[SheepIt Pack]   Script completed in {elapsed:.2f}s, return code: {returncode}")
+        output.print_summary()
+        return output.text("stdout"), output.text("stderr"), returncode
     except subprocess.TimeoutExpired:
         elapsed = time.time() - start_time
         print(f"[SheepIt Pack]   ERROR: Script timed out after {elapsed:.2f}s (timeout: {timeout}s)")
@@ -461,253 +946,217 @@ def _run_blender_script(script: str, blend_path: Path, timeout: int = 300) -> tu
         return "", str(e), -1
 
 
-def remap_library_paths(blend_path: Path, copy_map: dict[str, str], common_root: Path, target_path: Path, ensure_autopack: bool = True) -> list[Path]:
-    """Open a blend file and remap all library paths to be relative to the copied tree."""
-    import json
-    import tempfile
-    
-    # Write copy_map to a temporary JSON file to avoid Windows command line length limits
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
-        json.dump(copy_map, f, indent=None)
-        copy_map_file = Path(f.name)
+class BlenderSession:
+    """One background Blender process kept open to run several scripts, on one or more blends.
+    
+    Starting Blender costs seconds per launch, so remap, pack all and pack linked for every
+    blend share one process. Scripts are sent to session_driver.py over stdin and return the
+    same (stdout, stderr, returncode) tuple as _run_blender_script; passing blend_path to
+    run() switches the session to that file first. Blender's stderr is merged into stdout.
+    
+    Usage:
+        with BlenderSession(blend_path) as session:
+            stdout, stderr, returncode = session.run(script)
+            stdout, stderr, returncode = session.run(script, blend_path=other_blend)
+    """
     
-    try:
-        autopack_block = ""
-        if ensure_autopack:
-            autopack_block = (
-                "try:\n"
-                "    fp = bpy.context.preferences.filepaths\n"
-                "    for k in ('use_autopack', 'use_autopack_files', 'use_auto_pack'):\n"
-                "        if hasattr(fp, k):\n"
-                "            try:\n"
-                "                setattr(fp, k, True)\n"
-                "            except Exception:\n"
-                "                pass\n"
-                "except Exception:\n"
-                "    pass\n"
-            )
-        
-        # Escape backslashes in paths for the script
-        copy_map_file_str = str(copy_map_file).replace('\\', '\\\\')
-        common_root_str = str(common_root).replace('\\', '\\\\')
-        target_path_str = str(target_path).replace('\\', '\\\\')
-        
-        remap_script = (
-            "import bpy, json\n"
-            "from pathlib import Path\n"
-            f"copy_map_file = Path(r'{copy_map_file_str}')\n"
-            f"with open(copy_map_file, 'r', encoding='utf-8') as f:\n"
-            f"    copy_map = json.load(f)\n"
-            f"common_root = Path(r'{common_root_str}')\n"
-            f"target_path = Path(r'{target_path_str}')\n"
-            "blend_dir = Path(bpy.data.filepath).parent\n"
-        "bpy.context.preferences.filepaths.use_relative_paths = True\n"
-        "remapped = 0\n"
-        "unresolved = []\n"
-        "print(f'Remapping library paths in: {{bpy.path.basename(bpy.data.filepath)}}')\n"
-        "print(f'Found {{len(bpy.data.libraries)}} libraries')\n"
-        "for lib in bpy.data.libraries:\n"
-        "    src = lib.filepath\n"
-        "    print(f'  Processing library: {{lib.name}}, current path: {{src}}')\n"
-        "    # Convert to absolute path\n"
-        "    if src.startswith('//'):\n"
-        "        abs_src = (blend_dir / src[2:]).resolve()\n"
-        "    else:\n"
-        "        abs_src = Path(src).resolve()\n"
-        "    key = str(abs_src)\n"
-        "    new_abs = None\n"
-        "    # Check if already in target path\n"
-        "    try:\n"
-        "        if abs_src.relative_to(target_path):\n"
-        "            new_abs = abs_src\n"
-        "            print(f'    Already in target path: {{new_abs}}')\n"
-        "    except Exception:\n"
-        "        pass\n"
-        "    # Look up in copy_map first (most reliable)\n"
-        "    if new_abs is None and key in copy_map:\n"
-        "        new_abs = Path(copy_map[key])\n"
-        "        print(f'    Found in copy_map: {{new_abs}}')\n"
-        "    # Try relative to common_root\n"
-        "    if new_abs is None:\n"
-        "        try:\n"
-        "            rel_to_root = abs_src.relative_to(common_root)\n"
-        "            new_abs = (target_path / rel_to_root).resolve()\n"
-        "            print(f'    Computed from common_root: {{new_abs}}')\n"
-        "        except Exception:\n"
-        "            pass\n"
-        "    # If we found a new path, verify it exists and remap\n"
-        "    if new_abs is not None:\n"
-        "        if new_abs.exists():\n"
-        "            # Set absolute path first\n"
-        "            lib.filepath = str(new_abs)\n"
-        "            # Then convert to relative\n"
-        "            try:\n"
-        "                rel_path = bpy.path.relpath(str(new_abs))\n"
-        "                lib.filepath = rel_path\n"
-        "                print(f'    Remapped to relative: {{rel_path}}')\n"
-        "                remapped += 1\n"
-        "            except Exception as e:\n"
-        "                print(f'    WARNING: Could not make relative: {{e}}, keeping absolute')\n"
-        "                remapped += 1\n"
-        "        else:\n"
-        "            print(f'    WARNING: Target file does not exist: {{new_abs}}')\n"
-        "            unresolved.append(str(new_abs))\n"
-        "    else:\n"
-        "        print(f'    WARNING: Could not determine new path for: {{abs_src}}')\n"
-        "        unresolved.append(str(abs_src))\n"
-        "print(f'Remapped {{remapped}} libraries, {{len(unresolved)}} unresolved')\n"
-        "if unresolved:\n"
-        "    print(f'Unresolved paths: {{unresolved}}')\n"
-        "# Remap image/texture paths\n"
-        "images_remapped = 0\n"
-        "for img in bpy.data.images:\n"
-        "    if img.filepath and img.filepath not in ('', '<builtin>', '<memory>'):\n"
-        "        src = img.filepath\n"
-        "        # Convert to absolute path\n"
-        "        if src.startswith('//'):\n"
-        "            abs_src = (blend_dir / src[2:]).resolve()\n"
-        "        else:\n"
-        "            abs_src = Path(src).resolve()\n"
-        "        key = str(abs_src)\n"
-        "        new_abs = None\n"
-        "        # Check if already in target path\n"
-        "        try:\n"
-        "            if abs_src.relative_to(target_path):\n"
-        "                new_abs = abs_src\n"
-        "        except Exception:\n"
-        "            pass\n"
-        "        # Look up in copy_map\n"
-        "        if new_abs is None and key in copy_map:\n"
-        "            new_abs = Path(copy_map[key])\n"
-        "        # Try relative to common_root\n"
-        "        if new_abs is None:\n"
-        "            try:\n"
-        "                rel_to_root = abs_src.relative_to(common_root)\n"
-        "                new_abs = (target_path / rel_to_root).resolve()\n"
-        "            except Exception:\n"
-        "                pass\n"
-        "        # If we found a new path and it exists, remap\n"
-        "        if new_abs is not None and new_abs.exists():\n"
-        "            # Set absolute path first\n"
-        "            img.filepath = str(new_abs)\n"
-        "            # Then convert to relative\n"
-        "            try:\n"
-        "                rel_path = bpy.path.relpath(str(new_abs))\n"
-        "                img.filepath = rel_path\n"
-        "                images_remapped += 1\n"
-        "            except Exception:\n"
-        "                images_remapped += 1\n"
-        "print(f'Remapped {{images_remapped}} image/texture paths')\n"
-        "# Remap physics/point cache paths (particle systems, cloth, soft body, etc.)\n"
-        "caches_remapped = 0\n"
-        "def remap_abs_to_rel(abs_src):\n"
-        "    key = str(abs_src)\n"
-        "    new_abs = None\n"
-        "    try:\n"
-        "        if abs_src.relative_to(target_path):\n"
-        "            new_abs = abs_src\n"
-        "    except Exception:\n"
-        "        pass\n"
-        "    if new_abs is None and key in copy_map:\n"
-        "        new_abs = Path(copy_map[key])\n"
-        "    if new_abs is None:\n"
-        "        for src_prefix in sorted(copy_map.keys(), key=lambda x: -len(x)):\n"
-        "            try:\n"
-        "                rel = abs_src.relative_to(Path(src_prefix))\n"
-        "                candidate = (Path(copy_map[src_prefix]) / rel).resolve()\n"
-        "                if candidate.exists():\n"
-        "                    new_abs = candidate\n"
-        "                    break\n"
-        "            except (ValueError, KeyError):\n"
-        "                pass\n"
-        "    if new_abs is None:\n"
-        "        try:\n"
-        "            rel_to_root = abs_src.relative_to(common_root)\n"
-        "            new_abs = (target_path / rel_to_root).resolve()\n"
-        "        except Exception:\n"
-        "            pass\n"
-        "    if new_abs is not None and new_abs.exists():\n"
-        "        try:\n"
-        "            rel_path = bpy.path.relpath(str(new_abs))\n"
-        "            return rel_path\n"
-        "        except Exception:\n"
-        "            return str(new_abs)\n"
-        "    return None\n"
-        "def do_remap_path(src):\n"
-        "    if not src or src in ('', '<builtin>', '<memory>'):\n"
-        "        return None\n"
-        "    if src.startswith('//'):\n"
-        "        abs_src = (blend_dir / src[2:]).resolve()\n"
-        "    else:\n"
-        "        abs_src = Path(src).resolve()\n"
-        "    new_path = remap_abs_to_rel(abs_src)\n"
-        "    if new_path is not None:\n"
-        "        return new_path\n"
-        "    return None\n"
-        "for obj in bpy.data.objects:\n"
-        "    for mod in getattr(obj, 'modifiers', []):\n"
-        "        ps = getattr(mod, 'particle_system', None)\n"
-        "        if ps and getattr(ps, 'point_cache', None):\n"
-        "            pc = ps.point_cache\n"
-        "            if getattr(pc, 'filepath', None):\n"
-        "                new_path = do_remap_path(pc.filepath)\n"
-        "                if new_path is not None:\n"
-        "                    pc.filepath = new_path\n"
-        "                    caches_remapped += 1\n"
-        "        pc = getattr(mod, 'point_cache', None)\n"
-        "        if pc and getattr(pc, 'filepath', None):\n"
-        "            new_path = do_remap_path(pc.filepath)\n"
-        "            if new_path is not None:\n"
-        "                pc.filepath = new_path\n"
-        "                caches_remapped += 1\n"
-        "print(f'Remapped {{caches_remapped}} physics/point cache paths')\n"
-        "# Remap cache file paths (USD, etc.)\n"
-        "cache_files_remapped = 0\n"
-        "for cf in getattr(bpy.data, 'cache_files', []):\n"
-        "    if getattr(cf, 'filepath', None):\n"
-        "        new_path = do_remap_path(cf.filepath)\n"
-        "        if new_path is not None:\n"
-        "            cf.filepath = new_path\n"
-        "            cache_files_remapped += 1\n"
-        "print(f'Remapped {{cache_files_remapped}} cache file (USD) paths')\n"
-        "# Save after remapping\n"
-        "bpy.ops.wm.save_as_mainfile(filepath=str(Path(bpy.data.filepath)), compress=True)\n"
-        "# Make all paths relative\n"
-        "try:\n"
-        "    bpy.ops.file.make_paths_relative(basedir=str(blend_dir))\n"
-        "    print('Made all paths relative')\n"
-        "except Exception as e:\n"
-        "    print(f'Warning: make_paths_relative failed: {{e}}')\n"
-        f"{autopack_block}"
-        "# Final save\n"
-        "bpy.ops.wm.save_as_mainfile(filepath=str(Path(bpy.data.filepath)), compress=True)\n"
-        "print('Remapping complete')\n"
+    def __init__(self, blend_path: Path):
+        self.blend_path = blend_path
+        self._proc = None
+        self._lines = None
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+    
+    def start(self) -> None:
+        """Launch Blender with the session driver. Raises OSError if Blender cannot be started."""
+        print(f"[SheepIt Pack] Starting Blender session on: {self.blend_path.name}")
+        cmd = ["blender", "--factory-startup", "-b", str(self.blend_path),
+               "--python", str(_SESSION_DRIVER_SCRIPT)]
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding="utf-8", errors="replace", bufsize=1,
         )
+        self._lines = queue.Queue()
+        threading.Thread(target=_pump_lines, args=(self._proc.stdout, "stdout", self._lines), daemon=True).start()
+    
+    def run(self, script, timeout: int = 300, script_args: Optional[list] = None,
+            stdin_data: Optional[str] = None, on_line=None,
+            blend_path: Optional[Path] = None) -> tuple[str, str, int]:
+        """Run a script (source text or Path) in the session. Same arguments as _run_blender_script.
         
-        stdout, stderr, returncode = _run_blender_script(remap_script, blend_path)
-    finally:
-        # Clean up temp file
+        With blend_path the session opens that blend first (if it is not already the open one).
+        """
+        if not self.alive:
+            return "", "Blender session is not running", -1
+        if isinstance(script, Path):
+            request = {"file": str(script), "argv": script_args or [], "stdin": stdin_data or ""}
+        else:
+            request = {"script": script, "argv": script_args or [], "stdin": stdin_data or ""}
+        if blend_path is not None:
+            # The driver skips the open when it is already the current file; always sending
+            # it means a failed open is retried instead of running on the previous blend
+            request["open"] = str(blend_path)
+            self.blend_path = blend_path
+        print(f"[SheepIt Pack] Running Blender script in session on: {self.blend_path.name}")
+        start_time = time.time()
+        deadline = start_time + timeout
+        output = _ScriptOutput(on_line)
+        returncode = -1
         try:
-            if copy_map_file.exists():
-                copy_map_file.unlink()
-        except Exception:
-            pass
+            self._proc.stdin.write(json.dumps(request) + "\n")
+            self._proc.stdin.flush()
+            while True:
+                try:
+                    _, line = self._lines.get(timeout=max(0.0, deadline - time.time()))
+                except queue.Empty:
+                    print(f"[SheepIt Pack]   ERROR: Script timed out after {time.time() - start_time:.2f}s (timeout: {timeout}s)")
+                    self.close()
+                    return output.text("stdout"), f"Script timed out after {timeout} seconds", -1
+                if line is None:
+                    print(f"[SheepIt Pack]   ERROR: Blender session exited unexpectedly")
+                    return output.text("stdout"), "Blender session exited unexpectedly", -1
+                if line.startswith(_SESSION_SENTINEL):
+                    try:
+                        returncode = int(line[len(_SESSION_SENTINEL):].strip())
+                    except ValueError:
+                        returncode = 1
+                    break
+                output.add("stdout", line)
+        except OSError as e:
+            print(f"[SheepIt Pack]   ERROR: Blender session failed: {type(e).__name__}: {str(e)}")
+            self.close()
+            return output.text("stdout"), str(e), -1
+        print(f"[SheepIt Pack]   Script completed in {time.time() - start_time:.2f}s, return code: {returncode}")
+        output.print_summary()
+        return output.text("stdout"), "", returncode
+    
+    def close(self) -> None:
+        """Close stdin so the driver returns and Blender exits; kill it if it does not."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+
+class _BlenderScriptJob:
+    """A Blender script file running in the background, polled for output without blocking.
+    
+    Lets a modal phase drive a long multi-file script (one Blender launch) while still
+    returning to the UI between timer events. stderr is merged into stdout.
+    """
+    
+    def __init__(self, script: Path, blend_path: Path, script_args: Optional[list] = None,
+                 stdin_data: Optional[str] = None):
+        """Start Blender, writing stdin_data to its stdin. Raises OSError if it cannot be started."""
+        cmd = ["blender", "--factory-startup", "-b", str(blend_path), "--python", str(script)]
+        if script_args:
+            cmd += ["--", *script_args]
+        self.started = time.time()
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding="utf-8", errors="replace", bufsize=1,
+        )
+        if stdin_data is not None:
+            _feed_stdin(self._proc, stdin_data)
+        self._lines = queue.Queue()
+        self._eof = False
+        threading.Thread(target=_pump_lines, args=(self._proc.stdout, "stdout", self._lines), daemon=True).start()
+    
+    def poll_lines(self, wait: float = 0.05) -> list:
+        """Return the output lines available now, waiting at most `wait` seconds for the first."""
+        lines = []
+        timeout = wait
+        while not self._eof:
+            try:
+                _, line = self._lines.get(timeout=timeout) if timeout else self._lines.get_nowait()
+            except queue.Empty:
+                break
+            timeout = 0
+            if line is None:
+                self._eof = True
+            else:
+                lines.append(line.rstrip("\r\n"))
+        return lines
+    
+    @property
+    def finished(self) -> bool:
+        return self._eof and self._proc.poll() is not None
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._proc.poll()
+    
+    def kill(self) -> None:
+        if self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+
+
+def _run_script(script, blend_path: Path, session: Optional[BlenderSession] = None, **kwargs) -> tuple[str, str, int]:
+    """Run a script on blend_path in the given session when it is running, else in a new Blender."""
+    if session is not None and session.alive:
+        return session.run(script, blend_path=blend_path, **kwargs)
+    return _run_blender_script(script, blend_path, **kwargs)
+
+
+def remap_library_paths(blend_path: Path, copy_map: dict[str, str], common_root: Path, target_path: Path, ensure_autopack: bool = True,
+                        session: Optional[BlenderSession] = None, pack_all: bool = False,
+                        frame_range: Optional[Tuple[int, int, int]] = None,
+                        enable_nla: bool = False) -> list[Path]:
+    """Open a blend file and remap all library paths to be relative to the copied tree.
+    
+    With pack_all, external files are also packed into the blend (bpy.ops.file.pack_all)
+    before the same save. With frame_range (start, end, step), every scene gets that range
+    in the same save (as apply_frame_range_to_blend does). With enable_nla, NLA tracks are
+    enabled first (as IncrementalPacker's ENABLE_NLA job does).
+    """
+    
+    # copy_map goes over stdin (no command line length limits); paths go as plain argv, no escaping
+    script_args = [
+        "--copy-map-stdin",
+        "--common-root", str(common_root),
+        "--target-path", str(target_path),
+    ]
+    if ensure_autopack:
+        script_args.append("--ensure-autopack")
+    if pack_all:
+        script_args.append("--pack-all")
+    if frame_range:
+        script_args += ["--frame-range", *(str(f) for f in frame_range)]
+    if enable_nla:
+        script_args.append("--enable-nla")
+    stdout, stderr, returncode = _run_script(
+        _REMAP_LIBS_SCRIPT, blend_path, session=session, script_args=script_args, stdin_data=json.dumps(copy_map),
+    )
     
     unresolved = []
     
     # Parse unresolved paths from output
     if stdout:
-        import re
         for line in stdout.splitlines():
-            if 'Unresolved paths:' in line or 'WARNING: Target file does not exist:' in line or 'WARNING: Could not determine new path for:' in line:
-                # Try to extract path from the line
-                match = re.search(r':\s*(.+)$', line)
-                if match:
-                    unresolved_path = match.group(1).strip()
-                    try:
+            for marker in ('WARNING: Target file does not exist:', 'WARNING: Could not determine new path for:'):
+                if marker in line:
+                    unresolved_path = line.split(marker, 1)[1].strip()
+                    if unresolved_path:
                         unresolved.append(Path(unresolved_path))
-                    except Exception:
-                        pass
+                    break
     
     if returncode != 0:
         print(f"[SheepIt Pack] WARNING: remap_library_paths returned non-zero exit code: {returncode}")
@@ -724,39 +1173,6 @@ def remap_library_paths(blend_path: Path, copy_map: dict[str, str], common_root:
     return unresolved
 
 
-def pack_all_in_blend(blend_path: Path) -> list[Path]:
-    """Open a blend and pack all external files into it."""
-    script = (
-        "import bpy\n"
-        "from pathlib import Path\n"
-        "blend_dir = Path(bpy.data.filepath).parent\n"
-        "try:\n"
-        "    bpy.ops.file.make_paths_relative(basedir=str(blend_dir))\n"
-        "except Exception:\n"
-        "    pass\n"
-        "try:\n"
-        "    bpy.ops.file.pack_all()\n"
-        "    try:\n"
-        "        fp = bpy.context.preferences.filepaths\n"
-        "        for k in ('use_autopack', 'use_autopack_files', 'use_auto_pack'):\n"
-        "            if hasattr(fp, k):\n"
-        "                try:\n"
-        "                    setattr(fp, k, True)\n"
-        "                except Exception:\n"
-        "                    pass\n"
-        "    except Exception:\n"
-        "        pass\n"
-        "    bpy.ops.wm.save_mainfile(compress=True)\n"
-        "except Exception as e:\n"
-        "    print('Pack all failed:', e)\n"
-    )
-    
-    stdout, stderr, returncode = _run_blender_script(script, blend_path)
-    missing = []
-    # Parse missing files from output if needed
-    return missing
-
-
 def _get_project_size_limit_bytes(context=None):
     """Return project size limit in bytes from scene (per-pack). 0 = no limit (returns None)."""
     try:
@@ -772,154 +1188,103 @@ def _get_project_size_limit_bytes(context=None):
         return 2 * 1024 * 1024 * 1024
 
 
-def pack_linked_in_blend(blend_path: Path, max_size_bytes: Optional[int] = None) -> tuple[list[Path], list[Path]]:
+# Blender's warnings in pack linked output, scanned in one pass: linked files it could
+# not find (missing_* groups hold the path) and files over the 2GB pack limit (size)
+_PACK_OUTPUT_WARNINGS = re.compile(
+    r"Warning, files not found:\s*(?P<missing_listed>.+)"
+    r"|Unable to pack file, source path '(?P<missing_source>[^']+)' not found"
+    r"|File not found:\s*(?P<missing_file>.+)"
+    r"|(?P<size>(?:file[^\n]*?too large|exceeds|over|larger than)[^\n]{0,80}?2\s*GB)",
+    re.IGNORECASE,
+)
+# Quoted .blend path near a size warning
+_BLEND_QUOTED = re.compile(r"['\"]([^'\"]+\.blend)['\"]", re.IGNORECASE)
+
+
+def pack_linked_in_blend(blend_path: Path, max_size_bytes: Optional[int] = None,
+                         session: Optional[BlenderSession] = None) -> tuple[list[Path], list[tuple[Path, int]]]:
     """Open a blend and run Pack Linked (pack libraries), then save with autopack on.
     
     Args:
         blend_path: Path to the blend file.
         max_size_bytes: Max size in bytes for a single linked file (over this = oversized). None = 2GB.
+        session: Optional BlenderSession already open on blend_path
     
     Returns:
-        Tuple of (missing_files: list[Path], oversized_files: list[Path])
+        Tuple of (missing_files: list[Path], oversized_files: list[tuple[Path, int]])
         - missing_files: Files that don't exist and couldn't be packed
-        - oversized_files: Files over max_size_bytes that Blender can't pack
+        - oversized_files: (path, size in bytes) of files over max_size_bytes that Blender can't pack
     """
     if max_size_bytes is None:
         max_size_bytes = 2 * 1024 * 1024 * 1024
     
-    script = (
-        "import bpy\n"
-        "from pathlib import Path\n"
-        "print('=== Pack Linked Operation ===')\n"
-        "print(f'Processing: {bpy.path.basename(bpy.data.filepath)}')\n"
-        "print(f'Libraries found: {len(bpy.data.libraries)}')\n"
-        "missing_files = []\n"
-        "oversized_files = []\n"
-        "for lib in bpy.data.libraries:\n"
-        "    lib_path = Path(lib.filepath)\n"
-        "    if lib.filepath.startswith('//'):\n"
-        "        lib_path = Path(bpy.data.filepath).parent / lib.filepath[2:]\n"
-        "    if not lib_path.exists():\n"
-        "        missing_files.append(str(lib_path))\n"
-        "        print(f'  Library (MISSING): {lib.name}, path: {lib.filepath}')\n"
-        "    else:\n"
-        "        file_size = lib_path.stat().st_size\n"
-        "        file_size_gb = file_size / (1024 * 1024 * 1024)\n"
-        "        if file_size > " + str(max_size_bytes) + ":\n"
-        "            oversized_files.append(str(lib_path))\n"
-        "            print(f'  Library (OVER limit, cannot pack): {lib.name}, path: {lib.filepath}, size: {file_size_gb:.2f} GB')\n"
-        "        else:\n"
-        "            print(f'  Library (found, {file_size_gb:.2f} GB): {lib.name}, path: {lib.filepath}')\n"
-        "if missing_files:\n"
-        "    print(f'WARNING: {len(missing_files)} linked libraries not found and cannot be packed')\n"
-        "if oversized_files:\n"
-        "    print(f'WARNING: {len(oversized_files)} linked libraries are over size limit and cannot be packed by Blender')\n"
-        "try:\n"
-        "    bpy.ops.file.make_paths_relative()\n"
-        "    print('Made paths relative')\n"
-        "except Exception as e:\n"
-        "    print(f'Warning: make_paths_relative failed: {e}')\n"
-        "packed_count = 0\n"
-        "pack_errors = []\n"
-        "try:\n"
-        "    print('Starting pack_libraries()...')\n"
-        "    bpy.ops.file.pack_libraries()\n"
-        "    packed_count = 1\n"
-        "    print('pack_libraries() completed successfully')\n"
-        "except Exception as e:\n"
-        "    error_msg = f'{type(e).__name__}: {str(e)}'\n"
-        "    pack_errors.append(error_msg)\n"
-        "    print(f'Warning: pack_libraries() failed: {error_msg}')\n"
-        "try:\n"
-        "    fp = bpy.context.preferences.filepaths\n"
-        "    for k in ('use_autopack', 'use_autopack_files', 'use_auto_pack'):\n"
-        "        if hasattr(fp, k):\n"
-        "            try:\n"
-        "                setattr(fp, k, True)\n"
-        "            except Exception:\n"
-        "                pass\n"
-        "except Exception:\n"
-        "    pass\n"
-        "print('Saving file...')\n"
-        "bpy.ops.wm.save_mainfile(compress=True)\n"
-        "print(f'=== Pack Linked Complete (packed: {packed_count}, missing: {len(missing_files)}, oversized: {len(oversized_files)}) ===')\n"
-        "for mf in missing_files:\n"
-        "    print(f'MISSING_FILE: {mf}')\n"
-        "for of in oversized_files:\n"
-        "    print(f'OVERSIZED_FILE: {of}')\n"
-        "for err in pack_errors:\n"
-        "    print(f'PACK_ERROR: {err}')\n"
-    )
-    
-    stdout, stderr, returncode = _run_blender_script(script, blend_path, timeout=600)  # 10 minute timeout for pack_linked
-    
-    # Parse missing and oversized files from output
-    missing_files = []
-    oversized_files = []
-    if stdout:
-        for line in stdout.splitlines():
-            if line.startswith('MISSING_FILE:'):
-                missing_path = line.replace('MISSING_FILE:', '').strip()
-                try:
-                    missing_files.append(Path(missing_path))
-                except Exception:
-                    pass
-            elif line.startswith('OVERSIZED_FILE:'):
-                oversized_path = line.replace('OVERSIZED_FILE:', '').strip()
-                try:
-                    oversized_files.append(Path(oversized_path))
-                except Exception:
-                    pass
-    
-    # Also check for Blender's standard missing file warnings
-    combined_output = (stdout or "") + "\n" + (stderr or "")
-    import re
-    # Pattern: "Warning, files not found: //path/to/file.blend"
-    missing_patterns = [
-        r"Warning, files not found:\s*(.+)",
-        r"Unable to pack file, source path '([^']+)' not found",
-        r"File not found:\s*(.+)",
-    ]
-    for pattern in missing_patterns:
-        for match in re.finditer(pattern, combined_output, re.IGNORECASE):
-            missing_path_str = match.group(1).strip()
+    # Parse missing and oversized files line by line as Blender prints them
+    # Dicts used as ordered sets: Blender can report the same file many times
+    missing_files = {}
+    oversized_files = {}  # path -> size in bytes, as stat'ed by the script
+    recent_lines = deque(maxlen=3)  # Context before a size warning
+    size_contexts = []  # Lines around each size warning, resolved after the run if needed
+    size_context_lines = 0  # Lines after a size warning still added to its context
+    pack_errors = []
+    stderr_tail = deque(maxlen=20)  # For error details on failure
+    
+    def _on_line(stream_name: str, line: str):
+        nonlocal size_context_lines
+        line = line.rstrip("\r\n")
+        if stream_name == "stderr":
+            stderr_tail.append(line)
+        if line.startswith('MISSING_FILE:'):
+            missing_files[Path(line[len('MISSING_FILE:'):].strip())] = None
+            return
+        if line.startswith('OVERSIZED_FILE:'):
+            # OVERSIZED_FILE:<size>:<path> (the size never contains ':', Windows paths may)
+            size, _, path = line[len('OVERSIZED_FILE:'):].strip().partition(':')
+            oversized_files[Path(path)] = int(size)
+            return
+        if line.startswith('PACK_ERROR:'):
+            pack_errors.append(line[len('PACK_ERROR:'):].strip())
+            return
+        if size_context_lines:
+            size_context_lines -= 1
+            size_contexts[-1].append(line)
+        # Also check for Blender's standard missing file and size limit warnings
+        for match in _PACK_OUTPUT_WARNINGS.finditer(line):
+            if match.lastgroup == 'size':
+                # 2GB size limit error: keep the surrounding lines to look for the file path
+                size_contexts.append([*recent_lines, line])
+                size_context_lines = 2
+                continue
+            missing_path_str = match.group(match.lastgroup).strip()
             # Handle relative paths (//path)
             if missing_path_str.startswith('//'):
                 try:
-                    # Convert relative path to absolute
-                    blend_dir = blend_path.parent
-                    rel_path = missing_path_str[2:]
-                    missing_path = (blend_dir / rel_path).resolve()
+                    missing_path = (blend_path.parent / missing_path_str[2:]).resolve()
                 except Exception:
                     missing_path = Path(missing_path_str)
             else:
                 missing_path = Path(missing_path_str)
-            if missing_path not in missing_files:
-                missing_files.append(missing_path)
-    
-    # Check for 2GB size limit errors in Blender output
-    size_error_patterns = [
-        r"file.*too large.*2.*GB",
-        r"exceeds.*2.*GB",
-        r"over.*2.*GB",
-        r"larger than.*2.*GB",
-    ]
-    for pattern in size_error_patterns:
-        for match in re.finditer(pattern, combined_output, re.IGNORECASE):
-            # Try to extract file path from context
-            context_start = max(0, match.start() - 200)
-            context_end = min(len(combined_output), match.end() + 200)
-            context = combined_output[context_start:context_end]
-            # Look for file paths in the context
-            path_matches = re.finditer(r"['\"]([^'\"]+\.blend)['\"]", context, re.IGNORECASE)
-            for path_match in path_matches:
-                path_str = path_match.group(1)
+            missing_files[missing_path] = None
+        recent_lines.append(line)
+    
+    _, stderr, returncode = _run_script(
+        _PACK_LINKED_SCRIPT, blend_path, session=session, timeout=600,  # 10 minute timeout for pack_linked
+        script_args=["--max-size-bytes", str(max_size_bytes)], on_line=_on_line,
+    )
+    stderr = stderr or "\n".join(stderr_tail)
+    
+    # Size warnings only need resolving when pack_libraries failed and the script's own
+    # OVERSIZED_FILE markers did not already name the culprits (the common case skips this)
+    if size_contexts and pack_errors and not oversized_files:
+        for context in size_contexts:
+            for path_match in _BLEND_QUOTED.finditer("\n".join(context)):
                 try:
-                    oversized_path = Path(path_str)
-                    if oversized_path.exists() and oversized_path not in oversized_files:
-                        oversized_files.append(oversized_path)
+                    oversized_path = Path(path_match.group(1))
+                    if oversized_path not in oversized_files:
+                        oversized_files[oversized_path] = oversized_path.stat().st_size
                 except Exception:
                     pass
+    missing_files = list(missing_files)
+    oversized_files = list(oversized_files.items())
     
     if missing_files:
         print(f"[SheepIt Pack]   WARNING: {len(missing_files)} linked files could not be packed (files not found):")
@@ -931,9 +1296,8 @@ def pack_linked_in_blend(blend_path: Path, max_size_bytes: Optional[int] = None)
     
     if oversized_files:
         print(f"[SheepIt Pack]   WARNING: {len(oversized_files)} linked files could not be packed (files over size limit):")
-        for of in oversized_files[:5]:  # Show first 5
-            file_size_gb = of.stat().st_size / (1024 * 1024 * 1024) if of.exists() else 0
-            print(f"[SheepIt Pack]     - {of.name if of.name else of} ({file_size_gb:.2f} GB)")
+        for of, size in oversized_files[:5]:  # Show first 5
+            print(f"[SheepIt Pack]     - {of.name if of.name else of} ({size / (1024 * 1024 * 1024):.2f} GB)")
         if len(oversized_files) > 5:
             print(f"[SheepIt Pack]     ... and {len(oversized_files) - 5} more")
         print(f"[SheepIt Pack]   Note: Blender cannot pack linked files over the project size limit. These libraries will remain as external references.")
@@ -947,60 +1311,74 @@ def pack_linked_in_blend(blend_path: Path, max_size_bytes: Optional[int] = None)
     return missing_files, oversized_files
 
 
-def enable_nla_in_blend(blend_path: Path, autopack_on_save: bool = True) -> None:
-    """Open a blend and ensure NLA tracks/strips are enabled and unmuted."""
-    autopack_block = ""
-    if autopack_on_save:
-        autopack_block = (
-            "try:\n"
-            "    fp = bpy.context.preferences.filepaths\n"
-            "    for k in ('use_autopack', 'use_autopack_files', 'use_auto_pack'):\n"
-            "        if hasattr(fp, k):\n"
-            "            try:\n"
-            "                setattr(fp, k, True)\n"
-            "            except Exception:\n"
-            "                pass\n"
-            "except Exception:\n"
-            "    pass\n"
+# Minimum seconds between progress updates; each progress_callback redraws Blender's UI
+_PROGRESS_INTERVAL = 0.1
+
+# Wall time the pack operators aim to spend in one COPY_ASSETS batch per modal tick, and the
+# range the adapted batch size stays in
+_TICK_BUDGET = 0.05
+_MIN_BATCH, _MAX_BATCH = 5, 500
+
+
+class _ProgressThrottle:
+    """Rate limit for progress reporting: ready() is true at most once per interval."""
+    
+    def __init__(self, interval: float = _PROGRESS_INTERVAL):
+        self.interval = interval
+        self._last = 0.0
+    
+    def ready(self, force: bool = False) -> bool:
+        """True if an update is due (or force is set); marks the update as sent."""
+        now = time.monotonic()
+        if not force and now - self._last < self.interval:
+            return False
+        self._last = now
+        return True
+
+
+class _RedrawThrottle:
+    """Tags the Properties editors for redraw, at most on 0.5% progress steps or every 100 ms.
+    
+    The areas are looked up once when the operator starts, and again only if one of them
+    has been freed (e.g. the layout changed); the modal timer redraws anyway, so the
+    throttled ticks only need to keep the progress bar moving.
+    """
+    
+    def __init__(self, context, min_step: float = 0.5, interval: float = 0.1):
+        self._screen = getattr(context, "screen", None)  # None in background mode
+        self.areas = self._find_areas()
+        self.min_step = min_step
+        self.interval = interval
+        self._last_time = 0.0
+        self._last_pct = None
+    
+    def due(self, pct: Optional[float] = None) -> bool:
+        """Whether progress advanced min_step or interval passed since the last redraw."""
+        return time.monotonic() - self._last_time >= self.interval or (
+            pct is not None and self._last_pct is not None and abs(pct - self._last_pct) >= self.min_step
         )
     
-    script = (
-        "import bpy\n"
-        "for obj in bpy.data.objects:\n"
-        "    ad = getattr(obj, 'animation_data', None)\n"
-        "    if not ad:\n"
-        "        continue\n"
-        "    if hasattr(ad, 'use_nla') and not getattr(ad, 'use_nla', True):\n"
-        "        try:\n"
-        "            ad.use_nla = True\n"
-        "        except Exception:\n"
-        "            pass\n"
-        "    tracks = getattr(ad, 'nla_tracks', None)\n"
-        "    if not tracks:\n"
-        "        continue\n"
-        "    for tr in tracks:\n"
-        "        try:\n"
-        "            if hasattr(tr, 'lock') and tr.lock:\n"
-        "                tr.lock = False\n"
-        "            tr.mute = False\n"
-        "            if hasattr(tr, 'is_solo') and tr.is_solo:\n"
-        "                tr.is_solo = False\n"
-        "            for st in getattr(tr, 'strips', []):\n"
-        "                try:\n"
-        "                    if hasattr(st, 'mute') and st.mute:\n"
-        "                        st.mute = False\n"
-        "                    if hasattr(st, 'use_animated_influence') and hasattr(st, 'influence'):\n"
-        "                        if (not getattr(st, 'use_animated_influence')) and float(getattr(st, 'influence', 1.0)) == 0.0:\n"
-        "                            st.influence = 1.0\n"
-        "                except Exception:\n"
-        "                    pass\n"
-        "        except Exception:\n"
-        "            pass\n"
-        f"{autopack_block}"
-        "bpy.ops.wm.save_mainfile(compress=True)\n"
-    )
+    def maybe_redraw(self, pct: Optional[float] = None, force: bool = False) -> None:
+        """Redraw if forced or due()."""
+        if not force and not self.due(pct):
+            return
+        self._last_time = time.monotonic()
+        if pct is not None:
+            self._last_pct = pct
+        for area in self.areas:
+            try:
+                area.tag_redraw()
+            except ReferenceError:
+                self.areas = None  # Torn down with its screen: look them up on the next redraw
+                break
+        if self.areas is None:
+            self.areas = self._find_areas()
     
-    _run_blender_script(script, blend_path)
+    def _find_areas(self) -> list:
+        try:
+            return [a for a in self._screen.areas if a.type == 'PROPERTIES']
+        except (AttributeError, ReferenceError):
+            return []
 
 
 class IncrementalPacker:
@@ -1020,6 +1398,10 @@ class IncrementalPacker:
         self.frame_start = frame_start  # For cache truncation
         self.frame_end = frame_end
         self.frame_step = frame_step
+        # Set once REMAP_PATHS has also written the frame range into top_level_target_blend,
+        # so callers can skip their own apply_frame_range_to_blend pass on it
+        self.frame_range_applied = False
+        self.file_size = None  # Size of file_path as packing left it (pack-and-save only)
         self.temp_blend_path = temp_blend_path  # Temp file used as source (should be copied directly to root)
         self.original_blend_path = original_blend_path  # Original blend file path (for cache lookup)
         self.max_size_bytes = max_size_bytes  # Project size limit in bytes (None = 2GB)
@@ -1035,33 +1417,239 @@ class IncrementalPacker:
         self.top_level_blend_abs = None
         self.all_filepaths = []
         self.common_root = None
+        self._off_root_paths = []  # Paths on other drives than the common root
+        self._total_asset_links = 0  # Asset usages over all libraries (duplicates included)
         
         # File copying state
         self.copied_paths = set()
         self.copy_map = {}
         self.missing_on_copy = []
-        self.assets_to_copy = []  # List of (asset_usage, target_path, common_root) tuples
+        # Assets to copy as parallel lists (index i is one asset), precomputed in PREPARE_COPY_TOP_BLEND
+        # so COPY_ASSETS works on plain strings instead of building Path objects per asset
+        self._asset_objs = []  # asset_usage objects, for copied/missing bookkeeping
+        self._src_strs = []  # Source path strings
+        self._dst_strs = []  # Destination path strings (under the resolved target root)
+        self._in_copy_map = []  # Whether the asset goes into copy_map for remapping
+        self._n_blend_assets = 0  # The first _n_blend_assets entries are the .blend files
+        # Reuse destination files that already match the source (size + mtime); only an existing
+        # target directory can hold them, a fresh temp directory is always empty
+        self._allow_skip = target_path is not None
+        self.assets_skipped = 0
         self.assets_copied = 0
         self.top_level_target_blend = None
+        self._copy_pool = None  # ThreadPoolExecutor used while in COPY_ASSETS
+        self._src_stats = _DirStatCache()
         self.cache_dirs = []  # List of cache directories to truncate
         
         # Blend processing state
         self.blend_deps = None
         self.to_remap = []
+        self._n_remap = 0  # len(to_remap), fixed once FIND_DEPENDENCIES has built it
+        self._exists = {}  # Target blend -> existed when to_remap was built (checked once; also dedups to_remap)
+        self._remap_sizes = {}  # to_remap blend -> size as copied (counted in total_packed_bytes)
         self.nla_index = 0
         self.remap_index = 0
-        self.pack_all_index = 0
         self.pack_linked_index = 0
         
         # Cache truncation state
         self.cache_truncate_index = 0
         
         # Pack linked issues tracking
-        self.oversized_files_all = []  # Collect all oversized files from pack_linked operations
+        self.total_packed_bytes = 0  # Bytes of the blend and asset files at the target (caches not included)
+        self.total_file_count = 0
+        self.oversized_files_all = []  # (path, size in bytes) of all oversized files from pack_linked operations, largest first once complete
+        self._oversized_seen = set()  # Same library can be linked from several blends; report it once
         
-        # Results
-        self.file_path = None
+        # Blender process reused while consecutive steps target the same blend
+        self._session = None
+        self._nla_job = None  # Background Blender enabling NLA in all blends (ENABLE_NLA)
+        self._nla_total = 0
+        self._nla_launched = False  # Set once the NLA job was started (or found nothing to do)
+        
+        # Per-item progress updates and log lines are sent at most every _PROGRESS_INTERVAL
+        self._progress_throttle = _ProgressThrottle()
+        
+        # Path.resolve() results, shared across phases (each resolve walks the filesystem)
+        self._resolve_cache = {}
+        # Source path -> target relpath under common_root (assets and library blends share entries)
+        self._relpath_cache = {}
+        
+        # Results
+        self.file_path = None
         self.error = None
+        # Phase name -> step method, looked up once per tick instead of walking an elif chain
+        self._phase_fns = {
+            'INIT': self._step_init,
+            'FIND_ASSETS': self._step_find_assets,
+            'COLLECT_PATHS': self._step_collect_paths,
+            'FIND_COMMON_ROOT': self._step_find_common_root,
+            'PREPARE_COPY_TOP_BLEND': self._step_prepare_copy_top_blend,
+            'COPY_ASSETS': self._step_copy_assets,
+            'TRUNCATING_CACHES': self._step_truncating_caches,
+            'FIND_DEPENDENCIES': self._step_find_dependencies,
+            'ENABLE_NLA': self._step_enable_nla,
+            'REMAP_PATHS': self._step_remap_paths,
+            'PACK_LINKED': self._step_pack_linked,
+            'COMPLETE': self._step_complete,
+        }
+    
+    def _record_copied(self, i: int, size: int) -> None:
+        """Mark asset i (size bytes) as present at the target and add it to copy_map if it gets remapped."""
+        abspath = self._asset_objs[i].abspath
+        self.copied_paths.add(abspath)
+        self.total_packed_bytes += size
+        self.total_file_count += 1
+        # Add to copy_map for remapping (blend files and image/texture files)
+        # asset_usage abspaths are already resolved (asset_usage.find resolves them), so the
+        # source string is the copy_map key as is
+        if self._in_copy_map[i]:
+            self.copy_map[self._src_strs[i]] = self._dst_strs[i]
+    
+    def packed_size(self) -> Tuple[int, int]:
+        """Return (bytes, file count) at the target: the counted copies plus a walk of the cache dirs only.
+        
+        The to_remap blends are re-saved (compressed) after they are copied, so their current
+        sizes replace the copied ones.
+        """
+        total, count = self.total_packed_bytes, self.total_file_count
+        for blend, copied_size in self._remap_sizes.items():
+            size = _file_size(blend)
+            if size is not None:
+                total += size - copied_size
+        for cache_dir in set(self.cache_dirs):
+            size, n = _dir_size(cache_dir)
+            total += size
+            count += n
+        return total, count
+    
+    def _resolved(self, p: Path) -> Path:
+        """Return p.resolve(), memoized for the lifetime of this packer."""
+        r = self._resolve_cache.get(p)
+        if r is None:
+            r = p.resolve()
+            self._resolve_cache[p] = r
+        return r
+    
+    def _item_progress(self, done: int, total: int, pct_start: float, pct_span: float,
+                       message: str, log_label: Optional[str] = None, name: str = "") -> None:
+        """Report item done/total of a phase, throttled; the last item is always reported.
+        
+        The percentage and the "[done/total] log_label[: name]" log line are only built
+        when an update is actually sent.
+        """
+        if not self._progress_throttle.ready(force=done >= total):
+            return
+        progress_pct = pct_start + (done / total * pct_span) if total else pct_start
+        if self.progress_callback:
+            self.progress_callback(progress_pct, f"{message} ({done}/{total})")
+        if log_label:
+            print(f"[SheepIt Pack]   [{done}/{total}] {log_label}: {name}" if name
+                  else f"[SheepIt Pack]   [{done}/{total}] {log_label}")
+    
+    def _find_dependencies(self) -> None:
+        """Build to_remap: the copied top-level blend plus each copied library blend, once each."""
+        # au.find() already merged find_blend_asset_usage() into asset_usages, and every library
+        # it keys came from the same user_map walk, so its keys are the blend dependencies
+        self.blend_deps = self.asset_usages
+        self.to_remap = []
+        self._exists = {}
+        self._remap_sizes = {}
+            
+        # Add top-level blend (use the copied target path, not the original)
+        top_size = _file_size(self.top_level_target_blend) if self.top_level_target_blend else None
+        if top_size is not None:
+            self._remap_sizes[self.top_level_target_blend] = top_size
+            self.to_remap.append(self.top_level_target_blend)
+            self._exists[self.top_level_target_blend] = True
+            print(f"[SheepIt Pack]   Added top-level blend to remap list: {self.top_level_target_blend.name}")
+            
+        # Add all dependent blend files (each once, even if several libraries map to it)
+        duplicates = 0
+        for lib in self.blend_deps.keys():
+            abs_path = au.library_abspath(lib)
+            if abs_path.suffix.lower() != ".blend":
+                continue
+            rel = self._relpath(abs_path)
+            target_blend = self.target_path / rel
+            if target_blend in self._exists or self._resolved(target_blend) == self.top_level_target_blend:
+                duplicates += 1
+                continue
+            size = _file_size(target_blend)
+            if size is not None:
+                self._remap_sizes[target_blend] = size
+                self.to_remap.append(target_blend)
+                self._exists[target_blend] = True
+                print(f"[SheepIt Pack]   Added dependent blend to remap list: {target_blend.name}")
+            else:
+                self._exists[target_blend] = False
+                print(f"[SheepIt Pack]   WARNING: Dependent blend not found at target: {target_blend}")
+            
+        if duplicates:
+            print(f"[SheepIt Pack]   Skipped {duplicates} duplicate blend entries")
+        self._n_remap = len(self.to_remap)
+        print(f"[SheepIt Pack] Found {self._n_remap} blend files to process")
+        self.nla_index = 0
+    
+    def _start_nla_job(self) -> None:
+        """Start the background Blender that enables NLA in every to_remap blend (once)."""
+        self._nla_launched = True
+        print(f"[SheepIt Pack] Enabling NLA tracks in blend files...")
+        if self.progress_callback:
+            self.progress_callback(50.0 if self.phase == 'ENABLE_NLA' else 45.0, "Enabling NLA tracks...")
+        blends = [b for b in self.to_remap if self._exists.get(b)]
+        self._nla_total = len(blends)
+        if not blends:
+            return
+        # The blend list goes over stdin: many long paths could pass the command line length limit
+        script_args = ["--blends-stdin"] + (["--autopack"] if self.autopack_on_save else [])
+        try:
+            self._nla_job = _BlenderScriptJob(_ENABLE_NLA_SCRIPT, blends[0], script_args=script_args,
+                                              stdin_data=json.dumps([str(b) for b in blends]))
+        except OSError as e:
+            print(f"[SheepIt Pack]   WARNING: Could not start Blender to enable NLA: {e}")
+    
+    def _relpath(self, p: Path) -> Path:
+        """Return compute_target_relpath(p, self.common_root), memoized for the lifetime of this packer."""
+        r = self._relpath_cache.get(p)
+        if r is None:
+            r = compute_target_relpath(p, self.common_root)
+            self._relpath_cache[p] = r
+        return r
+    
+    def _session_for(self, blend_path: Path) -> Optional[BlenderSession]:
+        """Return the packer's BlenderSession, starting it on blend_path if none is running.
+        
+        One Blender process serves remap, pack all and pack linked for every blend (the
+        session opens each blend as scripts target it) instead of one launch per step.
+        """
+        if self._session is not None and self._session.alive:
+            return self._session
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        session = BlenderSession(blend_path)
+        try:
+            session.start()
+        except OSError as e:
+            print(f"[SheepIt Pack]   WARNING: Could not start Blender session ({e}), running scripts one by one")
+            return None
+        self._session = session
+        return session
+    
+    def _shutdown_copy_pool(self) -> None:
+        if self._copy_pool is not None:
+            self._copy_pool.shutdown(wait=True)
+            self._copy_pool = None
+    
+    def close(self) -> None:
+        """Shut down the copy thread pool and Blender processes, if any. Safe to call more than once."""
+        self._shutdown_copy_pool()
+        if self._nla_job is not None:
+            self._nla_job.kill()
+            self._nla_job = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def process_batch(self, batch_size: int = 20) -> Tuple[str, bool]:
         """
@@ -1075,433 +1663,451 @@ class IncrementalPacker:
         if self.cancel_check and self.cancel_check():
             raise InterruptedError("Packing cancelled by user")
         
-        if self.phase == 'INIT':
-            if self.target_path is None:
-                self.target_path = Path(tempfile.mkdtemp(prefix="sheepit_pack_"))
-                print(f"[SheepIt Pack] Created temporary directory: {self.target_path}")
-            else:
-                print(f"[SheepIt Pack] Using provided target path: {self.target_path}")
-            
-            print(f"[SheepIt Pack] Mode: {'COPY_ONLY' if self.copy_only_mode else 'PACK_AND_SAVE'}")
-            self.phase = 'FIND_ASSETS'
-            return ('FIND_ASSETS', False)
+        return self._phase_fns[self.phase](batch_size)
+    
+    def _step_init(self, batch_size: int) -> Tuple[str, bool]:
+        if self.target_path is None:
+            self.target_path = Path(tempfile.mkdtemp(prefix="sheepit_pack_"))
+            print(f"[SheepIt Pack] Created temporary directory: {self.target_path}")
+        else:
+            print(f"[SheepIt Pack] Using provided target path: {self.target_path}")
         
-        elif self.phase == 'FIND_ASSETS':
-            print(f"[SheepIt Pack] Finding asset usages...")
-            if self.progress_callback:
-                self.progress_callback(5.0, "Finding asset usages...")
-            self.asset_usages = au.find()
-            self.top_level_blend_abs = au.library_abspath(None).resolve()
-            print(f"[SheepIt Pack] Found {len(self.asset_usages)} libraries with assets")
-            print(f"[SheepIt Pack] Top-level blend: {self.top_level_blend_abs}")
-            self.phase = 'COLLECT_PATHS'
-            return ('COLLECT_PATHS', False)
-        
-        elif self.phase == 'COLLECT_PATHS':
-            print(f"[SheepIt Pack] Collecting all file paths...")
-            if self.progress_callback:
-                self.progress_callback(10.0, "Collecting file paths...")
-            self.all_filepaths = []
-            self.all_filepaths.extend(au.library_abspath(lib) for lib in self.asset_usages.keys())
-            self.all_filepaths.extend(
-                asset_usage.abspath
-                for asset_usages in self.asset_usages.values()
-                for asset_usage in asset_usages
-            )
-            # Exclude temp file from common root calculation (it's just a source, not part of the project)
-            if self.temp_blend_path:
-                temp_path_resolved = self.temp_blend_path.resolve()
-                self.all_filepaths = [p for p in self.all_filepaths if p.resolve() != temp_path_resolved]
-                print(f"[SheepIt Pack]   Excluded temp file from common root calculation")
-            print(f"[SheepIt Pack] Collected {len(self.all_filepaths)} total file paths")
-            self.phase = 'FIND_COMMON_ROOT'
-            return ('FIND_COMMON_ROOT', False)
-        
-        elif self.phase == 'FIND_COMMON_ROOT':
-            print(f"[SheepIt Pack] Determining common root directory...")
+        print(f"[SheepIt Pack] Mode: {'COPY_ONLY' if self.copy_only_mode else 'PACK_AND_SAVE'}")
+        self.phase = 'FIND_ASSETS'
+        return ('FIND_ASSETS', False)
+    
+    def _step_find_assets(self, batch_size: int) -> Tuple[str, bool]:
+        print(f"[SheepIt Pack] Finding asset usages...")
+        if self.progress_callback:
+            self.progress_callback(5.0, "Finding asset usages...")
+        self.asset_usages = au.find()
+        self.top_level_blend_abs = self._resolved(au.library_abspath(None))
+        print(f"[SheepIt Pack] Found {len(self.asset_usages)} libraries with assets")
+        print(f"[SheepIt Pack] Top-level blend: {self.top_level_blend_abs}")
+        self.phase = 'COLLECT_PATHS'
+        return ('COLLECT_PATHS', False)
+    
+    def _step_collect_paths(self, batch_size: int) -> Tuple[str, bool]:
+        print(f"[SheepIt Pack] Collecting all file paths...")
+        if self.progress_callback:
+            self.progress_callback(10.0, "Collecting file paths...")
+        self.all_filepaths = [au.library_abspath(lib) for lib in self.asset_usages.keys()]
+        self.all_filepaths.extend(
+            asset_usage.abspath
+            for links_to in self.asset_usages.values()
+            for asset_usage in links_to
+        )
+        # Asset links counted from the same pass (everything after the library paths)
+        self._total_asset_links = len(self.all_filepaths) - len(self.asset_usages)
+        # Exclude temp file from common root calculation (it's just a source, not part of the project)
+        if self.temp_blend_path:
+            temp_path_resolved = self._resolved(self.temp_blend_path)
+            self.all_filepaths = [p for p in self.all_filepaths if self._resolved(p) != temp_path_resolved]
+            print(f"[SheepIt Pack]   Excluded temp file from common root calculation")
+        print(f"[SheepIt Pack] Collected {len(self.all_filepaths)} total file paths")
+        self.phase = 'FIND_COMMON_ROOT'
+        return ('FIND_COMMON_ROOT', False)
+    
+    def _step_find_common_root(self, batch_size: int) -> Tuple[str, bool]:
+        print(f"[SheepIt Pack] Determining common root directory...")
+        common_root_str, self._off_root_paths = _fast_common_root(self.all_filepaths)
+        if self._off_root_paths:
+            print(f"[SheepIt Pack] {len(self._off_root_paths)} paths are on other drives and will be placed under DRIVE_/UNC_ folders")
+        if common_root_str is None:
+            common_root_str = str(Path(bpy.data.filepath).parent)
+            print(f"[SheepIt Pack] Common root (fallback): {common_root_str}")
+        
+        if not common_root_str:
+            raise ValueError("Could not find a common root directory for these assets.")
+        
+        self.common_root = Path(common_root_str)
+        print(f"[SheepIt Pack] Using common root: {self.common_root}")
+        self.phase = 'PREPARE_COPY_TOP_BLEND'
+        return ('PREPARE_COPY_TOP_BLEND', False)
+    
+    def _step_prepare_copy_top_blend(self, batch_size: int) -> Tuple[str, bool]:
+        print(f"[SheepIt Pack] Copying top-level blend file...")
+        if self.progress_callback:
+            self.progress_callback(15.0, "Copying top-level blend file...")
+        
+        current_blend_abspath = self.top_level_blend_abs
+        
+        # If this is a temp file, copy it directly to target root with just its filename
+        # This avoids the DRIVE_C path structure issue
+        is_temp_file = (self.temp_blend_path and 
+                      self._resolved(current_blend_abspath) == self._resolved(self.temp_blend_path))
+        
+        if is_temp_file:
+            # Copy temp file directly to target root
+            target_path_file = self.target_path / current_blend_abspath.name
+            print(f"[SheepIt Pack]   Temp file detected, copying directly to target root: {target_path_file.name}")
+        else:
+            current_relpath = self._relpath(current_blend_abspath)
+            print(f"[SheepIt Pack]   Relative path: {current_relpath}")
+            target_path_file = self.target_path / current_relpath
+        
+        if current_blend_abspath not in self.copied_paths:
+            print(f"[SheepIt Pack]   Copying: {current_blend_abspath} -> {target_path_file}")
             try:
-                common_root_str = os.path.commonpath(self.all_filepaths)
-                print(f"[SheepIt Pack] Common root (method 1): {common_root_str}")
-            except ValueError:
-                print(f"[SheepIt Pack] Method 1 failed, trying drive-based approach...")
-                blend_file_drive = Path(bpy.data.filepath).drive if hasattr(Path(bpy.data.filepath), 'drive') else ""
-                project_filepaths = [p for p in self.all_filepaths if getattr(p, "drive", "") == blend_file_drive]
-                if project_filepaths:
-                    common_root_str = os.path.commonpath(project_filepaths)
-                    print(f"[SheepIt Pack] Common root (method 2): {common_root_str}")
-                else:
-                    common_root_str = str(Path(bpy.data.filepath).parent)
-                    print(f"[SheepIt Pack] Common root (fallback): {common_root_str}")
-            
-            if not common_root_str:
-                raise ValueError("Could not find a common root directory for these assets.")
-            
-            self.common_root = Path(common_root_str)
-            print(f"[SheepIt Pack] Using common root: {self.common_root}")
-            self.phase = 'PREPARE_COPY_TOP_BLEND'
-            return ('PREPARE_COPY_TOP_BLEND', False)
+                target_path_file.parent.mkdir(parents=True, exist_ok=True)
+                _fast_copy(current_blend_abspath, target_path_file)
+                self.copied_paths.add(current_blend_abspath)
+                if current_blend_abspath.suffix.lower() == ".blend":
+                    self.copy_map[str(current_blend_abspath)] = str(self._resolved(target_path_file))
+                self.top_level_target_blend = self._resolved(target_path_file)
+                top_size = target_path_file.stat().st_size
+                self.total_packed_bytes += top_size
+                self.total_file_count += 1
+                print(f"[SheepIt Pack]   Copied successfully, size: {top_size} bytes")
+                # Copy caches - use original blend path for cache lookup if temp file
+                cache_source_blend = self.original_blend_path if (is_temp_file and self.original_blend_path) else current_blend_abspath
+                if cache_source_blend:
+                    print(f"[SheepIt Pack]   Copying blend caches from: {cache_source_blend}")
+                    # For COPY_ONLY workflow, filter caches during copy if frame range is specified
+                    filter_during_copy = (self.copy_only_mode and 
+                                         self.frame_start is not None and 
+                                         self.frame_end is not None and 
+                                         self.frame_step is not None)
+                    if filter_during_copy:
+                        print(f"[SheepIt Pack]   Filtering caches to frame range {self.frame_start}-{self.frame_end} (step: {self.frame_step}) during copy...")
+                    copied_cache_dirs = copy_blend_caches(
+                        cache_source_blend, target_path_file, self.missing_on_copy,
+                        frame_start=self.frame_start if filter_during_copy else None,
+                        frame_end=self.frame_end if filter_during_copy else None,
+                        frame_step=self.frame_step if filter_during_copy else None,
+                        copy_map_out=self.copy_map,
+                    )
+                    self.cache_dirs.extend(copied_cache_dirs)
+                    print(f"[SheepIt Pack]   Copied {len(copied_cache_dirs)} cache directories")
+            except Exception as e:
+                print(f"[SheepIt Pack]   ERROR copying top-level blend: {type(e).__name__}: {str(e)}")
+                self.missing_on_copy.append(current_blend_abspath)
         
-        elif self.phase == 'PREPARE_COPY_TOP_BLEND':
-            print(f"[SheepIt Pack] Copying top-level blend file...")
-            if self.progress_callback:
-                self.progress_callback(15.0, "Copying top-level blend file...")
-            
-            current_blend_abspath = self.top_level_blend_abs
-            
-            # If this is a temp file, copy it directly to target root with just its filename
-            # This avoids the DRIVE_C path structure issue
-            is_temp_file = (self.temp_blend_path and 
-                          current_blend_abspath.resolve() == self.temp_blend_path.resolve())
-            
-            if is_temp_file:
-                # Copy temp file directly to target root
-                target_path_file = self.target_path / current_blend_abspath.name
-                print(f"[SheepIt Pack]   Temp file detected, copying directly to target root: {target_path_file.name}")
-            else:
-                try:
-                    current_relpath = current_blend_abspath.relative_to(self.common_root)
-                    print(f"[SheepIt Pack]   Relative path: {current_relpath}")
-                except ValueError:
-                    current_relpath = compute_target_relpath(current_blend_abspath, self.common_root)
-                    print(f"[SheepIt Pack]   Computed relative path: {current_relpath}")
-                target_path_file = self.target_path / current_relpath
-            
-            if current_blend_abspath not in self.copied_paths:
-                print(f"[SheepIt Pack]   Copying: {current_blend_abspath} -> {target_path_file}")
-                try:
-                    target_path_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(current_blend_abspath, target_path_file)
-                    self.copied_paths.add(current_blend_abspath)
-                    if current_blend_abspath.suffix.lower() == ".blend":
-                        self.copy_map[str(current_blend_abspath.resolve())] = str(target_path_file.resolve())
-                    self.top_level_target_blend = target_path_file.resolve()
-                    print(f"[SheepIt Pack]   Copied successfully, size: {target_path_file.stat().st_size} bytes")
-                    # Copy caches - use original blend path for cache lookup if temp file
-                    cache_source_blend = self.original_blend_path if (is_temp_file and self.original_blend_path) else current_blend_abspath
-                    if cache_source_blend:
-                        print(f"[SheepIt Pack]   Copying blend caches from: {cache_source_blend}")
-                        # For COPY_ONLY workflow, filter caches during copy if frame range is specified
-                        filter_during_copy = (self.copy_only_mode and 
-                                             self.frame_start is not None and 
-                                             self.frame_end is not None and 
-                                             self.frame_step is not None)
-                        if filter_during_copy:
-                            print(f"[SheepIt Pack]   Filtering caches to frame range {self.frame_start}-{self.frame_end} (step: {self.frame_step}) during copy...")
-                        copied_cache_dirs = copy_blend_caches(
-                            cache_source_blend, target_path_file, self.missing_on_copy,
-                            frame_start=self.frame_start if filter_during_copy else None,
-                            frame_end=self.frame_end if filter_during_copy else None,
-                            frame_step=self.frame_step if filter_during_copy else None,
-                            copy_map_out=self.copy_map,
-                        )
-                        self.cache_dirs.extend(copied_cache_dirs)
-                        print(f"[SheepIt Pack]   Copied {len(copied_cache_dirs)} cache directories")
-                except Exception as e:
-                    print(f"[SheepIt Pack]   ERROR copying top-level blend: {type(e).__name__}: {str(e)}")
-                    self.missing_on_copy.append(current_blend_abspath)
-            
-            # Prepare asset copy list
-            total_assets = sum(len(links) for links in self.asset_usages.values())
-            print(f"[SheepIt Pack] Preparing to copy {total_assets} asset files...")
-            
-            for lib, links_to in self.asset_usages.items():
-                for asset_usage in links_to:
-                    if asset_usage.abspath in self.copied_paths:
-                        continue
-                    # Skip cache directories: already copied in copy_blend_caches from blend dir;
-                    # including them here would try UNC path and fail with PermissionError.
-                    name = asset_usage.abspath.name
-                    if name.startswith("blendcache_") or name.startswith("cache_") or (
-                        len(asset_usage.abspath.parts) >= 2 and asset_usage.abspath.parts[-2] == "bakes"
-                    ):
-                        continue
-                    try:
-                        # Try to get relative path to common root
-                        asset_relpath = asset_usage.abspath.relative_to(self.common_root)
-                        # Use relative path as-is (even if it's just a filename)
-                        # This preserves the original relative structure
-                    except ValueError:
-                        # Paths are not relative to common root (different drive/UNC), 
-                        # use compute_target_relpath to create DRIVE_C/UNC structure
-                        asset_relpath = compute_target_relpath(asset_usage.abspath, self.common_root)
-                    self.assets_to_copy.append((asset_usage, asset_relpath))
-            
-            self.assets_copied = 0
-            self.phase = 'COPY_ASSETS'
-            return ('COPY_ASSETS', False)
-        
-        elif self.phase == 'COPY_ASSETS':
-            # Copy batch_size assets
-            total_assets = len(self.assets_to_copy)
-            batch_end = min(self.assets_copied + batch_size, total_assets)
-            
-            for i in range(self.assets_copied, batch_end):
-                asset_usage, asset_relpath = self.assets_to_copy[i]
-                
-                if not asset_usage.abspath.exists():
-                    print(f"[SheepIt Pack]   WARNING: Asset does not exist: {asset_usage.abspath}")
-                    self.missing_on_copy.append(asset_usage.abspath)
+        # Prepare asset copy list
+        print(f"[SheepIt Pack] Preparing to copy {self._total_asset_links} asset files...")
+        
+        # Destinations are joined onto the resolved target root instead of resolved one by one;
+        # the strings double as copy_map values. In a fresh temp dir that equals resolving them.
+        # A caller's existing target_path may hold symlinked directories: the joined path then
+        # keeps the link, but still names the copied file, and the remapped blends under the
+        # same root are reached through the same link, so their relative paths agree
+        target_root = str(self._resolved(self.target_path))
+        # Plain string operations per asset; Path objects are only built for off-root paths
+        root_prefix = os.path.join(str(self.common_root), "")
+        # Several libraries can use the same file; plan (copy and count) it once
+        planned = set(self.copied_paths)
+        for lib, links_to in self.asset_usages.items():
+            for asset_usage in links_to:
+                if asset_usage.abspath in planned:
                     continue
-                
-                target_asset_path = self.target_path / asset_relpath
+                planned.add(asset_usage.abspath)
+                src = os.fspath(asset_usage.abspath)
+                parent, name = os.path.split(src)
+                # Skip cache directories: already copied in copy_blend_caches from blend dir;
+                # including them here would try UNC path and fail with PermissionError.
+                if name.startswith(_CACHE_PREFIXES) or os.path.basename(parent) == "bakes":
+                    continue
+                # Relative to common root when possible, otherwise DRIVE_C/UNC structure
+                self._asset_objs.append(asset_usage)
+                self._src_strs.append(src)
+                self._dst_strs.append(os.path.join(target_root, _target_relstr(src, root_prefix)))
+                # Blend files and image/texture files are remapped
+                self._in_copy_map.append(os.path.splitext(name)[1].lower() in _REMAP_EXTS)
+        
+        # Copy blend files first: once they are all in place the NLA job can start on them while
+        # the (usually far larger) rest of the assets is still copying
+        is_blend = [s.lower().endswith(".blend") for s in self._src_strs]
+        order = sorted(range(len(is_blend)), key=lambda i: not is_blend[i])
+        self._asset_objs = [self._asset_objs[i] for i in order]
+        self._src_strs = [self._src_strs[i] for i in order]
+        self._dst_strs = [self._dst_strs[i] for i in order]
+        self._in_copy_map = [self._in_copy_map[i] for i in order]
+        self._n_blend_assets = sum(is_blend)
+        
+        # Create every destination directory once here instead of per asset in COPY_ASSETS
+        parent_dirs = {os.path.dirname(d) for d in self._dst_strs}
+        for d, e in _make_dirs(parent_dirs):
+            print(f"[SheepIt Pack]   WARNING: Could not create directory {d}: {e}")
+        print(f"[SheepIt Pack]   Created {len(parent_dirs)} target directories")
+        
+        self.assets_copied = 0
+        self.phase = 'COPY_ASSETS'
+        return ('COPY_ASSETS', False)
+    
+    def _step_copy_assets(self, batch_size: int) -> Tuple[str, bool]:
+        # Copy batch_size assets
+        total_assets = len(self._src_strs)
+        batch_end = min(self.assets_copied + batch_size, total_assets)
+        
+        if self._copy_pool is None:
+            # Copies are I/O bound; overlapping them hides per-file latency on SSDs and network shares
+            self._copy_pool = ThreadPoolExecutor(max_workers=_COPY_WORKERS, thread_name_prefix="sheepit_copy")
+        
+        src_strs, dst_strs = self._src_strs, self._dst_strs
+        batch = []  # (index, size) of assets to copy in this batch
+        items = []
+        for i in range(self.assets_copied, batch_end):
+            src = src_strs[i]
+            # One stat per asset: existence check, size for the log and metadata for the copy
+            try:
+                st = self._src_stats.stat(src)
+            except FileNotFoundError:
+                print(f"[SheepIt Pack]   WARNING: Asset does not exist: {src}")
+                self.missing_on_copy.append(self._asset_objs[i].abspath)
+                continue
+            except OSError as e:
+                print(f"[SheepIt Pack]   ERROR copying asset {os.path.basename(src)}: {type(e).__name__}: {str(e)}")
+                self.missing_on_copy.append(self._asset_objs[i].abspath)
+                continue
+            if self._allow_skip:
                 try:
-                    target_asset_path.parent.mkdir(parents=True, exist_ok=True)
-                    file_size = asset_usage.abspath.stat().st_size
-                    shutil.copy2(asset_usage.abspath, target_asset_path)
-                    self.copied_paths.add(asset_usage.abspath)
-                    # Add to copy_map for remapping (blend files and image/texture files)
-                    if asset_usage.abspath.suffix.lower() in (".blend", ".png", ".jpg", ".jpeg", ".tga", ".tiff", ".exr", ".hdr", ".bmp", ".dds", ".mp4", ".avi", ".mov", ".usd", ".usdc", ".usda"):
-                        self.copy_map[str(asset_usage.abspath.resolve())] = str(target_asset_path.resolve())
-                    if (i < 5) or (i % 50 == 0):
-                        print(f"[SheepIt Pack]   Copied: {asset_usage.abspath.name} ({file_size} bytes)")
-                except Exception as e:
-                    print(f"[SheepIt Pack]   ERROR copying asset {asset_usage.abspath.name}: {type(e).__name__}: {str(e)}")
-                    self.missing_on_copy.append(asset_usage.abspath)
-            
-            self.assets_copied = batch_end
-            
-            # Update progress
-            progress_pct = 15.0 + (self.assets_copied / total_assets * 30.0) if total_assets > 0 else 15.0
-            if self.progress_callback:
-                self.progress_callback(progress_pct, f"Copying assets... ({self.assets_copied}/{total_assets})")
-            if self.assets_copied % 10 == 0 or self.assets_copied == total_assets:
-                print(f"[SheepIt Pack]   Copied {self.assets_copied}/{total_assets} assets ({progress_pct:.1f}%)...")
-            
-            if self.assets_copied >= total_assets:
-                print(f"[SheepIt Pack] Finished copying assets. Total copied: {len(self.copied_paths)}, Missing: {len(self.missing_on_copy)}")
-                if self.missing_on_copy:
-                    print(f"[SheepIt Pack]   Missing files: {[str(p) for p in self.missing_on_copy[:5]]}...")
-                # Check if we need to truncate caches
-                # Skip truncation for COPY_ONLY workflow if caches were filtered during copy
-                caches_filtered_during_copy = (self.copy_only_mode and 
-                                             self.frame_start is not None and 
-                                             self.frame_end is not None and 
-                                             self.frame_step is not None)
-                if (self.frame_start is not None and self.frame_end is not None and 
-                    self.frame_step is not None and self.cache_dirs and 
-                    not caches_filtered_during_copy):
-                    self.cache_truncate_index = 0
-                    self.phase = 'TRUNCATING_CACHES'
-                    return ('TRUNCATING_CACHES', False)
-                else:
-                    if caches_filtered_during_copy:
-                        print(f"[SheepIt Pack] Caches were filtered during copy, skipping truncation phase")
-                    self.phase = 'FIND_DEPENDENCIES'
-                    return ('FIND_DEPENDENCIES', False)
-            else:
-                return ('COPY_ASSETS', False)  # More batches needed
+                    dst_st = os.stat(dst_strs[i])
+                except OSError:
+                    dst_st = None
+                if dst_st is not None and dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+                    self._record_copied(i, st.st_size)
+                    self.assets_skipped += 1
+                    continue
+            batch.append((i, st.st_size))
+            items.append((src, dst_strs[i], st))
         
-        elif self.phase == 'TRUNCATING_CACHES':
-            if self.cache_truncate_index == 0:
-                print(f"[SheepIt Pack] Truncating caches to frame range {self.frame_start}-{self.frame_end} (step: {self.frame_step})...")
-                if self.progress_callback:
-                    self.progress_callback(45.0, "Truncating caches to frame range...")
-            
-            # Process one cache directory per batch
-            if self.cache_truncate_index < len(self.cache_dirs):
-                cache_dir = self.cache_dirs[self.cache_truncate_index]
-                if cache_dir.exists() and cache_dir.is_dir():
-                    progress_pct = 45.0 + ((self.cache_truncate_index + 1) / len(self.cache_dirs) * 0.5) if self.cache_dirs else 45.0
-                    if self.progress_callback:
-                        self.progress_callback(progress_pct, f"Truncating caches... ({self.cache_truncate_index + 1}/{len(self.cache_dirs)} cache directories)")
-                    print(f"[SheepIt Pack]   [{self.cache_truncate_index + 1}/{len(self.cache_dirs)}] Truncating cache: {cache_dir.name}")
-                    files_removed = truncate_caches_to_frame_range(cache_dir, self.frame_start, self.frame_end, self.frame_step)
-                    print(f"[SheepIt Pack]   Removed {files_removed} cache files outside frame range")
-                self.cache_truncate_index += 1
+        for (i, file_size), (src, dst, error) in zip(batch, _batch_copy(items, make_dirs=False, executor=self._copy_pool)):
+            abspath = self._asset_objs[i].abspath
+            if error is not None:
+                print(f"[SheepIt Pack]   ERROR copying asset {abspath.name}: {type(error).__name__}: {str(error)}")
+                self.missing_on_copy.append(abspath)
+                continue
+            self._record_copied(i, file_size)
+            if (i < 5) or (i % 50 == 0):
+                print(f"[SheepIt Pack]   Copied: {abspath.name} ({file_size} bytes)")
+        
+        self.assets_copied = batch_end
+        
+        self._item_progress(self.assets_copied, total_assets, 15.0, 30.0, "Copying assets...",
+                            "Assets processed")
+        
+        if self.enable_nla and not self._nla_launched and self.assets_copied >= self._n_blend_assets:
+            # Every blend is at the target: find the blends to process and let NLA run
+            # in the background while the remaining assets copy
+            print(f"[SheepIt Pack] All blend files copied, finding blend dependencies...")
+            self._find_dependencies()
+            self._start_nla_job()
+        
+        if self.assets_copied >= total_assets:
+            self._shutdown_copy_pool()
+            print(f"[SheepIt Pack] Finished copying assets. Total copied: {len(self.copied_paths)}, Missing: {len(self.missing_on_copy)}")
+            if self.assets_skipped:
+                print(f"[SheepIt Pack]   {self.assets_skipped} assets were already up to date at the target and not copied again")
+            if self.missing_on_copy:
+                print(f"[SheepIt Pack]   Missing files: {[str(p) for p in self.missing_on_copy[:5]]}...")
+            # Check if we need to truncate caches
+            # Skip truncation for COPY_ONLY workflow if caches were filtered during copy
+            caches_filtered_during_copy = (self.copy_only_mode and 
+                                         self.frame_start is not None and 
+                                         self.frame_end is not None and 
+                                         self.frame_step is not None)
+            if (self.frame_start is not None and self.frame_end is not None and 
+                self.frame_step is not None and self.cache_dirs and 
+                not caches_filtered_during_copy):
+                self.cache_truncate_index = 0
+                self.phase = 'TRUNCATING_CACHES'
                 return ('TRUNCATING_CACHES', False)
             else:
-                print(f"[SheepIt Pack] Finished truncating caches to frame range {self.frame_start}-{self.frame_end}")
+                if caches_filtered_during_copy:
+                    print(f"[SheepIt Pack] Caches were filtered during copy, skipping truncation phase")
                 self.phase = 'FIND_DEPENDENCIES'
                 return ('FIND_DEPENDENCIES', False)
-        
-        elif self.phase == 'FIND_DEPENDENCIES':
-            print(f"[SheepIt Pack] Finding blend dependencies...")
+        else:
+            return ('COPY_ASSETS', False)  # More batches needed
+    
+    def _step_truncating_caches(self, batch_size: int) -> Tuple[str, bool]:
+        if self.cache_truncate_index == 0:
+            print(f"[SheepIt Pack] Truncating caches to frame range {self.frame_start}-{self.frame_end} (step: {self.frame_step})...")
             if self.progress_callback:
-                self.progress_callback(45.0, "Finding blend dependencies...")
-            self.blend_deps = au.find_blend_asset_usage()
-            self.to_remap = []
-            
-            # Add top-level blend (use the copied target path, not the original)
-            if self.top_level_target_blend and self.top_level_target_blend.exists():
-                self.to_remap.append(self.top_level_target_blend)
-                print(f"[SheepIt Pack]   Added top-level blend to remap list: {self.top_level_target_blend.name}")
-            
-            # Add all dependent blend files
-            for lib in self.blend_deps.keys():
-                abs_path = au.library_abspath(lib)
-                if abs_path.suffix.lower() != ".blend":
-                    continue
-                try:
-                    rel = abs_path.relative_to(self.common_root)
-                except ValueError:
-                    rel = compute_target_relpath(abs_path, self.common_root)
-                target_blend = self.target_path / rel
-                if target_blend.exists():
-                    self.to_remap.append(target_blend)
-                    print(f"[SheepIt Pack]   Added dependent blend to remap list: {target_blend.name}")
-                else:
-                    print(f"[SheepIt Pack]   WARNING: Dependent blend not found at target: {target_blend}")
-            
-            print(f"[SheepIt Pack] Found {len(self.to_remap)} blend files to process")
-            self.nla_index = 0
-            self.phase = 'ENABLE_NLA' if self.enable_nla else 'REMAP_PATHS'
-            return (self.phase, False)
-        
-        elif self.phase == 'ENABLE_NLA':
-            if self.nla_index == 0:
-                print(f"[SheepIt Pack] Enabling NLA tracks in blend files...")
+                self.progress_callback(45.0, "Truncating caches to frame range...")
+        
+        # Process one cache directory per batch
+        if self.cache_truncate_index < len(self.cache_dirs):
+            cache_dir = self.cache_dirs[self.cache_truncate_index]
+            if cache_dir.exists() and cache_dir.is_dir():
+                progress_pct = 45.0 + ((self.cache_truncate_index + 1) / len(self.cache_dirs) * 0.5) if self.cache_dirs else 45.0
                 if self.progress_callback:
-                    self.progress_callback(50.0, "Enabling NLA tracks...")
-            
-            # Process one blend file per batch
-            if self.nla_index < len(self.to_remap):
-                blend_to_fix = self.to_remap[self.nla_index]
-                if blend_to_fix.exists():
-                    progress_pct = 50.0 + ((self.nla_index + 1) / len(self.to_remap) * 5.0) if self.to_remap else 50.0
-                    if self.progress_callback:
-                        self.progress_callback(progress_pct, f"Enabling NLA in blend files... ({self.nla_index + 1}/{len(self.to_remap)})")
-                    print(f"[SheepIt Pack]   [{self.nla_index + 1}/{len(self.to_remap)}] Enabling NLA in: {blend_to_fix.name}")
-                    enable_nla_in_blend(blend_to_fix, autopack_on_save=self.autopack_on_save)
+                    self.progress_callback(progress_pct, f"Truncating caches... ({self.cache_truncate_index + 1}/{len(self.cache_dirs)} cache directories)")
+                print(f"[SheepIt Pack]   [{self.cache_truncate_index + 1}/{len(self.cache_dirs)}] Truncating cache: {cache_dir.name}")
+                files_removed = truncate_caches_to_frame_range(cache_dir, self.frame_start, self.frame_end, self.frame_step)
+                print(f"[SheepIt Pack]   Removed {files_removed} cache files outside frame range")
+            self.cache_truncate_index += 1
+            return ('TRUNCATING_CACHES', False)
+        else:
+            print(f"[SheepIt Pack] Finished truncating caches to frame range {self.frame_start}-{self.frame_end}")
+            self.phase = 'FIND_DEPENDENCIES'
+            return ('FIND_DEPENDENCIES', False)
+    
+    def _step_find_dependencies(self, batch_size: int) -> Tuple[str, bool]:
+        print(f"[SheepIt Pack] Finding blend dependencies...")
+        if self.progress_callback:
+            self.progress_callback(45.0, "Finding blend dependencies...")
+        if self.blend_deps is None:  # Not already found for an early NLA start in COPY_ASSETS
+            self._find_dependencies()
+        self.phase = 'ENABLE_NLA' if self.enable_nla else 'REMAP_PATHS'
+        return (self.phase, False)
+    
+    def _step_enable_nla(self, batch_size: int) -> Tuple[str, bool]:
+        # All blends go to one background Blender (one launch instead of one per blend),
+        # usually started in COPY_ASSETS already; each batch collects the NLA_DONE lines so far
+        if not self._nla_launched:
+            self._start_nla_job()
+        if self._nla_job is not None:
+            for line in self._nla_job.poll_lines():
+                if not line.startswith('NLA_DONE:'):
+                    continue
                 self.nla_index += 1
-                return ('ENABLE_NLA', False)
+                self._item_progress(self.nla_index, self._nla_total, 50.0, 5.0, "Enabling NLA in blend files...",
+                                    "Enabled NLA in", os.path.basename(line[len('NLA_DONE:'):]))
+            if not self._nla_job.finished:
+                if time.time() - self._nla_job.started < 300 * self._nla_total:
+                    return ('ENABLE_NLA', False)
+                print(f"[SheepIt Pack]   ERROR: Enabling NLA timed out, continuing without it")
+                self._nla_job.kill()
+            elif self._nla_job.returncode != 0:
+                print(f"[SheepIt Pack]   WARNING: Enable NLA returned non-zero exit code: {self._nla_job.returncode}")
+            self._nla_job = None
+        print(f"[SheepIt Pack] Finished enabling NLA")
+        self.remap_index = 0
+        self.phase = 'REMAP_PATHS'
+        return ('REMAP_PATHS', False)
+    
+    def _step_remap_paths(self, batch_size: int) -> Tuple[str, bool]:
+        # Remap and (unless copy-only) pack all are done in one script run per blend, so each
+        # blend is loaded and saved once for both; pack linked needs every blend finished first
+        pack_all = not self.copy_only_mode
+        if self.remap_index == 0:
+            if pack_all:
+                print(f"[SheepIt Pack] Remapping library paths and packing assets in blend files...")
             else:
-                print(f"[SheepIt Pack] Finished enabling NLA")
-                self.remap_index = 0
-                self.phase = 'REMAP_PATHS'
-                return ('REMAP_PATHS', False)
-        
-        elif self.phase == 'REMAP_PATHS':
-            if self.remap_index == 0:
                 print(f"[SheepIt Pack] Remapping library paths in blend files...")
-                if self.progress_callback:
-                    self.progress_callback(55.0, "Remapping library paths...")
-            
-            # Process one blend file per batch
-            if self.remap_index < len(self.to_remap):
-                blend_to_fix = self.to_remap[self.remap_index]
-                if blend_to_fix.exists():
-                    progress_pct = 55.0 + ((self.remap_index + 1) / len(self.to_remap) * 10.0) if self.to_remap else 55.0
-                    if self.progress_callback:
-                        self.progress_callback(progress_pct, f"Remapping paths... ({self.remap_index + 1}/{len(self.to_remap)})")
-                    print(f"[SheepIt Pack]   [{self.remap_index + 1}/{len(self.to_remap)}] Remapping paths in: {blend_to_fix.name}")
-                    unresolved = remap_library_paths(
-                        blend_to_fix,
-                        self.copy_map,
-                        self.common_root,
-                        self.target_path,
-                        ensure_autopack=self.autopack_on_save,
-                    )
-                    if unresolved:
-                        print(f"[SheepIt Pack]     WARNING: {len(unresolved)} paths could not be remapped in {blend_to_fix.name}")
-                        for up in unresolved[:3]:  # Show first 3
-                            print(f"[SheepIt Pack]       - {up}")
-                        if len(unresolved) > 3:
-                            print(f"[SheepIt Pack]       ... and {len(unresolved) - 3} more")
-                self.remap_index += 1
-                return ('REMAP_PATHS', False)
-            else:
-                print(f"[SheepIt Pack] Finished remapping library paths")
-                if not self.copy_only_mode:
-                    self.pack_all_index = 0
-                    self.phase = 'PACK_ALL'
-                    return ('PACK_ALL', False)
-                else:
-                    self.phase = 'COMPLETE'
-                    return ('COMPLETE', False)
+            if self.progress_callback:
+                self.progress_callback(55.0, "Remapping library paths...")
         
-        elif self.phase == 'PACK_ALL':
-            if self.pack_all_index == 0:
-                print(f"[SheepIt Pack] Packing all assets into blend files...")
-                if self.progress_callback:
-                    self.progress_callback(65.0, "Packing assets into blend files...")
-            
-            # Process one blend file per batch
-            if self.pack_all_index < len(self.to_remap):
-                blend_to_fix = self.to_remap[self.pack_all_index]
-                if blend_to_fix.exists():
-                    progress_pct = 65.0 + ((self.pack_all_index + 1) / len(self.to_remap) * 15.0) if self.to_remap else 65.0
-                    if self.progress_callback:
-                        self.progress_callback(progress_pct, f"Packing assets... ({self.pack_all_index + 1}/{len(self.to_remap)})")
-                    print(f"[SheepIt Pack]   [{self.pack_all_index + 1}/{len(self.to_remap)}] Packing all in: {blend_to_fix.name}")
-                    pack_all_in_blend(blend_to_fix)
-                self.pack_all_index += 1
-                return ('PACK_ALL', False)
-            else:
+        # Process one blend file per batch
+        if self.remap_index < self._n_remap:
+            blend_to_fix = self.to_remap[self.remap_index]
+            if self._exists.get(blend_to_fix):
+                self._item_progress(self.remap_index + 1, self._n_remap, 55.0, 25.0 if pack_all else 10.0,
+                                    "Remapping and packing..." if pack_all else "Remapping paths...",
+                                    "Remapping and packing in" if pack_all else "Remapping paths in",
+                                    blend_to_fix.name)
+                # The top-level blend gets the frame range in the same load/save
+                frame_range = None
+                if (blend_to_fix == self.top_level_target_blend and self.frame_start is not None
+                        and self.frame_end is not None and self.frame_step is not None):
+                    frame_range = (self.frame_start, self.frame_end, self.frame_step)
+                unresolved = remap_library_paths(
+                    blend_to_fix,
+                    self.copy_map,
+                    self.common_root,
+                    self.target_path,
+                    ensure_autopack=self.autopack_on_save,
+                    session=self._session_for(blend_to_fix),
+                    pack_all=pack_all,
+                    frame_range=frame_range,
+                )
+                if frame_range:
+                    self.frame_range_applied = True
+                if unresolved:
+                    print(f"[SheepIt Pack]     WARNING: {len(unresolved)} paths could not be remapped in {blend_to_fix.name}")
+                    for up in unresolved[:3]:  # Show first 3
+                        print(f"[SheepIt Pack]       - {up}")
+                    if len(unresolved) > 3:
+                        print(f"[SheepIt Pack]       ... and {len(unresolved) - 3} more")
+            self.remap_index += 1
+            return ('REMAP_PATHS', False)
+        else:
+            print(f"[SheepIt Pack] Finished remapping library paths")
+            if pack_all:
                 print(f"[SheepIt Pack] Finished packing all assets")
-                if self.run_pack_linked:
-                    self.pack_linked_index = 0
-                    self.phase = 'PACK_LINKED'
-                    return ('PACK_LINKED', False)
-                else:
-                    self.phase = 'COMPLETE'
-                    return ('COMPLETE', False)
-        
-        elif self.phase == 'PACK_LINKED':
-            if self.pack_linked_index == 0:
-                print(f"[SheepIt Pack] Packing linked libraries...")
-                if self.progress_callback:
-                    self.progress_callback(80.0, "Packing linked libraries...")
-            
-            # Process one blend file per batch
-            if self.pack_linked_index < len(self.to_remap):
-                blend_to_fix = self.to_remap[self.pack_linked_index]
-                if blend_to_fix.exists():
-                    progress_pct = 80.0 + ((self.pack_linked_index + 1) / len(self.to_remap) * 15.0) if self.to_remap else 80.0
-                    if self.progress_callback:
-                        self.progress_callback(progress_pct, f"Packing linked... ({self.pack_linked_index + 1}/{len(self.to_remap)})")
-                    print(f"[SheepIt Pack]   [{self.pack_linked_index + 1}/{len(self.to_remap)}] Packing linked in: {blend_to_fix.name}")
-                    print(f"[SheepIt Pack]   Starting pack_linked operation (this may take a while for large files)...")
-                    try:
-                        missing_files, oversized_files = pack_linked_in_blend(blend_to_fix, max_size_bytes=self.max_size_bytes)
-                        # Track oversized files for user reporting
-                        if oversized_files:
-                            self.oversized_files_all.extend(oversized_files)
-                        issues = []
-                        if missing_files:
-                            issues.append(f"{len(missing_files)} missing")
-                        if oversized_files:
-                            issues.append(f"{len(oversized_files)} over size limit")
-                        if issues:
-                            print(f"[SheepIt Pack]   Completed pack_linked for: {blend_to_fix.name} (with {', '.join(issues)} linked files that couldn't be packed)")
-                        else:
-                            print(f"[SheepIt Pack]   Completed pack_linked for: {blend_to_fix.name}")
-                    except Exception as e:
-                        print(f"[SheepIt Pack]   ERROR during pack_linked: {type(e).__name__}: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        # Continue with next file rather than failing completely
-                else:
-                    print(f"[SheepIt Pack]   WARNING: Blend file does not exist: {blend_to_fix}")
-                self.pack_linked_index += 1
+            if self.run_pack_linked:
+                self.pack_linked_index = 0
+                self.phase = 'PACK_LINKED'
                 return ('PACK_LINKED', False)
             else:
-                print(f"[SheepIt Pack] Finished packing linked libraries")
                 self.phase = 'COMPLETE'
                 return ('COMPLETE', False)
+    
+    def _step_pack_linked(self, batch_size: int) -> Tuple[str, bool]:
+        if self.pack_linked_index == 0:
+            print(f"[SheepIt Pack] Packing linked libraries...")
+            if self.progress_callback:
+                self.progress_callback(80.0, "Packing linked libraries...")
         
-        elif self.phase == 'COMPLETE':
-            print(f"[SheepIt Pack] Pack process completed successfully!")
-            print(f"[SheepIt Pack] Output directory: {self.target_path}")
-            
-            # Determine file path for submission
-            if self.copy_only_mode:
-                # For copy-only, we'll create ZIP later in the operator
-                self.file_path = None
+        # Process one blend file per batch
+        if self.pack_linked_index < self._n_remap:
+            blend_to_fix = self.to_remap[self.pack_linked_index]
+            if self._exists.get(blend_to_fix):
+                self._item_progress(self.pack_linked_index + 1, self._n_remap, 80.0, 15.0, "Packing linked...",
+                                    "Packing linked in", blend_to_fix.name)
+                try:
+                    missing_files, oversized_files = pack_linked_in_blend(
+                        blend_to_fix, max_size_bytes=self.max_size_bytes,
+                        session=self._session_for(blend_to_fix),
+                    )
+                    # Track oversized files for user reporting
+                    for of, size in oversized_files:
+                        if of not in self._oversized_seen:
+                            self._oversized_seen.add(of)
+                            self.oversized_files_all.append((of, size))
+                    issues = []
+                    if missing_files:
+                        issues.append(f"{len(missing_files)} missing")
+                    if oversized_files:
+                        issues.append(f"{len(oversized_files)} over size limit")
+                    if issues:
+                        print(f"[SheepIt Pack]   Completed pack_linked for: {blend_to_fix.name} (with {', '.join(issues)} linked files that couldn't be packed)")
+                    else:
+                        print(f"[SheepIt Pack]   Completed pack_linked for: {blend_to_fix.name}")
+                except Exception as e:
+                    print(f"[SheepIt Pack]   ERROR during pack_linked: {type(e).__name__}: {str(e)}")
+                    traceback.print_exc()
+                    # Continue with next file rather than failing completely
             else:
-                # For pack-and-save, return the main target blend file
-                if self.top_level_target_blend and self.top_level_target_blend.exists():
-                    self.file_path = self.top_level_target_blend
-                    print(f"[SheepIt Pack] Target blend file for submission: {self.file_path}")
-                else:
-                    # Fallback: find the first .blend file in target_path
-                    blend_files = list(self.target_path.rglob("*.blend"))
-                    if blend_files:
-                        self.file_path = blend_files[0]
-                        print(f"[SheepIt Pack] Found blend file for submission: {self.file_path}")
-            
-            return ('COMPLETE', True)
+                print(f"[SheepIt Pack]   WARNING: Blend file does not exist: {blend_to_fix}")
+            self.pack_linked_index += 1
+            return ('PACK_LINKED', False)
+        else:
+            print(f"[SheepIt Pack] Finished packing linked libraries")
+            # Largest first, so a truncated report lists the files that matter most
+            self.oversized_files_all.sort(key=lambda item: item[1], reverse=True)
+            self.phase = 'COMPLETE'
+            return ('COMPLETE', False)
+    
+    def _step_complete(self, batch_size: int) -> Tuple[str, bool]:
+        self.close()
+        print(f"[SheepIt Pack] Pack process completed successfully!")
+        print(f"[SheepIt Pack] Output directory: {self.target_path}")
         
-        return (self.phase, False)
+        # Determine file path for submission
+        if self.copy_only_mode:
+            # For copy-only, we'll create ZIP later in the operator
+            self.file_path = None
+        else:
+            # For pack-and-save, return the main target blend file (one stat gives both
+            # existence and the final size)
+            try:
+                self.file_size = os.stat(self.top_level_target_blend).st_size if self.top_level_target_blend else None
+            except OSError:
+                self.file_size = None
+            if self.file_size is not None:
+                self.file_path = self.top_level_target_blend
+                print(f"[SheepIt Pack] Target blend file for submission: {self.file_path}")
+            else:
+                # Fallback: find the first .blend file in target_path
+                first_blend = _first_blend(self.target_path)
+                if first_blend:
+                    self.file_path = first_blend
+                    self.file_size = os.stat(first_blend).st_size
+                    print(f"[SheepIt Pack] Found blend file for submission: {self.file_path}")
+        
+        return ('COMPLETE', True)
 
 
 def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla: bool = True, 
@@ -1521,6 +2127,9 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
     """
     print(f"[SheepIt Pack] Starting pack process: workflow={workflow}, enable_nla={enable_nla}")
     
+    # Reuse destination files that already match the source (size + mtime); only an existing
+    # target directory can hold them, a fresh temp directory is always empty
+    allow_skip = target_path is not None
     if target_path is None:
         target_path = Path(tempfile.mkdtemp(prefix="sheepit_pack_"))
         print(f"[SheepIt Pack] Created temporary directory: {target_path}")
@@ -1541,7 +2150,7 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
     if cancel_check and cancel_check():
         raise InterruptedError("Packing cancelled by user")
     asset_usages = au.find()
-    top_level_blend_abs = au.library_abspath(None).resolve()
+    top_level_blend_abs = au.library_abspath(None)  # Already resolved (and memoized)
     print(f"[SheepIt Pack] Found {len(asset_usages)} libraries with assets")
     print(f"[SheepIt Pack] Top-level blend: {top_level_blend_abs}")
     
@@ -1551,30 +2160,25 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
         progress_callback(10.0, "Collecting file paths...")
     if cancel_check and cancel_check():
         raise InterruptedError("Packing cancelled by user")
-    all_filepaths = []
-    all_filepaths.extend(au.library_abspath(lib) for lib in asset_usages.keys())
+    all_filepaths = [au.library_abspath(lib) for lib in asset_usages.keys()]
     all_filepaths.extend(
         asset_usage.abspath
-        for asset_usages in asset_usages.values()
-        for asset_usage in asset_usages
+        for links_to in asset_usages.values()
+        for asset_usage in links_to
     )
+    # Asset links counted from the same pass (everything after the library paths)
+    total_assets = len(all_filepaths) - len(asset_usages)
     print(f"[SheepIt Pack] Collected {len(all_filepaths)} total file paths")
     
     # Determine common root
     print(f"[SheepIt Pack] Determining common root directory...")
-    try:
-        common_root_str = os.path.commonpath(all_filepaths)
-        print(f"[SheepIt Pack] Common root (method 1): {common_root_str}")
-    except ValueError:
-        print(f"[SheepIt Pack] Method 1 failed, trying drive-based approach...")
-        blend_file_drive = Path(bpy.data.filepath).drive if hasattr(Path(bpy.data.filepath), 'drive') else ""
-        project_filepaths = [p for p in all_filepaths if getattr(p, "drive", "") == blend_file_drive]
-        if project_filepaths:
-            common_root_str = os.path.commonpath(project_filepaths)
-            print(f"[SheepIt Pack] Common root (method 2): {common_root_str}")
-        else:
-            common_root_str = str(Path(bpy.data.filepath).parent)
-            print(f"[SheepIt Pack] Common root (fallback): {common_root_str}")
+    # One prefix scan over the path strings (per drive) instead of commonpath's per-path splitting
+    common_root_str, off_root_paths = _fast_common_root(all_filepaths)
+    if off_root_paths:
+        print(f"[SheepIt Pack] {len(off_root_paths)} paths are on other drives and will be placed under DRIVE_/UNC_ folders")
+    if common_root_str is None:
+        common_root_str = str(Path(bpy.data.filepath).parent)
+        print(f"[SheepIt Pack] Common root (fallback): {common_root_str}")
     
     if not common_root_str:
         raise ValueError("Could not find a common root directory for these assets.")
@@ -1582,6 +2186,15 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
     common_root = Path(common_root_str)
     print(f"[SheepIt Pack] Using common root: {common_root}")
     
+    # Source path -> target relpath, shared by the copy and the to_remap lookup below
+    relpath_cache = {}
+    
+    def _relpath(p: Path) -> Path:
+        r = relpath_cache.get(p)
+        if r is None:
+            r = relpath_cache[p] = compute_target_relpath(p, common_root)
+        return r
+    
     # Copy files
     print(f"[SheepIt Pack] Starting file copy process...")
     if progress_callback:
@@ -1595,12 +2208,8 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
     # Copy top-level blend
     print(f"[SheepIt Pack] Copying top-level blend file...")
     current_blend_abspath = top_level_blend_abs
-    try:
-        current_relpath = current_blend_abspath.relative_to(common_root)
-        print(f"[SheepIt Pack]   Relative path: {current_relpath}")
-    except ValueError:
-        current_relpath = compute_target_relpath(current_blend_abspath, common_root)
-        print(f"[SheepIt Pack]   Computed relative path: {current_relpath}")
+    current_relpath = _relpath(current_blend_abspath)
+    print(f"[SheepIt Pack]   Relative path: {current_relpath}")
     
     top_level_target_blend = None
     if current_blend_abspath not in copied_paths:
@@ -1608,10 +2217,10 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
         print(f"[SheepIt Pack]   Copying: {current_blend_abspath} -> {target_path_file}")
         try:
             target_path_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(current_blend_abspath, target_path_file)
+            _fast_copy(current_blend_abspath, target_path_file)
             copied_paths.add(current_blend_abspath)
             if current_blend_abspath.suffix.lower() == ".blend":
-                copy_map[str(current_blend_abspath.resolve())] = str(target_path_file.resolve())
+                copy_map[str(current_blend_abspath)] = str(target_path_file.resolve())
             top_level_target_blend = target_path_file.resolve()
             print(f"[SheepIt Pack]   Copied successfully, size: {target_path_file.stat().st_size} bytes")
             # Copy caches
@@ -1625,51 +2234,84 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
             print(f"[SheepIt Pack]   ERROR copying top-level blend: {type(e).__name__}: {str(e)}")
             missing_on_copy.append(current_blend_abspath)
     
-    # Copy other assets
-    total_assets = sum(len(links) for links in asset_usages.values())
+    # Copy other assets: stat and plan on this thread, then copy in chunks on a thread pool
     print(f"[SheepIt Pack] Copying {total_assets} asset files...")
-    asset_count = 0
+    pending = []  # (asset abspath, src str, dst str, stat, goes into copy_map) to copy
+    # Destinations are joined onto the resolved target root instead of resolved one by one;
+    # the strings double as copy_map values. In a fresh temp dir that equals resolving them.
+    # A caller's existing target_path may hold symlinked directories: the joined path then
+    # keeps the link, but still names the copied file, and the remapped blends under the
+    # same root are reached through the same link, so their relative paths agree
+    target_root = str(target_path.resolve())
+    root_prefix = os.path.join(common_root_str, "")
+    planned = set(copied_paths)
+    assets_skipped = 0
+    src_stats = _DirStatCache()
     for lib, links_to in asset_usages.items():
         for asset_usage in links_to:
-            if asset_usage.abspath in copied_paths:
+            abspath = asset_usage.abspath
+            if abspath in planned:
                 continue
-            
-            asset_count += 1
-            # Update progress every 10 files or every 1% of total
-            if asset_count % 10 == 0 or (total_assets > 0 and asset_count % max(1, total_assets // 100) == 0):
-                progress_pct = 15.0 + (asset_count / total_assets * 30.0) if total_assets > 0 else 15.0
-                if progress_callback:
-                    progress_callback(progress_pct, f"Copying assets... ({asset_count}/{total_assets})")
-                print(f"[SheepIt Pack]   Copied {asset_count}/{total_assets} assets ({progress_pct:.1f}%)...")
-            if cancel_check and cancel_check():
-                raise InterruptedError("Packing cancelled by user")
-            
+            planned.add(abspath)
+            src = str(abspath)
             try:
-                asset_relpath = asset_usage.abspath.relative_to(common_root)
-            except ValueError:
-                asset_relpath = compute_target_relpath(asset_usage.abspath, common_root)
-            
-            if not asset_usage.abspath.exists():
-                print(f"[SheepIt Pack]   WARNING: Asset does not exist: {asset_usage.abspath}")
-                missing_on_copy.append(asset_usage.abspath)
+                st = src_stats.stat(src)
+            except FileNotFoundError:
+                print(f"[SheepIt Pack]   WARNING: Asset does not exist: {abspath}")
+                missing_on_copy.append(abspath)
                 continue
-            
-            target_asset_path = target_path / asset_relpath
-            try:
-                target_asset_path.parent.mkdir(parents=True, exist_ok=True)
-                file_size = asset_usage.abspath.stat().st_size
-                shutil.copy2(asset_usage.abspath, target_asset_path)
-                copied_paths.add(asset_usage.abspath)
-                # Add to copy_map for remapping (blend files and image/texture files)
-                if asset_usage.abspath.suffix.lower() in (".blend", ".png", ".jpg", ".jpeg", ".tga", ".tiff", ".exr", ".hdr", ".bmp", ".dds", ".mp4", ".avi", ".mov", ".usd", ".usdc", ".usda"):
-                    copy_map[str(asset_usage.abspath.resolve())] = str(target_asset_path.resolve())
+            except OSError as e:
+                print(f"[SheepIt Pack]   ERROR copying asset {abspath.name}: {type(e).__name__}: {str(e)}")
+                missing_on_copy.append(abspath)
+                continue
+            dst = os.path.join(target_root, _target_relstr(src, root_prefix))
+            # Blend files and image/texture files are remapped
+            in_copy_map = os.path.splitext(src)[1].lower() in _REMAP_EXTS
+            if allow_skip:
+                try:
+                    dst_st = os.stat(dst)
+                except OSError:
+                    dst_st = None
+                if dst_st is not None and dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+                    copied_paths.add(abspath)
+                    if in_copy_map:
+                        copy_map[src] = dst
+                    assets_skipped += 1
+                    continue
+            pending.append((abspath, src, dst, st, in_copy_map))
+    
+    # Create every destination directory once, before any copy
+    for d, e in _make_dirs(os.path.dirname(dst) for _, _, dst, _, _ in pending):
+        print(f"[SheepIt Pack]   WARNING: Could not create directory {d}: {e}")
+    
+    asset_count = 0
+    throttle = _ProgressThrottle()
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS, thread_name_prefix="sheepit_copy") as pool:
+        for start in range(0, len(pending), _COPY_CHUNK):
+            if cancel_check and cancel_check():
+                raise InterruptedError("Packing cancelled by user")
+            chunk = pending[start:start + _COPY_CHUNK]
+            results = _batch_copy([(src, dst, st) for _, src, dst, st, _ in chunk], make_dirs=False, executor=pool)
+            for (abspath, src, dst, st, in_copy_map), (_, _, error) in zip(chunk, results):
+                asset_count += 1
+                if error is not None:
+                    print(f"[SheepIt Pack]   ERROR copying asset {abspath.name}: {type(error).__name__}: {str(error)}")
+                    missing_on_copy.append(abspath)
+                    continue
+                copied_paths.add(abspath)
+                if in_copy_map:
+                    copy_map[src] = dst  # asset_usage abspaths are already resolved
                 if asset_count <= 5 or asset_count % 50 == 0:  # Log first 5 and every 50th
-                    print(f"[SheepIt Pack]   Copied: {asset_usage.abspath.name} ({file_size} bytes)")
-            except Exception as e:
-                print(f"[SheepIt Pack]   ERROR copying asset {asset_usage.abspath.name}: {type(e).__name__}: {str(e)}")
-                missing_on_copy.append(asset_usage.abspath)
+                    print(f"[SheepIt Pack]   Copied: {abspath.name} ({st.st_size} bytes)")
+            if throttle.ready(force=asset_count == len(pending)):
+                progress_pct = 15.0 + (asset_count / len(pending) * 30.0)
+                if progress_callback:
+                    progress_callback(progress_pct, f"Copying assets... ({asset_count}/{len(pending)})")
+                print(f"[SheepIt Pack]   Copied {asset_count}/{len(pending)} assets ({progress_pct:.1f}%)...")
     
     print(f"[SheepIt Pack] Finished copying assets. Total copied: {len(copied_paths)}, Missing: {len(missing_on_copy)}")
+    if assets_skipped:
+        print(f"[SheepIt Pack]   {assets_skipped} assets were already up to date at the target and not copied again")
     if missing_on_copy:
         print(f"[SheepIt Pack]   Missing files: {[str(p) for p in missing_on_copy[:5]]}...")  # First 5
     
@@ -1679,94 +2321,97 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
         progress_callback(45.0, "Finding blend dependencies...")
     if cancel_check and cancel_check():
         raise InterruptedError("Packing cancelled by user")
-    blend_deps = au.find_blend_asset_usage()
+    # asset_usages came from au.find(), which already walked find_blend_asset_usage(); its
+    # keys are the same libraries, so the dependency walk is not repeated (library_abspath
+    # is memoized, so the paths are not resolved again either)
     to_remap = []
-    for abs_path in [top_level_blend_abs] + [au.library_abspath(lib) for lib in blend_deps.keys()]:
+    for abs_path in [top_level_blend_abs] + [au.library_abspath(lib) for lib in asset_usages]:
         if abs_path.suffix.lower() != ".blend":
             continue
-        try:
-            rel = abs_path.relative_to(common_root)
-        except ValueError:
-            rel = compute_target_relpath(abs_path, common_root)
-        to_remap.append(target_path / rel)
+        to_remap.append(target_path / _relpath(abs_path))
+    # Several libraries can map to the same target blend; process each file once
+    unique_to_remap = list(dict.fromkeys(to_remap))
+    if len(unique_to_remap) < len(to_remap):
+        print(f"[SheepIt Pack]   Skipped {len(to_remap) - len(unique_to_remap)} duplicate blend entries")
+    to_remap = unique_to_remap
     
     print(f"[SheepIt Pack] Found {len(to_remap)} blend files to process")
+    # Blends the phases below can work on, checked once (nothing removes them in between)
+    existing_blends = [b for b in to_remap if b.exists()]
     
-    # Enable NLA before packing
+    # Remap library paths in one Blender pass per blend that also enables NLA and, when not
+    # copy-only, packs all assets, so each blend is loaded and saved once for all three
+    pack_all = not copy_only_mode
     if enable_nla:
-        print(f"[SheepIt Pack] Enabling NLA tracks in blend files...")
-        if progress_callback:
-            progress_callback(50.0, "Enabling NLA tracks...")
-        for i, blend_to_fix in enumerate(to_remap, 1):
+        print(f"[SheepIt Pack] Enabling NLA tracks while remapping...")
+    print(f"[SheepIt Pack] Remapping library paths in blend files...")
+    if progress_callback:
+        progress_callback(50.0, "Remapping library paths...")
+    if cancel_check and cancel_check():
+        raise InterruptedError("Packing cancelled by user")
+    # One Blender process opens each blend in turn for remap and pack linked, instead of a
+    # launch per blend and step. Kept sequential: a blend being processed loads the library
+    # blends it links, which other iterations rewrite, so parallel runs would race on them
+    session = None
+    if existing_blends:
+        session = BlenderSession(existing_blends[0])
+        try:
+            session.start()
+        except OSError as e:
+            print(f"[SheepIt Pack]   WARNING: Could not start Blender session ({e}), running scripts one by one")
+            session = None
+    try:
+        remap_span = 30.0 if pack_all else 15.0
+        label = "Remapping and packing in" if pack_all else "Remapping paths in"
+        throttle = _ProgressThrottle()
+        for i, blend_to_fix in enumerate(existing_blends, 1):
             if cancel_check and cancel_check():
                 raise InterruptedError("Packing cancelled by user")
-            if blend_to_fix.exists():
-                progress_pct = 50.0 + (i / len(to_remap) * 5.0) if to_remap else 50.0
+            if throttle.ready(force=i == len(existing_blends)):
+                progress_pct = 50.0 + (i / len(existing_blends) * remap_span)
                 if progress_callback:
-                    progress_callback(progress_pct, f"Enabling NLA in blend files... ({i}/{len(to_remap)})")
-                print(f"[SheepIt Pack]   [{i}/{len(to_remap)}] Enabling NLA in: {blend_to_fix.name}")
-                enable_nla_in_blend(blend_to_fix, autopack_on_save=autopack_on_save)
-        print(f"[SheepIt Pack] Finished enabling NLA")
-    
-    # Remap library paths
-    print(f"[SheepIt Pack] Remapping library paths in blend files...")
-    if progress_callback:
-        progress_callback(55.0, "Remapping library paths...")
-    for i, blend_to_fix in enumerate(to_remap, 1):
-        if cancel_check and cancel_check():
-            raise InterruptedError("Packing cancelled by user")
-        if blend_to_fix.exists():
-            progress_pct = 55.0 + (i / len(to_remap) * 10.0) if to_remap else 55.0
-            if progress_callback:
-                progress_callback(progress_pct, f"Remapping paths... ({i}/{len(to_remap)})")
-            print(f"[SheepIt Pack]   [{i}/{len(to_remap)}] Remapping paths in: {blend_to_fix.name}")
+                    progress_callback(progress_pct, f"{label}... ({i}/{len(existing_blends)})")
+                print(f"[SheepIt Pack]   [{i}/{len(existing_blends)}] {label}: {blend_to_fix.name}")
             remap_library_paths(
                 blend_to_fix,
                 copy_map,
                 common_root,
                 target_path,
                 ensure_autopack=autopack_on_save,
+                session=session,
+                pack_all=pack_all,
+                enable_nla=enable_nla,
             )
-    print(f"[SheepIt Pack] Finished remapping library paths")
-    
-    # Pack files if not copy-only
-    if not copy_only_mode:
-        print(f"[SheepIt Pack] Packing all assets into blend files...")
-        if progress_callback:
-            progress_callback(65.0, "Packing assets into blend files...")
-        for i, blend_to_fix in enumerate(to_remap, 1):
-            if cancel_check and cancel_check():
-                raise InterruptedError("Packing cancelled by user")
-            if blend_to_fix.exists():
-                progress_pct = 65.0 + (i / len(to_remap) * 15.0) if to_remap else 65.0
-                if progress_callback:
-                    progress_callback(progress_pct, f"Packing assets... ({i}/{len(to_remap)})")
-                print(f"[SheepIt Pack]   [{i}/{len(to_remap)}] Packing all in: {blend_to_fix.name}")
-                pack_all_in_blend(blend_to_fix)
-        print(f"[SheepIt Pack] Finished packing all assets")
+        print(f"[SheepIt Pack] Finished remapping library paths")
         
-        if run_pack_linked:
+        if pack_all and run_pack_linked:
             print(f"[SheepIt Pack] Packing linked libraries...")
             if progress_callback:
                 progress_callback(80.0, "Packing linked libraries...")
-            for i, blend_to_fix in enumerate(to_remap, 1):
+            max_size_bytes = _get_project_size_limit_bytes()
+            throttle = _ProgressThrottle()
+            for i, blend_to_fix in enumerate(existing_blends, 1):
                 if cancel_check and cancel_check():
                     raise InterruptedError("Packing cancelled by user")
-                if blend_to_fix.exists():
-                    progress_pct = 80.0 + (i / len(to_remap) * 15.0) if to_remap else 80.0
+                if throttle.ready(force=i == len(existing_blends)):
+                    progress_pct = 80.0 + (i / len(existing_blends) * 15.0)
                     if progress_callback:
-                        progress_callback(progress_pct, f"Packing linked... ({i}/{len(to_remap)})")
-                    print(f"[SheepIt Pack]   [{i}/{len(to_remap)}] Packing linked in: {blend_to_fix.name}")
-                    max_size_bytes = _get_project_size_limit_bytes()
-                    missing_files, oversized_files = pack_linked_in_blend(blend_to_fix, max_size_bytes=max_size_bytes)
-                    issues = []
-                    if missing_files:
-                        issues.append(f"{len(missing_files)} missing")
-                    if oversized_files:
-                        issues.append(f"{len(oversized_files)} over 2GB")
-                    if issues:
-                        print(f"[SheepIt Pack]     Note: {', '.join(issues)} linked files could not be packed")
+                        progress_callback(progress_pct, f"Packing linked... ({i}/{len(existing_blends)})")
+                    print(f"[SheepIt Pack]   [{i}/{len(existing_blends)}] Packing linked in: {blend_to_fix.name}")
+                missing_files, oversized_files = pack_linked_in_blend(
+                    blend_to_fix, max_size_bytes=max_size_bytes, session=session,
+                )
+                issues = []
+                if missing_files:
+                    issues.append(f"{len(missing_files)} missing")
+                if oversized_files:
+                    issues.append(f"{len(oversized_files)} over 2GB")
+                if issues:
+                    print(f"[SheepIt Pack]     Note: {', '.join(issues)} linked files could not be packed")
             print(f"[SheepIt Pack] Finished packing linked libraries")
+    finally:
+        if session is not None:
+            session.close()
     
     print(f"[SheepIt Pack] Pack process completed successfully!")
     print(f"[SheepIt Pack] Output directory: {target_path}")
@@ -1784,9 +2429,9 @@ def pack_project(workflow: str, target_path: Optional[Path] = None, enable_nla:
             print(f"[SheepIt Pack] Target blend file for submission: {file_path}")
         else:
             # Fallback: find the first .blend file in target_path
-            blend_files = list(target_path.rglob("*.blend"))
-            if blend_files:
-                file_path = blend_files[0]
+            first_blend = _first_blend(target_path)
+            if first_blend:
+                file_path = first_blend
                 print(f"[SheepIt Pack] Found blend file for submission: {file_path}")
     
     return target_path, file_path
@@ -1843,6 +2488,9 @@ class SHEEPIT_OT_pack_zip(Operator):
         self._temp_dir = None
         self._target_path = None
         self._zip_path = None
+        self._worker = None  # Single worker thread for phases that must not block the UI
+        self._frame_range_future = None  # APPLYING_FRAME_RANGE_TO_PACKED Blender run on the worker
+        self._size_future = None  # VALIDATING_FILE_SIZE directory walk on the worker
         self._frame_start = None
         self._frame_end = None
         self._frame_step = None
@@ -1850,14 +2498,21 @@ class SHEEPIT_OT_pack_zip(Operator):
         self._message = ""
         self._error = None
         self._packer = None  # IncrementalPacker instance
+        self._pending_progress = None  # Latest (progress, message) from the packer, not yet shown
+        self._complete_shown = False  # COMPLETE has displayed 100% for a tick
+        # Phase -> bound handler, resolved once rather than on every timer tick
+        self._phase_handlers = {phase: getattr(self, name) for phase, name in self._PHASE_HANDLERS.items()}
+        self._batch_size = 20  # Assets per packer batch, adapted during COPY_ASSETS
+        # Cancel flag for the packer/ZIP loops: an Event read instead of the is_submitting
+        # RNA property on every check; set by _cleanup or when is_submitting is cleared
+        self._cancel_event = threading.Event()
         
         # Create timer for modal updates
         self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
         
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'PROPERTIES':
-                area.tag_redraw()
+        self._redraw = _RedrawThrottle(context)
+        self._redraw.maybe_redraw(0.0, force=True)
         
         # Start modal operation
         context.window_manager.modal_handler_add(self)
@@ -1867,454 +2522,51 @@ class SHEEPIT_OT_pack_zip(Operator):
         """Legacy execute method - redirects to invoke for modal operation."""
         return self.invoke(context, None)
     
+    # Timer-tick handler method per phase (PACKING covers every PACKING_* sub-phase)
+    _PHASE_HANDLERS = {
+        'INIT': '_h_init',
+        'SAVING_BLEND': '_h_saving_blend',
+        'OVERRIDING_FILEPATH': '_h_overriding_filepath',
+        'PACKING': '_h_packing',
+        'APPLYING_FRAME_RANGE_TO_PACKED': '_h_applying_frame_range_to_packed',
+        'RESTORING_LIBRARY_ABSPATH': '_h_restoring_library_abspath',
+        'VALIDATING_FILE_SIZE': '_h_validating_file_size',
+        'CREATING_ZIP': '_h_creating_zip',
+        'VALIDATING_ZIP_SIZE': '_h_validating_zip_size',
+        'SAVING_FILE': '_h_saving_file',
+        'CLEANUP': '_h_cleanup',
+        'COMPLETE': '_h_complete',
+    }
+    
     def modal(self, context, event):
         """Handle modal events and update progress."""
         submit_settings = context.scene.sheepit_submit
         
         # Debug: Log all events (but filter out noisy ones)
         if event.type not in ('TIMER', 'MOUSEMOVE', 'WINDOW_DEACTIVATE'):
-            print(f"[SheepIt Pack] DEBUG: Modal event received: type={event.type}, value={getattr(event, 'value', 'N/A')}")
+            log.debug("Modal event received: type=%s, value=%s", event.type, getattr(event, 'value', 'N/A'))
         
         # Handle ESC key to cancel
         if event.type == 'ESC':
-            print(f"[SheepIt Pack] DEBUG: ESC key pressed, cancelling")
+            log.debug("ESC key pressed, cancelling")
             self._cleanup(context, cancelled=True)
             self.report({'INFO'}, "Packing cancelled.")
             return {'CANCELLED'}
         
         # Handle timer events
         if event.type == 'TIMER':
+            if not submit_settings.is_submitting:
+                self._cancel_event.set()
             try:
-                print(f"[SheepIt Pack] DEBUG: Modal timer event, current phase: {self._phase}")
-                
-                if self._phase == 'INIT':
-                    print(f"[SheepIt Pack] DEBUG: Entering INIT phase")
-                    submit_settings.submit_progress = 0.0
-                    submit_settings.submit_status_message = "Initializing..."
-                    self._phase = 'SAVING_BLEND'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to SAVING_BLEND phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'SAVING_BLEND':
-                    print(f"[SheepIt Pack] DEBUG: Entering SAVING_BLEND phase")
-                    submit_settings.submit_progress = 5.0
-                    submit_settings.submit_status_message = "Saving current blend state..."
-                    
-                    from .submit_ops import save_current_blend_with_frame_range, apply_frame_range_to_blend
-                    
-                    print(f"[SheepIt Pack] DEBUG: About to call save_current_blend_with_frame_range")
-                    try:
-                        self._temp_blend_path, self._frame_start, self._frame_end, self._frame_step = save_current_blend_with_frame_range(submit_settings)
-                        self._temp_dir = self._temp_blend_path.parent
-                        print(f"[SheepIt Pack] DEBUG: save_current_blend_with_frame_range completed")
-                        print(f"[SheepIt Pack] Saved to temp file: {self._temp_blend_path}")
-                        print(f"[SheepIt Pack] DEBUG: Frame range: {self._frame_start}-{self._frame_end} (step: {self._frame_step})")
-                    except Exception as e:
-                        print(f"[SheepIt Pack] DEBUG: ERROR in SAVING_BLEND: {type(e).__name__}: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        self._error = f"Failed to save current blend state: {str(e)}"
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                    
-                    self._phase = 'APPLYING_FRAME_RANGE'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to APPLYING_FRAME_RANGE phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'APPLYING_FRAME_RANGE':
-                    print(f"[SheepIt Pack] DEBUG: Entering APPLYING_FRAME_RANGE phase")
-                    submit_settings.submit_progress = 10.0
-                    submit_settings.submit_status_message = "Frame range applied."
-                    # Frame range is already applied in save_current_blend_with_frame_range
-                    self._phase = 'OVERRIDING_FILEPATH'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to OVERRIDING_FILEPATH phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'OVERRIDING_FILEPATH':
-                    print(f"[SheepIt Pack] DEBUG: Entering OVERRIDING_FILEPATH phase")
-                    submit_settings.submit_progress = 12.0
-                    submit_settings.submit_status_message = "Preparing for packing..."
-                    
-                    print(f"[SheepIt Pack] DEBUG: Temp file exists: {self._temp_blend_path.exists() if self._temp_blend_path else 'N/A'}")
-                    print(f"[SheepIt Pack] DEBUG: Current bpy.data.filepath: {bpy.data.filepath}")
-                    
-                    # Temporarily override library_abspath to use temp file instead of opening it
-                    # This avoids invalidating the operator instance
-                    au = _get_asset_usage_module()
-                    import functools
-                    
-                    # Store original function
-                    self._original_library_abspath = au.library_abspath
-                    
-                    # Create override function
-                    temp_file_path = self._temp_blend_path.resolve()
-                    def override_library_abspath(lib):
-                        if lib is None:
-                            return temp_file_path
-                        else:
-                            return self._original_library_abspath(lib)
-                    
-                    # Replace the function (clear cache first)
-                    au.library_abspath.cache_clear()
-                    au.library_abspath = override_library_abspath
-                    # Re-apply lru_cache decorator behavior by wrapping
-                    au.library_abspath = functools.lru_cache(maxsize=None)(override_library_abspath)
-                    
-                    print(f"[SheepIt Pack] DEBUG: Overrode library_abspath to use temp file: {temp_file_path}")
-                    
-                    # Initialize IncrementalPacker
-                    def progress_callback(progress_pct, message):
-                        """Update progress during packing."""
-                        # Map packer progress (0-100%) to operator progress (15-61%)
-                        submit_settings.submit_progress = 15.0 + (progress_pct * 0.46)
-                        submit_settings.submit_status_message = message
-                        print(f"[SheepIt Pack] DEBUG: Progress update: {submit_settings.submit_progress:.1f}% - {message}")
-                        # Force UI redraw on every update
-                        for area in context.screen.areas:
-                            if area.type == 'PROPERTIES':
-                                area.tag_redraw()
-                    
-                    def cancel_check():
-                        """Check if user wants to cancel."""
-                        return not submit_settings.is_submitting
-                    
-                    max_size_bytes = _get_project_size_limit_bytes(context)
-                    self._packer = IncrementalPacker(
-                        WorkflowMode.COPY_ONLY,
-                        target_path=None,
-                        enable_nla=False,
-                        progress_callback=progress_callback,
-                        cancel_check=cancel_check,
-                        frame_start=self._frame_start,
-                        frame_end=self._frame_end,
-                        frame_step=self._frame_step,
-                        temp_blend_path=self._temp_blend_path,
-                        original_blend_path=Path(self._original_filepath) if self._original_filepath else None,
-                        max_size_bytes=max_size_bytes,
-                    )
-                    
-                    self._phase = 'PACKING_INIT'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to PACKING_INIT phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'PACKING_INIT' or self._phase.startswith('PACKING_'):
-                    # Handle all packing sub-phases using IncrementalPacker
-                    try:
-                        # Process one batch
-                        next_phase, is_complete = self._packer.process_batch(batch_size=20)
-                        
-                        if is_complete:
-                            # Packing is complete
-                            self._target_path = self._packer.target_path
-                            print(f"[SheepIt Pack] DEBUG: Incremental packing completed")
-                            print(f"[SheepIt Pack] Packed to: {self._target_path}")
-                            context.scene.sheepit_submit.pack_output_path = str(self._target_path)
-                            
-                            # Check for oversized files that couldn't be packed
-                            if self._packer.oversized_files_all:
-                                oversized_list = "\n".join(f"  - {f.name if f.name else f} ({f.stat().st_size / (1024**3):.2f} GB)" 
-                                                          for f in self._packer.oversized_files_all[:10])
-                                if len(self._packer.oversized_files_all) > 10:
-                                    oversized_list += f"\n  ... and {len(self._packer.oversized_files_all) - 10} more"
-                                warning_msg = (
-                                    f"Warning: {len(self._packer.oversized_files_all)} linked file(s) over size limit could not be packed:\n"
-                                    f"{oversized_list}\n\n"
-                                    "Blender cannot pack linked files over the project size limit. These files will remain as external references.\n"
-                                    "To fix: Reduce the size of these files or split them into smaller files."
-                                )
-                                print(f"[SheepIt Pack] {warning_msg}")
-                                # Report as warning (non-blocking)
-                                self.report({'WARNING'}, f"{len(self._packer.oversized_files_all)} linked file(s) over size limit could not be packed")
-                            
-                            self._phase = 'APPLYING_FRAME_RANGE_TO_PACKED'
-                            print(f"[SheepIt Pack] DEBUG: Transitioning to APPLYING_FRAME_RANGE_TO_PACKED phase")
-                        else:
-                            # Continue with next phase from packer (prepend PACKING_ prefix)
-                            self._phase = f'PACKING_{next_phase}'
-                            print(f"[SheepIt Pack] DEBUG: Packing phase: {self._phase}, continuing...")
-                        
-                        return {'RUNNING_MODAL'}
-                    except InterruptedError as e:
-                        print(f"[SheepIt Pack] DEBUG: Packing cancelled by user")
-                        self._cleanup(context, cancelled=True)
-                        self.report({'INFO'}, "Packing cancelled.")
-                        return {'CANCELLED'}
-                    except Exception as e:
-                        print(f"[SheepIt Pack] DEBUG: ERROR in PACKING: {type(e).__name__}: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        self._error = f"Packing failed: {str(e)}"
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                
-                elif self._phase == 'APPLYING_FRAME_RANGE_TO_PACKED':
-                    print(f"[SheepIt Pack] DEBUG: Entering APPLYING_FRAME_RANGE_TO_PACKED phase")
-                    submit_settings.submit_progress = 60.0
-                    submit_settings.submit_status_message = "Applying frame range to target blend..."
-                    
-                    from .submit_ops import apply_frame_range_to_blend
-                    
-                    # Apply frame range only to the target (top-level) blend, not dependent blends
-                    target_blend = self._packer.top_level_target_blend if self._packer else None
-                    if target_blend and target_blend.exists():
-                        print(f"[SheepIt Pack] DEBUG: Applying frame range to target blend: {target_blend.name}")
-                        apply_frame_range_to_blend(target_blend, self._frame_start, self._frame_end, self._frame_step)
-                        for area in context.screen.areas:
-                            if area.type == 'PROPERTIES':
-                                area.tag_redraw()
-                    else:
-                        print(f"[SheepIt Pack] DEBUG: No target blend to apply frame range to")
-                    
-                    self._phase = 'RESTORING_LIBRARY_ABSPATH'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to RESTORING_LIBRARY_ABSPATH phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'RESTORING_LIBRARY_ABSPATH':
-                    print(f"[SheepIt Pack] DEBUG: Entering RESTORING_LIBRARY_ABSPATH phase")
-                    submit_settings.submit_progress = 62.0
-                    submit_settings.submit_status_message = "Restoring file paths..."
-                    
-                    # Restore original library_abspath function
-                    if hasattr(self, '_original_library_abspath'):
-                        au = _get_asset_usage_module()
-                        au.library_abspath.cache_clear()
-                        au.library_abspath = self._original_library_abspath
-                        print(f"[SheepIt Pack] DEBUG: Restored original library_abspath function")
-                    
-                    self._phase = 'VALIDATING_FILE_SIZE'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to VALIDATING_FILE_SIZE phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'VALIDATING_FILE_SIZE':
-                    print(f"[SheepIt Pack] DEBUG: Entering VALIDATING_FILE_SIZE phase (before ZIP)")
-                    submit_settings.submit_progress = 64.0
-                    submit_settings.submit_status_message = "Validating file size..."
-                    
-                    # Estimate packed directory size
-                    total_size = 0
-                    file_count = 0
-                    for root, dirs, files in os.walk(self._target_path):
-                        for file in files:
-                            file_path = Path(root) / file
-                            if file_path.exists():
-                                total_size += file_path.stat().st_size
-                                file_count += 1
-                    
-                    total_size_gb = total_size / (1024 * 1024 * 1024)
-                    print(f"[SheepIt Pack] Estimated packed directory size: {total_size_gb:.2f} GB ({file_count} files)")
-                    max_bytes = _get_project_size_limit_bytes(context)
-                    if max_bytes is not None and total_size > max_bytes:
-                        limit_gb = max_bytes / (1024 * 1024 * 1024)
-                        error_msg = (
-                            f"Estimated packed size ({total_size_gb:.2f} GB) exceeds project limit ({limit_gb:.1f} GB). Cannot create ZIP.\n\n"
-                            "To reduce file size, consider:\n"
-                            "- Optimizing the scene (reduce geometry, simplify materials)\n"
-                            "- Optimizing asset files (compress textures, reduce resolution)\n"
-                            "- Splitting the frame range (render in smaller chunks)\n"
-                            "- Truncating caches to match your selected frame range\n"
-                            "  (Note: Caches are automatically truncated to your selected frame range during packing)"
-                        )
-                        print(f"[SheepIt Pack] ERROR: {error_msg}")
-                        self._error = error_msg
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                    
-                    self._phase = 'CREATING_ZIP'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to CREATING_ZIP phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'CREATING_ZIP':
-                    print(f"[SheepIt Pack] DEBUG: Entering CREATING_ZIP phase")
-                    submit_settings.submit_progress = 65.0
-                    submit_settings.submit_status_message = "Creating ZIP archive..."
-                    
-                    from .submit_ops import create_zip_from_directory
-                    
-                    self._zip_path = self._target_path.parent / f"{self._target_path.name}.zip"
-                    print(f"[SheepIt Pack] DEBUG: Creating ZIP: {self._zip_path}")
-                    print(f"[SheepIt Pack] DEBUG: Source directory: {self._target_path}")
-                    
-                    # Create progress callback for ZIP creation
-                    def zip_progress_callback(progress_pct, message):
-                        """Update progress during ZIP creation."""
-                        # Map 0-100% to 65-80% range
-                        submit_settings.submit_progress = 65.0 + (progress_pct * 0.15)
-                        submit_settings.submit_status_message = message
-                        print(f"[SheepIt Pack] DEBUG: ZIP progress: {submit_settings.submit_progress:.1f}% - {message}")
-                        # Force UI redraw on every update
-                        for area in context.screen.areas:
-                            if area.type == 'PROPERTIES':
-                                area.tag_redraw()
-                    
-                    def zip_cancel_check():
-                        """Check if user wants to cancel."""
-                        return not submit_settings.is_submitting
-                    
-                    try:
-                        exclude_video = getattr(context.scene.sheepit_submit, 'exclude_video_from_zip', False)
-                        create_zip_from_directory(
-                            self._target_path,
-                            self._zip_path,
-                            progress_callback=zip_progress_callback,
-                            cancel_check=zip_cancel_check,
-                            exclude_video=exclude_video,
-                        )
-                        
-                        # Rename ZIP to use blend file name, with suffix only if there's a conflict
-                        # Extract blend file name
-                        if self._original_filepath:
-                            blend_name = Path(self._original_filepath).stem
-                        elif self._temp_blend_path:
-                            blend_name = self._temp_blend_path.stem
-                        else:
-                            blend_name = "untitled"
-                        
-                        # Check if the desired ZIP name already exists in output directory
-                        desired_zip_name = f"{blend_name}.zip"
-                        desired_zip_path = self._output_dir / desired_zip_name
-                        
-                        if desired_zip_path.exists():
-                            # File conflict - add suffix with pack indicator
-                            # Extract pack indicator from temp directory name (e.g., "0t2v99gf" from "sheepit_pack_0t2v99gf")
-                            pack_indicator = self._target_path.name
-                            if pack_indicator.startswith("sheepit_pack_"):
-                                pack_indicator = pack_indicator[len("sheepit_pack_"):]
-                            
-                            # Create new ZIP name with suffix: {blend_name}_{pack_indicator}.zip
-                            new_zip_name = f"{blend_name}_{pack_indicator}.zip"
-                        else:
-                            # No conflict - use simple name
-                            new_zip_name = desired_zip_name
-                        
-                        new_zip_path = self._zip_path.parent / new_zip_name
-                        
-                        # Rename the ZIP file
-                        if self._zip_path.exists():
-                            self._zip_path.rename(new_zip_path)
-                            self._zip_path = new_zip_path
-                            print(f"[SheepIt Pack] Renamed ZIP to: {new_zip_name}")
-                        
-                        submit_settings.submit_progress = 80.0
-                        submit_settings.submit_status_message = "ZIP archive created"
-                        print(f"[SheepIt Pack] DEBUG: ZIP creation completed")
-                        print(f"[SheepIt Pack] Creating ZIP: {self._zip_path}")
-                    except InterruptedError as e:
-                        print(f"[SheepIt Pack] DEBUG: ZIP creation cancelled by user")
-                        self._cleanup(context, cancelled=True)
-                        self.report({'INFO'}, "ZIP creation cancelled.")
-                        return {'CANCELLED'}
-                    except Exception as e:
-                        print(f"[SheepIt Pack] DEBUG: ERROR creating ZIP: {type(e).__name__}: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        self._error = f"ZIP creation failed: {str(e)}"
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                    
-                    self._phase = 'VALIDATING_ZIP_SIZE'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to VALIDATING_ZIP_SIZE phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'VALIDATING_ZIP_SIZE':
-                    print(f"[SheepIt Pack] DEBUG: Entering VALIDATING_ZIP_SIZE phase")
-                    submit_settings.submit_progress = 80.5
-                    submit_settings.submit_status_message = "Validating ZIP size..."
-                    
-                    # Check final ZIP size
-                    if self._zip_path and self._zip_path.exists():
-                        zip_size = self._zip_path.stat().st_size
-                        zip_size_gb = zip_size / (1024 * 1024 * 1024)
-                        print(f"[SheepIt Pack] Final ZIP size: {zip_size_gb:.2f} GB")
-                        max_bytes = _get_project_size_limit_bytes(context)
-                        if max_bytes is not None and zip_size > max_bytes:
-                            limit_gb = max_bytes / (1024 * 1024 * 1024)
-                            error_msg = (
-                                f"ZIP size ({zip_size_gb:.2f} GB) exceeds project limit ({limit_gb:.1f} GB). Cannot submit.\n\n"
-                                "To reduce file size, consider:\n"
-                                "- Optimizing the scene (reduce geometry, simplify materials)\n"
-                                "- Optimizing asset files (compress textures, reduce resolution)\n"
-                                "- Splitting the frame range (render in smaller chunks)\n"
-                                "- Truncating caches to match your selected frame range\n"
-                                "  (Note: Caches are automatically truncated to your selected frame range during packing)"
-                            )
-                            print(f"[SheepIt Pack] ERROR: {error_msg}")
-                            self._error = error_msg
-                            self._cleanup(context, cancelled=True)
-                            self.report({'ERROR'}, self._error)
-                            return {'CANCELLED'}
-                    
-                    self._phase = 'SAVING_FILE'
-                    print(f"[SheepIt Pack] DEBUG: Transitioning to SAVING_FILE phase")
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'SAVING_FILE':
-                    submit_settings.submit_progress = 85.0
-                    submit_settings.submit_status_message = "Saving ZIP to output location..."
-                    
-                    try:
-                        # Ensure output directory exists
-                        self._output_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        # Move ZIP file to output location (use the renamed ZIP path)
-                        final_zip_path = self._output_dir / self._zip_path.name
-                        import shutil
-                        shutil.move(str(self._zip_path), str(final_zip_path))
-                        self._zip_path = final_zip_path
-                        self._output_path = final_zip_path
-                        
-                        print(f"[SheepIt Pack] Saved ZIP file to: {self._output_path}")
-                        self._success = True
-                        self._message = f"ZIP file saved to: {self._output_path}"
-                        
-                        submit_settings.submit_progress = 95.0
-                        submit_settings.submit_status_message = "File saved successfully!"
-                        self._phase = 'CLEANUP'
-                    except Exception as e:
-                        self._error = f"Failed to save file: {str(e)}"
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                    
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'CLEANUP':
-                    submit_settings.submit_progress = 98.0
-                    submit_settings.submit_status_message = "Cleaning up..."
-                    
-                    # Clean up temp file on success
-                    if self._temp_blend_path and self._temp_blend_path.exists():
-                        try:
-                            self._temp_blend_path.unlink()
-                            if self._temp_dir and self._temp_dir.exists():
-                                try:
-                                    self._temp_dir.rmdir()
-                                except Exception:
-                                    pass  # Directory may not be empty
-                            print(f"[SheepIt Pack] Cleaned up temp file: {self._temp_blend_path}")
-                        except Exception as e:
-                            print(f"[SheepIt Pack] WARNING: Could not clean up temp file: {e}")
-                    
-                    self._phase = 'COMPLETE'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'COMPLETE':
-                    submit_settings.submit_progress = 100.0
-                    submit_settings.submit_status_message = "Packing complete!"
-                    
-                    # Small delay to show completion
-                    import time
-                    time.sleep(0.2)
-                    
-                    self._cleanup(context, cancelled=False)
-                    self.report({'INFO'}, f"ZIP file saved to: {self._output_path}")
-                    return {'FINISHED'}
+                log.debug("Modal timer event, current phase: %s", self._phase)
                 
+                # Direct lookup; 'PACKING_<packer phase>' all share one handler
+                handler = self._phase_handlers.get(self._phase)
+                if handler is None and self._phase.startswith('PACKING_'):
+                    handler = self._phase_handlers['PACKING']
+                if handler is not None:
+                    return handler(context, submit_settings)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 self._error = f"Packing failed: {type(e).__name__}: {str(e)}"
                 self._cleanup(context, cancelled=True)
@@ -2323,19 +2575,430 @@ class SHEEPIT_OT_pack_zip(Operator):
         
         return {'RUNNING_MODAL'}
     
+    def _h_init(self, context, submit_settings):
+        """INIT phase."""
+        log.debug("Entering INIT phase")
+        submit_settings.submit_progress = 0.0
+        submit_settings.submit_status_message = "Initializing..."
+        self._phase = 'SAVING_BLEND'
+        log.debug("Transitioning to SAVING_BLEND phase")
+        return {'RUNNING_MODAL'}
+    
+    def _h_saving_blend(self, context, submit_settings):
+        """SAVING_BLEND phase."""
+        log.debug("Entering SAVING_BLEND phase")
+        submit_settings.submit_progress = 5.0
+        submit_settings.submit_status_message = "Saving current blend state..."
+        
+        log.debug("About to call save_current_blend_with_frame_range")
+        try:
+            self._temp_blend_path, self._frame_start, self._frame_end, self._frame_step = save_current_blend_with_frame_range(submit_settings)
+            # Resolved once here; the override, the packer and cleanup all use this path
+            self._temp_blend_path = self._temp_blend_path.resolve()
+            self._temp_dir = self._temp_blend_path.parent
+            log.debug("save_current_blend_with_frame_range completed")
+            print(f"[SheepIt Pack] Saved to temp file: {self._temp_blend_path}")
+            log.debug("Frame range: %s-%s (step: %s)", self._frame_start, self._frame_end, self._frame_step)
+        except Exception as e:
+            log.warning("ERROR in SAVING_BLEND: %s: %s", type(e).__name__, str(e))
+            traceback.print_exc()
+            self._error = f"Failed to save current blend state: {str(e)}"
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+        
+        # The frame range is already applied by save_current_blend_with_frame_range, and
+        # the override below is cheap: go on to it in this tick, saving two timer ticks
+        self._phase = 'OVERRIDING_FILEPATH'
+        log.debug("Transitioning to OVERRIDING_FILEPATH phase")
+        return self._h_overriding_filepath(context, submit_settings)
+    
+    def _h_overriding_filepath(self, context, submit_settings):
+        """OVERRIDING_FILEPATH phase."""
+        log.debug("Entering OVERRIDING_FILEPATH phase")
+        submit_settings.submit_progress = 12.0
+        submit_settings.submit_status_message = "Preparing for packing..."
+        
+        log.debug("Temp file exists: %s", self._temp_blend_path.exists() if self._temp_blend_path else 'N/A')
+        log.debug("Current bpy.data.filepath: %s", bpy.data.filepath)
+        
+        # Temporarily override library_abspath to use temp file instead of opening it
+        # This avoids invalidating the operator instance
+        
+        # Store original function
+        self._original_library_abspath = au.library_abspath
+        
+        # Build the override first, then swap it in with one assignment
+        temp_file_path = self._temp_blend_path  # Resolved in SAVING_BLEND
+        override = _library_abspath_override(self._original_library_abspath, temp_file_path)
+        self._original_library_abspath.cache_clear()
+        au.library_abspath = override
+        
+        log.debug("Overrode library_abspath to use temp file: %s", temp_file_path)
+        
+        # Initialize IncrementalPacker
+        def progress_callback(progress_pct, message):
+            """Record packing progress; _h_packing publishes the latest one once per tick."""
+            # Map packer progress (0-100%) to operator progress (15-61%)
+            self._pending_progress = (15.0 + (progress_pct * 0.46), message)
+        
+        max_size_bytes = _get_project_size_limit_bytes(context)
+        self._packer = IncrementalPacker(
+            WorkflowMode.COPY_ONLY,
+            target_path=None,
+            enable_nla=False,
+            progress_callback=progress_callback,
+            cancel_check=self._cancel_event.is_set,
+            frame_start=self._frame_start,
+            frame_end=self._frame_end,
+            frame_step=self._frame_step,
+            temp_blend_path=self._temp_blend_path,
+            original_blend_path=Path(self._original_filepath) if self._original_filepath else None,
+            max_size_bytes=max_size_bytes,
+        )
+        
+        self._phase = 'PACKING_INIT'
+        log.debug("Transitioning to PACKING_INIT phase")
+        return {'RUNNING_MODAL'}
+    
+    def _h_packing(self, context, submit_settings):
+        """PACKING_* phase."""
+        # Handle all packing sub-phases using IncrementalPacker
+        try:
+            # Process one batch; COPY_ASSETS batches are resized toward _TICK_BUDGET per tick
+            # (larger on fast disks, smaller on slow shares so the UI stays responsive)
+            adapt = self._phase == 'PACKING_COPY_ASSETS'
+            started = time.monotonic()
+            next_phase, is_complete = self._packer.process_batch(batch_size=self._batch_size)
+            if adapt:
+                elapsed = max(time.monotonic() - started, 1e-3)
+                self._batch_size = max(_MIN_BATCH, min(_MAX_BATCH, int(self._batch_size * _TICK_BUDGET / elapsed)))
+            
+            # A batch can report progress many times: write only the last report to the
+            # (RNA) progress properties
+            if self._pending_progress is not None:
+                submit_settings.submit_progress, submit_settings.submit_status_message = self._pending_progress
+                self._pending_progress = None
+                log.debug("Progress update: %.1f%% - %s", submit_settings.submit_progress, submit_settings.submit_status_message)
+                self._redraw.maybe_redraw(submit_settings.submit_progress, force=is_complete)
+            
+            if is_complete:
+                # Packing is complete
+                self._target_path = self._packer.target_path
+                log.debug("Incremental packing completed")
+                print(f"[SheepIt Pack] Packed to: {self._target_path}")
+                context.scene.sheepit_submit.pack_output_path = str(self._target_path)
+                # ZIP naming: blend file name, plus the pack indicator (e.g. "0t2v99gf" from
+                # "sheepit_pack_0t2v99gf") if that name is already taken in the output dir
+                if self._original_filepath:
+                    self._blend_name = Path(self._original_filepath).stem
+                elif self._temp_blend_path:
+                    self._blend_name = self._temp_blend_path.stem
+                else:
+                    self._blend_name = "untitled"
+                self._pack_indicator = self._target_path.name.removeprefix("sheepit_pack_")
+                
+                # Check for oversized files that couldn't be packed
+                if self._packer.oversized_files_all:
+                    # The full file list is only built when a warning would be emitted
+                    if log.isEnabledFor(logging.WARNING):
+                        log.warning("%s", _oversized_warning(self._packer.oversized_files_all))
+                    # Report as warning (non-blocking)
+                    self.report({'WARNING'}, f"{len(self._packer.oversized_files_all)} linked file(s) over size limit could not be packed")
+                
+                self._phase = 'APPLYING_FRAME_RANGE_TO_PACKED'
+                log.debug("Transitioning to APPLYING_FRAME_RANGE_TO_PACKED phase")
+            else:
+                # Continue with next phase from packer (prepend PACKING_ prefix)
+                self._phase = f'PACKING_{next_phase}'
+                log.debug("Packing phase: %s, continuing...", self._phase)
+            
+            return {'RUNNING_MODAL'}
+        except InterruptedError as e:
+            log.debug("Packing cancelled by user")
+            self._cleanup(context, cancelled=True)
+            self.report({'INFO'}, "Packing cancelled.")
+            return {'CANCELLED'}
+        except Exception as e:
+            log.warning("ERROR in PACKING: %s: %s", type(e).__name__, str(e))
+            traceback.print_exc()
+            self._error = f"Packing failed: {str(e)}"
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+    
+    def _h_applying_frame_range_to_packed(self, context, submit_settings):
+        """APPLYING_FRAME_RANGE_TO_PACKED phase."""
+        log.debug("Entering APPLYING_FRAME_RANGE_TO_PACKED phase")
+        submit_settings.submit_progress = 60.0
+        submit_settings.submit_status_message = "Applying frame range to target blend..."
+        
+        # Apply frame range only to the target (top-level) blend, not dependent blends;
+        # the Blender run happens on the worker and is picked up on a later tick
+        if self._frame_range_future is None:
+            target_blend = self._packer.top_level_target_blend if self._packer else None
+            if self._packer and self._packer.frame_range_applied:
+                log.debug("Frame range already applied while remapping paths")
+            elif target_blend and target_blend.exists():
+                log.debug("Applying frame range to target blend: %s", target_blend.name)
+                self._frame_range_future = self._submit_to_worker(
+                    apply_frame_range_to_blend, target_blend, self._frame_start, self._frame_end, self._frame_step)
+                self._redraw.maybe_redraw(submit_settings.submit_progress)
+                return {'RUNNING_MODAL'}
+            else:
+                log.debug("No target blend to apply frame range to")
+        elif not self._frame_range_future.done():
+            return {'RUNNING_MODAL'}
+        else:
+            self._frame_range_future.result()
+        
+        self._phase = 'RESTORING_LIBRARY_ABSPATH'
+        log.debug("Transitioning to RESTORING_LIBRARY_ABSPATH phase")
+        return {'RUNNING_MODAL'}
+    
+    def _h_restoring_library_abspath(self, context, submit_settings):
+        """RESTORING_LIBRARY_ABSPATH phase."""
+        log.debug("Entering RESTORING_LIBRARY_ABSPATH phase")
+        submit_settings.submit_progress = 62.0
+        submit_settings.submit_status_message = "Restoring file paths..."
+        
+        # Restore original library_abspath function
+        if hasattr(self, '_original_library_abspath'):
+            au.library_abspath = self._original_library_abspath
+            del self._original_library_abspath  # Restored: nothing left for _cleanup to undo
+            log.debug("Restored original library_abspath function")
+        
+        self._phase = 'VALIDATING_FILE_SIZE'
+        log.debug("Transitioning to VALIDATING_FILE_SIZE phase")
+        return {'RUNNING_MODAL'}
+    
+    def _h_validating_file_size(self, context, submit_settings):
+        """VALIDATING_FILE_SIZE phase."""
+        log.debug("Entering VALIDATING_FILE_SIZE phase (before ZIP)")
+        submit_settings.submit_progress = 64.0
+        submit_settings.submit_status_message = "Validating file size..."
+        
+        # Estimate packed directory size from the packer's copy counts; only the cache
+        # dirs are walked, on a worker thread so the timer keeps ticking (UI redraws,
+        # ESC works) and picks the result up once it is done
+        if self._size_future is None:
+            size_fn = self._packer.packed_size if self._packer else (lambda: _dir_size(self._target_path))
+            self._size_future = self._submit_to_worker(size_fn)
+            return {'RUNNING_MODAL'}
+        if not self._size_future.done():
+            return {'RUNNING_MODAL'}
+        total_size, file_count = self._size_future.result()
+        
+        total_size_gb = total_size / (1024 * 1024 * 1024)
+        print(f"[SheepIt Pack] Estimated packed directory size: {total_size_gb:.2f} GB ({file_count} files)")
+        max_bytes = _get_project_size_limit_bytes(context)
+        if max_bytes is not None and total_size > max_bytes:
+            limit_gb = max_bytes / (1024 * 1024 * 1024)
+            error_msg = (
+                f"Estimated packed size ({total_size_gb:.2f} GB) exceeds project limit ({limit_gb:.1f} GB). Cannot create ZIP.\n\n"
+                "To reduce file size, consider:\n"
+                "- Optimizing the scene (reduce geometry, simplify materials)\n"
+                "- Optimizing asset files (compress textures, reduce resolution)\n"
+                "- Splitting the frame range (render in smaller chunks)\n"
+                "- Truncating caches to match your selected frame range\n"
+                "  (Note: Caches are automatically truncated to your selected frame range during packing)"
+            )
+            print(f"[SheepIt Pack] ERROR: {error_msg}")
+            self._error = error_msg
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+        
+        self._phase = 'CREATING_ZIP'
+        log.debug("Transitioning to CREATING_ZIP phase")
+        return {'RUNNING_MODAL'}
+    
+    def _h_creating_zip(self, context, submit_settings):
+        """CREATING_ZIP phase."""
+        log.debug("Entering CREATING_ZIP phase")
+        submit_settings.submit_progress = 65.0
+        submit_settings.submit_status_message = "Creating ZIP archive..."
+        
+        # Write the ZIP straight into the output directory under a .partial name, so
+        # SAVING_FILE is a rename rather than a copy of the whole archive. The pack
+        # indicator keeps the name unique; SAVING_FILE resolves the final name.
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._zip_path = self._output_dir / f"{self._blend_name}_{self._pack_indicator}.zip.partial"
+        log.debug("Creating ZIP: %s", self._zip_path)
+        log.debug("Source directory: %s", self._target_path)
+        
+        # Create progress callback for ZIP creation
+        def zip_progress_callback(progress_pct, message):
+            """Update progress during ZIP creation."""
+            # Map 0-100% to 65-80% range; skip reports that would not be redrawn yet
+            pct = 65.0 + (progress_pct * 0.15)
+            if progress_pct < 100.0 and not self._redraw.due(pct):
+                return
+            submit_settings.submit_progress = pct
+            submit_settings.submit_status_message = message
+            log.debug("ZIP progress: %.1f%% - %s", pct, message)
+            self._redraw.maybe_redraw(pct, force=True)
+        
+        try:
+            exclude_video = getattr(context.scene.sheepit_submit, 'exclude_video_from_zip', False)
+            create_zip_from_directory(
+                self._target_path,
+                self._zip_path,
+                progress_callback=zip_progress_callback,
+                cancel_check=self._cancel_event.is_set,
+                exclude_video=exclude_video,
+            )
+
+            
+            submit_settings.submit_progress = 80.0
+            submit_settings.submit_status_message = "ZIP archive created"
+            log.debug("ZIP creation completed")
+            print(f"[SheepIt Pack] Creating ZIP: {self._zip_path}")
+        except InterruptedError as e:
+            log.debug("ZIP creation cancelled by user")
+            self._cleanup(context, cancelled=True)
+            self.report({'INFO'}, "ZIP creation cancelled.")
+            return {'CANCELLED'}
+        except Exception as e:
+            log.warning("ERROR creating ZIP: %s: %s", type(e).__name__, str(e))
+            traceback.print_exc()
+            self._error = f"ZIP creation failed: {str(e)}"
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+        
+        self._phase = 'VALIDATING_ZIP_SIZE'
+        log.debug("Transitioning to VALIDATING_ZIP_SIZE phase")
+        return {'RUNNING_MODAL'}
+    
+    def _h_validating_zip_size(self, context, submit_settings):
+        """VALIDATING_ZIP_SIZE phase."""
+        log.debug("Entering VALIDATING_ZIP_SIZE phase")
+        submit_settings.submit_progress = 80.5
+        submit_settings.submit_status_message = "Validating ZIP size..."
+        
+        # Check final ZIP size
+        try:
+            zip_size = self._zip_path.stat().st_size if self._zip_path else None
+        except FileNotFoundError:
+            zip_size = None
+        if zip_size is not None:
+            zip_size_gb = zip_size / (1024 * 1024 * 1024)
+            print(f"[SheepIt Pack] Final ZIP size: {zip_size_gb:.2f} GB")
+            max_bytes = _get_project_size_limit_bytes(context)
+            if max_bytes is not None and zip_size > max_bytes:
+                limit_gb = max_bytes / (1024 * 1024 * 1024)
+                error_msg = (
+                    f"ZIP size ({zip_size_gb:.2f} GB) exceeds project limit ({limit_gb:.1f} GB). Cannot submit.\n\n"
+                    "To reduce file size, consider:\n"
+                    "- Optimizing the scene (reduce geometry, simplify materials)\n"
+                    "- Optimizing asset files (compress textures, reduce resolution)\n"
+                    "- Splitting the frame range (render in smaller chunks)\n"
+                    "- Truncating caches to match your selected frame range\n"
+                    "  (Note: Caches are automatically truncated to your selected frame range during packing)"
+                )
+                print(f"[SheepIt Pack] ERROR: {error_msg}")
+                self._error = error_msg
+                self._cleanup(context, cancelled=True)
+                self.report({'ERROR'}, self._error)
+                return {'CANCELLED'}
+        
+        self._phase = 'SAVING_FILE'
+        log.debug("Transitioning to SAVING_FILE phase")
+        return {'RUNNING_MODAL'}
+    
+    def _h_saving_file(self, context, submit_settings):
+        """SAVING_FILE phase."""
+        try:
+            submit_settings.submit_progress = 85.0
+            submit_settings.submit_status_message = "Saving ZIP to output location..."
+            # The ZIP was written into the output directory: rename it to the blend file
+            # name, or keep {blend_name}_{pack_indicator}.zip if that name is taken
+            final_zip_path = self._output_dir / f"{self._blend_name}.zip"
+            try:
+                _rename_no_clobber(self._zip_path, final_zip_path)
+            except FileExistsError:
+                final_zip_path = self._zip_path.with_suffix('')
+                os.replace(self._zip_path, final_zip_path)
+            self._zip_path = final_zip_path
+            self._output_path = final_zip_path
+            
+            print(f"[SheepIt Pack] Saved ZIP file to: {self._output_path}")
+            self._success = True
+            self._message = f"ZIP file saved to: {self._output_path}"
+            
+            submit_settings.submit_progress = 95.0
+            submit_settings.submit_status_message = "File saved successfully!"
+            self._phase = 'CLEANUP'
+        except Exception as e:
+            self._error = f"Failed to save file: {str(e)}"
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+        
+        return {'RUNNING_MODAL'}
+    
+    def _h_cleanup(self, context, submit_settings):
+        """CLEANUP phase."""
+        submit_settings.submit_progress = 98.0
+        submit_settings.submit_status_message = "Cleaning up..."
+        
+        # Clean up temp file on success, in the background: deleting a multi-GB blend
+        # can take a while and nothing waits on it
+        if self._temp_blend_path:
+            threading.Thread(target=_remove_temp_blend, args=(self._temp_blend_path, self._temp_dir),
+                             daemon=True).start()
+        
+        self._phase = 'COMPLETE'
+        return {'RUNNING_MODAL'}
+    
+    def _h_complete(self, context, submit_settings):
+        """COMPLETE phase."""
+        if not self._complete_shown:
+            # Show completion for one timer tick (without blocking the UI) before finishing
+            self._complete_shown = True
+            submit_settings.submit_progress = 100.0
+            submit_settings.submit_status_message = "Packing complete!"
+            self._redraw.maybe_redraw(force=True)
+            return {'RUNNING_MODAL'}
+        
+        self._cleanup(context, cancelled=False)
+        self.report({'INFO'}, f"ZIP file saved to: {self._output_path}")
+        return {'FINISHED'}
+
+    def _submit_to_worker(self, fn, *args):
+        """Run fn(*args) on the operator's worker thread; the caller polls the returned future."""
+        if self._worker is None:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheepit_pack_worker")
+        return self._worker.submit(fn, *args)
+    
     def _cleanup(self, context, cancelled=False):
         """Clean up progress properties and timer."""
         submit_settings = context.scene.sheepit_submit
+        if cancelled and getattr(self, '_cancel_event', None):
+            self._cancel_event.set()
+        
+        # Stop any Blender session the packer still holds (cancel/error mid-pack)
+        if getattr(self, '_packer', None):
+            self._packer.close()
+        if getattr(self, '_worker', None):
+            self._worker.shutdown(wait=False, cancel_futures=True)
+            self._worker = None
+        # Remove a ZIP left half-written in the output directory
+        zip_path = getattr(self, '_zip_path', None)
+        if cancelled and zip_path and zip_path.suffix == '.partial':
+            try:
+                zip_path.unlink()
+            except OSError:
+                pass
         
         # Restore original library_abspath function if we overrode it
         if hasattr(self, '_original_library_abspath'):
             try:
-                au = _get_asset_usage_module()
-                au.library_abspath.cache_clear()
                 au.library_abspath = self._original_library_abspath
-                print(f"[SheepIt Pack] DEBUG: Restored original library_abspath in cleanup")
+                log.debug("Restored original library_abspath in cleanup")
             except Exception as e:
-                print(f"[SheepIt Pack] DEBUG: WARNING: Could not restore library_abspath: {e}")
+                log.warning("WARNING: Could not restore library_abspath: %s", e)
         
         # Remove timer
         if hasattr(self, '_timer') and self._timer:
@@ -2350,9 +3013,8 @@ class SHEEPIT_OT_pack_zip(Operator):
             submit_settings.submit_status_message = ""
         
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'PROPERTIES':
-                area.tag_redraw()
+        redraw = getattr(self, '_redraw', None) or _RedrawThrottle(context)
+        redraw.maybe_redraw(force=True)
     
     def execute(self, context):
         """Legacy execute method - redirects to invoke for modal operation."""
@@ -2409,6 +3071,9 @@ class SHEEPIT_OT_pack_blend(Operator):
         self._temp_dir = None
         self._target_path = None
         self._blend_path = None
+        self._blend_size = None  # Packed blend size in bytes, None when it must be stat()ed
+        self._worker = None  # Single worker thread for phases that must not block the UI
+        self._frame_range_future = None  # APPLYING_FRAME_RANGE_TO_TARGET Blender run on the worker
         self._frame_start = None
         self._frame_end = None
         self._frame_step = None
@@ -2416,14 +3081,21 @@ class SHEEPIT_OT_pack_blend(Operator):
         self._message = ""
         self._error = None
         self._packer = None  # IncrementalPacker instance
+        self._pending_progress = None  # Latest (progress, message) from the packer, not yet shown
+        self._complete_shown = False  # COMPLETE has displayed 100% for a tick
+        # Phase -> bound handler, resolved once rather than on every timer tick
+        self._phase_handlers = {phase: getattr(self, name) for phase, name in self._PHASE_HANDLERS.items()}
+        self._batch_size = 20  # Assets per packer batch, adapted during COPY_ASSETS
+        # Cancel flag for the packer/ZIP loops: an Event read instead of the is_submitting
+        # RNA property on every check; set by _cleanup or when is_submitting is cleared
+        self._cancel_event = threading.Event()
         
         # Create timer for modal updates
         self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
         
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'PROPERTIES':
-                area.tag_redraw()
+        self._redraw = _RedrawThrottle(context)
+        self._redraw.maybe_redraw(0.0, force=True)
         
         # Start modal operation
         context.window_manager.modal_handler_add(self)
@@ -2433,6 +3105,19 @@ class SHEEPIT_OT_pack_blend(Operator):
         """Legacy execute method - redirects to invoke for modal operation."""
         return self.invoke(context, None)
     
+    # Timer-tick handler method per phase (PACKING covers every PACKING_* sub-phase)
+    _PHASE_HANDLERS = {
+        'INIT': '_h_init',
+        'SAVING_BLEND': '_h_saving_blend',
+        'OVERRIDING_FILEPATH': '_h_overriding_filepath',
+        'PACKING': '_h_packing',
+        'APPLYING_FRAME_RANGE_TO_TARGET': '_h_applying_frame_range_to_target',
+        'RESTORING_LIBRARY_ABSPATH': '_h_restoring_library_abspath',
+        'SAVING_FILE': '_h_saving_file',
+        'CLEANUP': '_h_cleanup',
+        'COMPLETE': '_h_complete',
+    }
+    
     def modal(self, context, event):
         """Handle modal events and update progress."""
         submit_settings = context.scene.sheepit_submit
@@ -2445,275 +3130,16 @@ class SHEEPIT_OT_pack_blend(Operator):
         
         # Handle timer events
         if event.type == 'TIMER':
+            if not submit_settings.is_submitting:
+                self._cancel_event.set()
             try:
-                if self._phase == 'INIT':
-                    submit_settings.submit_progress = 0.0
-                    submit_settings.submit_status_message = "Initializing..."
-                    self._phase = 'SAVING_BLEND'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'SAVING_BLEND':
-                    submit_settings.submit_progress = 5.0
-                    submit_settings.submit_status_message = "Saving current blend state..."
-                    
-                    from .submit_ops import save_current_blend_with_frame_range, apply_frame_range_to_blend
-                    
-                    try:
-                        self._temp_blend_path, self._frame_start, self._frame_end, self._frame_step = save_current_blend_with_frame_range(submit_settings)
-                        self._temp_dir = self._temp_blend_path.parent
-                        print(f"[SheepIt Pack] Saved to temp file: {self._temp_blend_path}")
-                    except Exception as e:
-                        self._error = f"Failed to save current blend state: {str(e)}"
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                    
-                    self._phase = 'APPLYING_FRAME_RANGE'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'APPLYING_FRAME_RANGE':
-                    submit_settings.submit_progress = 10.0
-                    submit_settings.submit_status_message = "Frame range applied."
-                    # Frame range is already applied in save_current_blend_with_frame_range
-                    self._phase = 'OVERRIDING_FILEPATH'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'OVERRIDING_FILEPATH':
-                    submit_settings.submit_progress = 12.0
-                    submit_settings.submit_status_message = "Preparing for packing..."
-                    
-                    # Temporarily override library_abspath to use temp file instead of opening it
-                    # This avoids invalidating the operator instance
-                    au = _get_asset_usage_module()
-                    import functools
-                    
-                    # Store original function
-                    self._original_library_abspath = au.library_abspath
-                    
-                    # Create override function
-                    temp_file_path = self._temp_blend_path.resolve()
-                    def override_library_abspath(lib):
-                        if lib is None:
-                            return temp_file_path
-                        else:
-                            return self._original_library_abspath(lib)
-                    
-                    # Replace the function (clear cache first)
-                    au.library_abspath.cache_clear()
-                    au.library_abspath = override_library_abspath
-                    # Re-apply lru_cache decorator behavior by wrapping
-                    au.library_abspath = functools.lru_cache(maxsize=None)(override_library_abspath)
-                    
-                    print(f"[SheepIt Pack] DEBUG: Overrode library_abspath to use temp file: {temp_file_path}")
-                    
-                    # Initialize IncrementalPacker
-                    def progress_callback(progress_pct, message):
-                        """Update progress during packing."""
-                        # Map packer progress (0-100%) to operator progress (15-70%)
-                        submit_settings.submit_progress = 15.0 + (progress_pct * 0.55)
-                        submit_settings.submit_status_message = message
-                        print(f"[SheepIt Pack] DEBUG: Progress update: {submit_settings.submit_progress:.1f}% - {message}")
-                        # Force UI redraw on every update
-                        for area in context.screen.areas:
-                            if area.type == 'PROPERTIES':
-                                area.tag_redraw()
-                    
-                    def cancel_check():
-                        """Check if user wants to cancel."""
-                        return not submit_settings.is_submitting
-                    
-                    max_size_bytes = _get_project_size_limit_bytes(context)
-                    self._packer = IncrementalPacker(
-                        WorkflowMode.PACK_AND_SAVE,
-                        target_path=None,
-                        enable_nla=False,
-                        progress_callback=progress_callback,
-                        cancel_check=cancel_check,
-                        frame_start=self._frame_start,
-                        frame_end=self._frame_end,
-                        frame_step=self._frame_step,
-                        temp_blend_path=self._temp_blend_path,
-                        original_blend_path=Path(self._original_filepath) if self._original_filepath else None,
-                        max_size_bytes=max_size_bytes,
-                    )
-                    
-                    self._phase = 'PACKING_INIT'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'PACKING_INIT' or self._phase.startswith('PACKING_'):
-                    # Handle all packing sub-phases using IncrementalPacker
-                    try:
-                        # Process one batch
-                        next_phase, is_complete = self._packer.process_batch(batch_size=20)
-                        
-                        if is_complete:
-                            # Packing is complete
-                            self._target_path = self._packer.target_path
-                            self._blend_path = self._packer.file_path
-                            print(f"[SheepIt Pack] DEBUG: Incremental packing completed")
-                            print(f"[SheepIt Pack] Packed to: {self._target_path}")
-                            context.scene.sheepit_submit.pack_output_path = str(self._target_path)
-                            
-                            # Check for oversized files that couldn't be packed
-                            if self._packer.oversized_files_all:
-                                oversized_list = "\n".join(f"  - {f.name if f.name else f} ({f.stat().st_size / (1024**3):.2f} GB)" 
-                                                          for f in self._packer.oversized_files_all[:10])
-                                if len(self._packer.oversized_files_all) > 10:
-                                    oversized_list += f"\n  ... and {len(self._packer.oversized_files_all) - 10} more"
-                                warning_msg = (
-                                    f"Warning: {len(self._packer.oversized_files_all)} linked file(s) over size limit could not be packed:\n"
-                                    f"{oversized_list}\n\n"
-                                    "Blender cannot pack linked files over the project size limit. These files will remain as external references.\n"
-                                    "To fix: Reduce the size of these files or split them into smaller files."
-                                )
-                                print(f"[SheepIt Pack] {warning_msg}")
-                                # Report as warning (non-blocking)
-                                self.report({'WARNING'}, f"{len(self._packer.oversized_files_all)} linked file(s) over size limit could not be packed")
-                            
-                            if not self._blend_path or not self._blend_path.exists():
-                                self._error = "Could not find target blend file for submission."
-                                self._cleanup(context, cancelled=True)
-                                self.report({'ERROR'}, self._error)
-                                return {'CANCELLED'}
-                            
-                            self._phase = 'APPLYING_FRAME_RANGE_TO_TARGET'
-                            print(f"[SheepIt Pack] DEBUG: Transitioning to APPLYING_FRAME_RANGE_TO_TARGET phase")
-                        else:
-                            # Continue with next phase from packer (prepend PACKING_ prefix)
-                            self._phase = f'PACKING_{next_phase}'
-                            print(f"[SheepIt Pack] DEBUG: Packing phase: {self._phase}, continuing...")
-                        
-                        return {'RUNNING_MODAL'}
-                    except InterruptedError as e:
-                        print(f"[SheepIt Pack] DEBUG: Packing cancelled by user")
-                        self._cleanup(context, cancelled=True)
-                        self.report({'INFO'}, "Packing cancelled.")
-                        return {'CANCELLED'}
-                    except Exception as e:
-                        print(f"[SheepIt Pack] DEBUG: ERROR in PACKING: {type(e).__name__}: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        self._error = f"Packing failed: {str(e)}"
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                
-                elif self._phase == 'APPLYING_FRAME_RANGE_TO_TARGET':
-                    submit_settings.submit_progress = 70.0
-                    submit_settings.submit_status_message = "Applying frame range to target blend..."
-                    
-                    from .submit_ops import apply_frame_range_to_blend
-                    
-                    # Apply frame range to the target blend file before submission
-                    print(f"[SheepIt Pack] Applying frame range to target blend file: {self._blend_path.name}")
-                    apply_frame_range_to_blend(self._blend_path, self._frame_start, self._frame_end, self._frame_step)
-                    
-                    self._phase = 'RESTORING_LIBRARY_ABSPATH'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'RESTORING_LIBRARY_ABSPATH':
-                    submit_settings.submit_progress = 72.0
-                    submit_settings.submit_status_message = "Restoring file paths..."
-                    
-                    # Restore original library_abspath function
-                    if hasattr(self, '_original_library_abspath'):
-                        au = _get_asset_usage_module()
-                        au.library_abspath.cache_clear()
-                        au.library_abspath = self._original_library_abspath
-                        print(f"[SheepIt Pack] DEBUG: Restored original library_abspath function")
-                    
-                    self._phase = 'VALIDATING_FILE_SIZE'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'VALIDATING_FILE_SIZE':
-                    submit_settings.submit_progress = 72.5
-                    submit_settings.submit_status_message = "Validating file size..."
-                    
-                    # Check blend file size
-                    if self._blend_path and self._blend_path.exists():
-                        blend_size = self._blend_path.stat().st_size
-                        blend_size_gb = blend_size / (1024 * 1024 * 1024)
-                        max_bytes = _get_project_size_limit_bytes(context)
-                        if max_bytes is not None and blend_size > max_bytes:
-                            limit_gb = max_bytes / (1024 * 1024 * 1024)
-                            print(f"[SheepIt Pack] Blend file size: {blend_size_gb:.2f} GB")
-                            error_msg = (
-                                f"Blend file size ({blend_size_gb:.2f} GB) exceeds project limit ({limit_gb:.1f} GB).\n\n"
-                                "To reduce file size, consider:\n"
-                                "- Optimizing the scene (reduce geometry, simplify materials)\n"
-                                "- Optimizing asset files (compress textures, reduce resolution)\n"
-                                "- Splitting the frame range (render in smaller chunks)"
-                            )
-                            print(f"[SheepIt Pack] ERROR: {error_msg}")
-                            self._error = error_msg
-                            self._cleanup(context, cancelled=True)
-                            self.report({'ERROR'}, self._error)
-                            return {'CANCELLED'}
-                    
-                    self._phase = 'SAVING_FILE'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'SAVING_FILE':
-                    submit_settings.submit_progress = 75.0
-                    submit_settings.submit_status_message = "Saving blend file to output location..."
-                    
-                    try:
-                        # Ensure output directory exists
-                        self._output_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        # Copy blend file to output location
-                        import shutil
-                        shutil.copy2(self._blend_path, self._output_path)
-                        
-                        print(f"[SheepIt Pack] Saved blend file to: {self._output_path}")
-                        self._success = True
-                        self._message = f"Blend file saved to: {self._output_path}"
-                        
-                        submit_settings.submit_progress = 90.0
-                        submit_settings.submit_status_message = "File saved successfully!"
-                        self._phase = 'CLEANUP'
-                    except Exception as e:
-                        self._error = f"Failed to save file: {str(e)}"
-                        self._cleanup(context, cancelled=True)
-                        self.report({'ERROR'}, self._error)
-                        return {'CANCELLED'}
-                    
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'CLEANUP':
-                    submit_settings.submit_progress = 98.0
-                    submit_settings.submit_status_message = "Cleaning up..."
-                    
-                    # Clean up temp file on success
-                    if self._temp_blend_path and self._temp_blend_path.exists():
-                        try:
-                            self._temp_blend_path.unlink()
-                            if self._temp_dir and self._temp_dir.exists():
-                                try:
-                                    self._temp_dir.rmdir()
-                                except Exception:
-                                    pass  # Directory may not be empty
-                            print(f"[SheepIt Pack] Cleaned up temp file: {self._temp_blend_path}")
-                        except Exception as e:
-                            print(f"[SheepIt Pack] WARNING: Could not clean up temp file: {e}")
-                    
-                    self._phase = 'COMPLETE'
-                    return {'RUNNING_MODAL'}
-                
-                elif self._phase == 'COMPLETE':
-                    submit_settings.submit_progress = 100.0
-                    submit_settings.submit_status_message = "Packing complete!"
-                    
-                    # Small delay to show completion
-                    import time
-                    time.sleep(0.2)
-                    
-                    self._cleanup(context, cancelled=False)
-                    self.report({'INFO'}, f"ZIP file saved to: {self._output_path}")
-                    return {'FINISHED'}
-                
+                # Direct lookup; 'PACKING_<packer phase>' all share one handler
+                handler = self._phase_handlers.get(self._phase)
+                if handler is None and self._phase.startswith('PACKING_'):
+                    handler = self._phase_handlers['PACKING']
+                if handler is not None:
+                    return handler(context, submit_settings)
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 self._error = f"Packing failed: {type(e).__name__}: {str(e)}"
                 self._cleanup(context, cancelled=True)
@@ -2722,19 +3148,288 @@ class SHEEPIT_OT_pack_blend(Operator):
         
         return {'RUNNING_MODAL'}
     
+    def _h_init(self, context, submit_settings):
+        """INIT phase."""
+        submit_settings.submit_progress = 0.0
+        submit_settings.submit_status_message = "Initializing..."
+        self._phase = 'SAVING_BLEND'
+        return {'RUNNING_MODAL'}
+    
+    def _h_saving_blend(self, context, submit_settings):
+        """SAVING_BLEND phase."""
+        submit_settings.submit_progress = 5.0
+        submit_settings.submit_status_message = "Saving current blend state..."
+        
+        try:
+            self._temp_blend_path, self._frame_start, self._frame_end, self._frame_step = save_current_blend_with_frame_range(submit_settings)
+            # Resolved once here; the override, the packer and cleanup all use this path
+            self._temp_blend_path = self._temp_blend_path.resolve()
+            self._temp_dir = self._temp_blend_path.parent
+            print(f"[SheepIt Pack] Saved to temp file: {self._temp_blend_path}")
+        except Exception as e:
+            self._error = f"Failed to save current blend state: {str(e)}"
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+        
+        # The frame range is already applied by save_current_blend_with_frame_range, and
+        # the override below is cheap: go on to it in this tick, saving two timer ticks
+        self._phase = 'OVERRIDING_FILEPATH'
+        return self._h_overriding_filepath(context, submit_settings)
+    
+    def _h_overriding_filepath(self, context, submit_settings):
+        """OVERRIDING_FILEPATH phase."""
+        submit_settings.submit_progress = 12.0
+        submit_settings.submit_status_message = "Preparing for packing..."
+        
+        # Temporarily override library_abspath to use temp file instead of opening it
+        # This avoids invalidating the operator instance
+        
+        # Store original function
+        self._original_library_abspath = au.library_abspath
+        
+        # Build the override first, then swap it in with one assignment
+        temp_file_path = self._temp_blend_path  # Resolved in SAVING_BLEND
+        override = _library_abspath_override(self._original_library_abspath, temp_file_path)
+        self._original_library_abspath.cache_clear()
+        au.library_abspath = override
+        
+        log.debug("Overrode library_abspath to use temp file: %s", temp_file_path)
+        
+        # Initialize IncrementalPacker
+        def progress_callback(progress_pct, message):
+            """Record packing progress; _h_packing publishes the latest one once per tick."""
+            # Map packer progress (0-100%) to operator progress (15-70%)
+            self._pending_progress = (15.0 + (progress_pct * 0.55), message)
+        
+        max_size_bytes = _get_project_size_limit_bytes(context)
+        self._packer = IncrementalPacker(
+            WorkflowMode.PACK_AND_SAVE,
+            target_path=None,
+            enable_nla=False,
+            progress_callback=progress_callback,
+            cancel_check=self._cancel_event.is_set,
+            frame_start=self._frame_start,
+            frame_end=self._frame_end,
+            frame_step=self._frame_step,
+            temp_blend_path=self._temp_blend_path,
+            original_blend_path=Path(self._original_filepath) if self._original_filepath else None,
+            max_size_bytes=max_size_bytes,
+        )
+        
+        self._phase = 'PACKING_INIT'
+        return {'RUNNING_MODAL'}
+    
+    def _h_packing(self, context, submit_settings):
+        """PACKING_* phase."""
+        # Handle all packing sub-phases using IncrementalPacker
+        try:
+            # Process one batch; COPY_ASSETS batches are resized toward _TICK_BUDGET per tick
+            # (larger on fast disks, smaller on slow shares so the UI stays responsive)
+            adapt = self._phase == 'PACKING_COPY_ASSETS'
+            started = time.monotonic()
+            next_phase, is_complete = self._packer.process_batch(batch_size=self._batch_size)
+            if adapt:
+                elapsed = max(time.monotonic() - started, 1e-3)
+                self._batch_size = max(_MIN_BATCH, min(_MAX_BATCH, int(self._batch_size * _TICK_BUDGET / elapsed)))
+            
+            # A batch can report progress many times: write only the last report to the
+            # (RNA) progress properties
+            if self._pending_progress is not None:
+                submit_settings.submit_progress, submit_settings.submit_status_message = self._pending_progress
+                self._pending_progress = None
+                log.debug("Progress update: %.1f%% - %s", submit_settings.submit_progress, submit_settings.submit_status_message)
+                self._redraw.maybe_redraw(submit_settings.submit_progress, force=is_complete)
+            
+            if is_complete:
+                # Packing is complete
+                self._target_path = self._packer.target_path
+                self._blend_path = self._packer.file_path
+                log.debug("Incremental packing completed")
+                print(f"[SheepIt Pack] Packed to: {self._target_path}")
+                context.scene.sheepit_submit.pack_output_path = str(self._target_path)
+                
+                # Check for oversized files that couldn't be packed
+                if self._packer.oversized_files_all:
+                    # The full file list is only built when a warning would be emitted
+                    if log.isEnabledFor(logging.WARNING):
+                        log.warning("%s", _oversized_warning(self._packer.oversized_files_all))
+                    # Report as warning (non-blocking)
+                    self.report({'WARNING'}, f"{len(self._packer.oversized_files_all)} linked file(s) over size limit could not be packed")
+                
+                self._blend_size = self._packer.file_size  # Known from the packer's final stat
+                if not self._blend_path or self._blend_size is None:
+                    self._error = "Could not find target blend file for submission."
+                    self._cleanup(context, cancelled=True)
+                    self.report({'ERROR'}, self._error)
+                    return {'CANCELLED'}
+                
+                self._phase = 'APPLYING_FRAME_RANGE_TO_TARGET'
+                log.debug("Transitioning to APPLYING_FRAME_RANGE_TO_TARGET phase")
+            else:
+                # Continue with next phase from packer (prepend PACKING_ prefix)
+                self._phase = f'PACKING_{next_phase}'
+                log.debug("Packing phase: %s, continuing...", self._phase)
+            
+            return {'RUNNING_MODAL'}
+        except InterruptedError as e:
+            log.debug("Packing cancelled by user")
+            self._cleanup(context, cancelled=True)
+            self.report({'INFO'}, "Packing cancelled.")
+            return {'CANCELLED'}
+        except Exception as e:
+            log.warning("ERROR in PACKING: %s: %s", type(e).__name__, str(e))
+            traceback.print_exc()
+            self._error = f"Packing failed: {str(e)}"
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+    
+    def _h_applying_frame_range_to_target(self, context, submit_settings):
+        """APPLYING_FRAME_RANGE_TO_TARGET phase."""
+        submit_settings.submit_progress = 70.0
+        submit_settings.submit_status_message = "Applying frame range to target blend..."
+        
+        # Apply frame range to the target blend file before submission (unless the packer
+        # already did while remapping it), on the worker so the UI keeps updating
+        if self._frame_range_future is None:
+            if not (self._packer and self._packer.frame_range_applied
+                    and self._blend_path == self._packer.top_level_target_blend):
+                print(f"[SheepIt Pack] Applying frame range to target blend file: {self._blend_path.name}")
+                self._frame_range_future = self._submit_to_worker(
+                    apply_frame_range_to_blend, self._blend_path, self._frame_start, self._frame_end, self._frame_step)
+                return {'RUNNING_MODAL'}
+        elif not self._frame_range_future.done():
+            return {'RUNNING_MODAL'}
+        else:
+            self._frame_range_future.result()
+            self._blend_size = None  # Rewritten: the packer's size no longer applies
+        
+        self._phase = 'RESTORING_LIBRARY_ABSPATH'
+        return {'RUNNING_MODAL'}
+    
+    def _h_restoring_library_abspath(self, context, submit_settings):
+        """RESTORING_LIBRARY_ABSPATH phase."""
+        submit_settings.submit_progress = 72.0
+        submit_settings.submit_status_message = "Restoring file paths..."
+        
+        # Restore original library_abspath function
+        if hasattr(self, '_original_library_abspath'):
+            au.library_abspath = self._original_library_abspath
+            del self._original_library_abspath  # Restored: nothing left for _cleanup to undo
+            log.debug("Restored original library_abspath function")
+        
+        # Check blend file size here rather than in a phase of its own: the packer
+        # already reported it unless the frame range pass rewrote the file
+        blend_size = self._blend_size
+        if blend_size is None and self._blend_path:
+            try:
+                blend_size = self._blend_path.stat().st_size
+            except FileNotFoundError:
+                pass
+        if blend_size is not None:
+            blend_size_gb = blend_size / (1024 * 1024 * 1024)
+            max_bytes = _get_project_size_limit_bytes(context)
+            if max_bytes is not None and blend_size > max_bytes:
+                limit_gb = max_bytes / (1024 * 1024 * 1024)
+                print(f"[SheepIt Pack] Blend file size: {blend_size_gb:.2f} GB")
+                error_msg = (
+                    f"Blend file size ({blend_size_gb:.2f} GB) exceeds project limit ({limit_gb:.1f} GB).\n\n"
+                    "To reduce file size, consider:\n"
+                    "- Optimizing the scene (reduce geometry, simplify materials)\n"
+                    "- Optimizing asset files (compress textures, reduce resolution)\n"
+                    "- Splitting the frame range (render in smaller chunks)"
+                )
+                print(f"[SheepIt Pack] ERROR: {error_msg}")
+                self._error = error_msg
+                self._cleanup(context, cancelled=True)
+                self.report({'ERROR'}, self._error)
+                return {'CANCELLED'}
+        
+        self._phase = 'SAVING_FILE'
+        return {'RUNNING_MODAL'}
+    
+    def _h_saving_file(self, context, submit_settings):
+        """SAVING_FILE phase."""
+        submit_settings.submit_progress = 75.0
+        submit_settings.submit_status_message = "Saving blend file to output location..."
+        
+        try:
+            # Ensure output directory exists
+            self._output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Move the packed blend to the output location (the pack directory is temporary)
+            _move_or_copy(self._blend_path, self._output_path)
+            
+            print(f"[SheepIt Pack] Saved blend file to: {self._output_path}")
+            self._success = True
+            self._message = f"Blend file saved to: {self._output_path}"
+            
+            submit_settings.submit_progress = 90.0
+            submit_settings.submit_status_message = "File saved successfully!"
+            self._phase = 'CLEANUP'
+        except Exception as e:
+            self._error = f"Failed to save file: {str(e)}"
+            self._cleanup(context, cancelled=True)
+            self.report({'ERROR'}, self._error)
+            return {'CANCELLED'}
+        
+        return {'RUNNING_MODAL'}
+    
+    def _h_cleanup(self, context, submit_settings):
+        """CLEANUP phase."""
+        submit_settings.submit_progress = 98.0
+        submit_settings.submit_status_message = "Cleaning up..."
+        
+        # Clean up temp file on success, in the background: deleting a multi-GB blend
+        # can take a while and nothing waits on it
+        if self._temp_blend_path:
+            threading.Thread(target=_remove_temp_blend, args=(self._temp_blend_path, self._temp_dir),
+                             daemon=True).start()
+        
+        self._phase = 'COMPLETE'
+        return {'RUNNING_MODAL'}
+    
+    def _h_complete(self, context, submit_settings):
+        """COMPLETE phase."""
+        if not self._complete_shown:
+            # Show completion for one timer tick (without blocking the UI) before finishing
+            self._complete_shown = True
+            submit_settings.submit_progress = 100.0
+            submit_settings.submit_status_message = "Packing complete!"
+            self._redraw.maybe_redraw(force=True)
+            return {'RUNNING_MODAL'}
+        
+        self._cleanup(context, cancelled=False)
+        self.report({'INFO'}, f"ZIP file saved to: {self._output_path}")
+        return {'FINISHED'}
+
+    def _submit_to_worker(self, fn, *args):
+        """Run fn(*args) on the operator's worker thread; the caller polls the returned future."""
+        if self._worker is None:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheepit_pack_worker")
+        return self._worker.submit(fn, *args)
+    
     def _cleanup(self, context, cancelled=False):
         """Clean up progress properties and timer."""
         submit_settings = context.scene.sheepit_submit
+        if cancelled and getattr(self, '_cancel_event', None):
+            self._cancel_event.set()
+        
+        # Stop any Blender session the packer still holds (cancel/error mid-pack)
+        if getattr(self, '_packer', None):
+            self._packer.close()
+        if getattr(self, '_worker', None):
+            self._worker.shutdown(wait=False, cancel_futures=True)
+            self._worker = None
         
         # Restore original library_abspath function if we overrode it
         if hasattr(self, '_original_library_abspath'):
             try:
-                au = _get_asset_usage_module()
-                au.library_abspath.cache_clear()
                 au.library_abspath = self._original_library_abspath
-                print(f"[SheepIt Pack] DEBUG: Restored original library_abspath in cleanup")
+                log.debug("Restored original library_abspath in cleanup")
             except Exception as e:
-                print(f"[SheepIt Pack] DEBUG: WARNING: Could not restore library_abspath: {e}")
+                log.warning("WARNING: Could not restore library_abspath: %s", e)
         
         # Remove timer
         if hasattr(self, '_timer') and self._timer:
@@ -2749,9 +3444,8 @@ class SHEEPIT_OT_pack_blend(Operator):
             submit_settings.submit_status_message = ""
         
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'PROPERTIES':
-                area.tag_redraw()
+        redraw = getattr(self, '_redraw', None) or _RedrawThrottle(context)
+        redraw.maybe_redraw(force=True)
     
     def execute(self, context):
         """Legacy execute method - redirects to invoke for modal operation."""
@@ -2811,11 +3505,6 @@ class SHEEPIT_OT_pack_zip_sync(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        from .submit_ops import (
-            save_current_blend_with_frame_range,
-            apply_frame_range_to_blend,
-            create_zip_from_directory,
-        )
         try:
             from ..utils.compat import get_addon_prefs
         except Exception:
@@ -2835,18 +3524,15 @@ class SHEEPIT_OT_pack_zip_sync(Operator):
         blend_name = Path(original_filepath).stem if original_filepath else "untitled"
         try:
             temp_blend_path, frame_start, frame_end, frame_step = save_current_blend_with_frame_range(submit_settings)
+            temp_blend_path = temp_blend_path.resolve()
         except Exception as e:
             submit_settings.is_submitting = False
             self.report({'ERROR'}, str(e))
             return {'CANCELLED'}
-        au = _get_asset_usage_module()
-        import functools
         _orig_lib_abspath = au.library_abspath
-        temp_file_path = temp_blend_path.resolve()
-        def _override(lib):
-            return temp_file_path if lib is None else _orig_lib_abspath(lib)
-        au.library_abspath.cache_clear()
-        au.library_abspath = functools.lru_cache(maxsize=None)(_override)
+        override = _library_abspath_override(_orig_lib_abspath, temp_blend_path)
+        _orig_lib_abspath.cache_clear()
+        au.library_abspath = override
         def _progress(pct, msg):
             submit_settings.submit_progress = 15.0 + (pct * 0.46)
             submit_settings.submit_status_message = msg
@@ -2865,35 +3551,42 @@ class SHEEPIT_OT_pack_zip_sync(Operator):
             max_size_bytes=max_size_bytes,
         )
         try:
+            # No UI runs between batches here, so there is no tick budget to adapt to: use the
+            # largest batch to keep the per-call overhead down
             while True:
-                next_phase, is_complete = packer.process_batch(batch_size=20)
+                next_phase, is_complete = packer.process_batch(batch_size=_MAX_BATCH)
                 if is_complete:
                     break
             target_path = packer.target_path
         except Exception as e:
-            au.library_abspath.cache_clear()
+            packer.close()
             au.library_abspath = _orig_lib_abspath
             submit_settings.is_submitting = False
             self.report({'ERROR'}, str(e))
             return {'CANCELLED'}
         # Apply frame range only to the target blend, not dependent blends
         target_blend = packer.top_level_target_blend if packer else None
-        if target_blend and target_blend.exists():
+        if target_blend and target_blend.exists() and not packer.frame_range_applied:
             apply_frame_range_to_blend(target_blend, frame_start, frame_end, frame_step)
-        au.library_abspath.cache_clear()
         au.library_abspath = _orig_lib_abspath
-        zip_path = target_path.parent / f"{target_path.name}.zip"
-        exclude_video = getattr(submit_settings, 'exclude_video_from_zip', False)
-        create_zip_from_directory(target_path, zip_path, cancel_check=lambda: False, exclude_video=exclude_video)
-        desired_zip_name = f"{blend_name}.zip"
-        desired_zip_path = output_dir / desired_zip_name
         pack_indicator = target_path.name
         if pack_indicator.startswith("sheepit_pack_"):
             pack_indicator = pack_indicator[len("sheepit_pack_"):]
-        new_zip_name = f"{blend_name}_{pack_indicator}.zip" if desired_zip_path.exists() else desired_zip_name
-        final_zip_path = output_dir / new_zip_name
         output_dir.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(zip_path), str(final_zip_path))
+        # Write into the output directory, then rename: no second copy of the archive
+        zip_path = output_dir / f"{blend_name}_{pack_indicator}.zip.partial"
+        exclude_video = getattr(submit_settings, 'exclude_video_from_zip', False)
+        try:
+            create_zip_from_directory(target_path, zip_path, cancel_check=lambda: False, exclude_video=exclude_video)
+        except Exception:
+            zip_path.unlink(missing_ok=True)
+            raise
+        final_zip_path = output_dir / f"{blend_name}.zip"
+        try:
+            _rename_no_clobber(zip_path, final_zip_path)
+        except FileExistsError:
+            final_zip_path = zip_path.with_suffix('')
+            os.replace(zip_path, final_zip_path)
         if temp_blend_path.exists():
             try:
                 temp_blend_path.unlink()
@@ -15,6 +15,19 @@ from bpy.types import Operator
 from .. import config
 
 
+_APPLY_FRAME_RANGE_SCRIPT = Path(__file__).parent / "_blender_scripts" / "apply_frame_range.py"
+
+
+def _tag_properties_redraw(context) -> None:
+    """Redraw the Properties editors, if there is a screen (there is none in background mode)."""
+    screen = getattr(context, "screen", None)
+    if screen is None:
+        return
+    for area in screen.areas:
+        if area.type == 'PROPERTIES':
+            area.tag_redraw()
+
+
 def apply_frame_range_to_blend(blend_path: Path, frame_start: int, frame_end: int, frame_step: int) -> None:
     """
     Apply frame range settings to a blend file using subprocess.
@@ -25,19 +38,10 @@ def apply_frame_range_to_blend(blend_path: Path, frame_start: int, frame_end: in
         frame_end: End frame value
         frame_step: Frame step value
     """
-    script = f"""
-import bpy
-for scene in bpy.data.scenes:
-    scene.frame_start = {frame_start}
-    scene.frame_end = {frame_end}
-    scene.frame_step = {frame_step}
-bpy.ops.wm.save_mainfile(compress=True)
-print(f'Applied frame range {frame_start}-{frame_end} (step {frame_step}) to all scenes')
-"""
-    
     result = subprocess.run([
-        "blender", "--factory-startup", "-b", str(blend_path), "--python-expr", script
-    ], capture_output=True, text=True, check=False)
+        "blender", "--factory-startup", "-b", str(blend_path), "--python", str(_APPLY_FRAME_RANGE_SCRIPT),
+        "--", str(frame_start), str(frame_end), str(frame_step),
+    ], capture_output=True, text=True, encoding="utf-8", errors="replace", check=False)
     
     if result.returncode != 0:
         print(f"[SheepIt Submit] WARNING: Failed to apply frame range to {blend_path.name}")
@@ -146,14 +150,13 @@ class SHEEPIT_OT_submit_current(Operator):
         self._success = False
         self._message = ""
         self._error = None
+        self._complete_shown = False  # COMPLETE has displayed 100% for a tick
         
         # Create timer for modal updates
         self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
         
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'PROPERTIES':
-                area.tag_redraw()
+        _tag_properties_redraw(context)
         
         # Start modal operation
         context.window_manager.modal_handler_add(self)
@@ -244,9 +247,11 @@ class SHEEPIT_OT_submit_current(Operator):
                         # Ensure output directory exists
                         self._output_path.parent.mkdir(parents=True, exist_ok=True)
                         
-                        # Copy temp file to output location
-                        import shutil
-                        shutil.copy2(self._temp_blend_path, self._output_path)
+                        # Move temp file to output location (renamed when on the same
+                        # filesystem, else copied with the kernel fast path)
+                        from .pack_ops import _move_or_copy
+                        if _move_or_copy(self._temp_blend_path, self._output_path):
+                            self._temp_blend_path = None  # Nothing left for CLEANUP to delete
                         
                         print(f"[SheepIt Pack] Saved blend file to: {self._output_path}")
                         self._success = True
@@ -279,17 +284,23 @@ class SHEEPIT_OT_submit_current(Operator):
                             print(f"[SheepIt Submit] Cleaned up temp file: {self._temp_blend_path}")
                         except Exception as e:
                             print(f"[SheepIt Submit] WARNING: Could not clean up temp file: {e}")
+                    elif self._temp_dir:
+                        try:
+                            self._temp_dir.rmdir()  # Temp blend was moved to the output location
+                        except OSError:
+                            pass
                     
                     self._phase = 'COMPLETE'
                     return {'RUNNING_MODAL'}
                 
                 elif self._phase == 'COMPLETE':
-                    submit_settings.submit_progress = 100.0
-                    submit_settings.submit_status_message = "Packing complete!"
-                    
-                    # Small delay to show completion
-                    import time
-                    time.sleep(0.2)
+                    if not self._complete_shown:
+                        # Show completion for one timer tick (without blocking the UI) before finishing
+                        self._complete_shown = True
+                        submit_settings.submit_progress = 100.0
+                        submit_settings.submit_status_message = "Packing complete!"
+                        _tag_properties_redraw(context)
+                        return {'RUNNING_MODAL'}
                     
                     self._cleanup(context, cancelled=False)
                     self.report({'INFO'}, f"Blend file saved to: {self._output_path}")
@@ -322,9 +333,7 @@ class SHEEPIT_OT_submit_current(Operator):
             submit_settings.submit_status_message = ""
         
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'PROPERTIES':
-                area.tag_redraw()
+        _tag_properties_redraw(context)
     
     def execute(self, context):
         """Execute method - starts the modal operation."""
@@ -381,24 +390,32 @@ def create_zip_from_directory(directory: Path, output_zip: Path, progress_callba
     if progress_callback:
         progress_callback(0.0, "Counting files...")
     
-    # Collect all dirs (for empty-dir entries) and files
+    # Collect all dirs (for empty-dir entries) and files in one scandir pass: sizes come from
+    # the directory entries and arcnames are built as strings, no exists()/Path per file
     dir_arcs = set()
     file_list = []
     file_count = 0
     total_size = 0
-    for root, dirs, files in os.walk(directory):
-        root_path = Path(root)
-        for d in dirs:
-            dir_arcs.add(root_path.joinpath(d).relative_to(directory))
-        for file in files:
-            file_path = root_path / file
-            if not file_path.exists():
-                continue
-            if exclude_video and file_path.suffix.lower() in _MEDIA_EXTENSIONS:
-                continue
-            file_count += 1
-            total_size += file_path.stat().st_size
-            file_list.append((file_path, file_path.relative_to(directory)))
+    pending = [(os.fspath(directory), "")]
+    while pending:
+        dir_path, dir_arc = pending.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                arcname = dir_arc + entry.name
+                if entry.is_dir():
+                    dir_arcs.add(arcname)
+                    if not entry.is_symlink():  # Like os.walk: list linked dirs, don't descend
+                        pending.append((entry.path, arcname + "/"))
+                    continue
+                if exclude_video and os.path.splitext(entry.name)[1].lower() in _MEDIA_EXTENSIONS:
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue  # Dangling link or removed meanwhile
+                file_count += 1
+                total_size += size
+                file_list.append((entry.path, arcname))
     
     print(f"[SheepIt Submit]   Found {file_count} files, total size: {total_size / (1024*1024):.2f} MB")
     print(f"[SheepIt Submit]   Creating ZIP (this may take a while)...")
@@ -408,17 +425,19 @@ def create_zip_from_directory(directory: Path, output_zip: Path, progress_callba
     
     start_time = time.time()
     files_added = 0
+    # cancel_check reads UI state; ask every 64 files, or sooner once 50 ms passed (large files)
+    last_cancel_check = start_time
     
     with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_STORED) as zipf:
         for dir_arc in sorted(dir_arcs):
-            arcname = str(dir_arc).replace("\\", "/") + "/"
-            zipf.writestr(arcname, "")
-        for file_path, arcname in file_list:
-            if cancel_check and cancel_check():
-                raise InterruptedError("ZIP creation cancelled by user")
-            
-            if not file_path.exists():
-                continue
+            zipf.writestr(dir_arc + "/", "")
+        for i, (file_path, arcname) in enumerate(file_list):
+            if cancel_check:
+                now = time.time()
+                if i % 64 == 0 or now - last_cancel_check >= 0.05:
+                    last_cancel_check = now
+                    if cancel_check():
+                        raise InterruptedError("ZIP creation cancelled by user")
             
             try:
                 zipf.write(file_path, arcname)
@@ -436,6 +455,8 @@ def create_zip_from_directory(directory: Path, output_zip: Path, progress_callba
                     print(f"[SheepIt Submit]   Progress: {files_added}/{file_count} files ({files_added*100//file_count}%), {rate:.1f} files/sec")
                     if progress_callback:
                         progress_callback(progress_pct, f"Creating ZIP... ({files_added}/{file_count} files, {rate:.1f} files/sec)")
+            except FileNotFoundError:
+                continue  # Removed since it was listed
             except Exception as e:
                 print(f"[SheepIt Submit]   WARNING: Failed to add {arcname}: {type(e).__name__}: {str(e)}")
     